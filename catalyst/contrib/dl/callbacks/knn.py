@@ -2,11 +2,6 @@ from math import ceil
 from typing import Dict, List
 
 import numpy as np
-from scipy import stats
-from sklearn.metrics import (
-    accuracy_score, f1_score, precision_score, recall_score
-)
-from sklearn.neighbors import NearestNeighbors
 
 import torch
 
@@ -50,6 +45,10 @@ class KNNMetricCallback(Callback):
 
         assert num_classes > 1, "`num_classes` should be more than 1"
 
+        from sklearn.metrics import (
+            accuracy_score, f1_score, precision_score, recall_score
+        )
+
         metric_fns = {
             "accuracy": accuracy_score,
             "recall": recall_score,
@@ -115,6 +114,9 @@ class KNNMetricCallback(Callback):
 
         size = len(y_train)
 
+        from scipy import stats
+        from sklearn.neighbors import NearestNeighbors
+
         result = None
         while result is None:
             try:
@@ -9,7 +9,7 @@ from .contrastive import (
     ContrastivePairwiseEmbeddingLoss
 )
 from .dice import BCEDiceLoss, DiceLoss
-from .focal import FocalLossBinary, FocalLossMultiClass
+from .focal import FocalLossBinary, FocalLossMultiClass, FocalLossMultiLabel
 from .gan import GradientPenaltyLoss, MeanOutputLoss
 from .huber import HuberLoss
 from .iou import BCEIoULoss, IoULoss
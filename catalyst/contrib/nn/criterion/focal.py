@@ -1,5 +1,7 @@
 from functools import partial
 
+import torch
+
 from torch.nn.modules.loss import _Loss
 
 from catalyst.utils import metrics
@@ -20,6 +22,7 @@ class FocalLossBinary(_Loss):
         """
         super().__init__()
         self.ignore = ignore
+        self.reduction = reduction
 
         if reduced:
             self.loss_fn = partial(
@@ -56,10 +59,47 @@ class FocalLossBinary(_Loss):
         return loss
 
 
+def _flatten_classes(tensor: torch.Tensor) -> torch.Tensor:
+    """
+    Reshapes [bs; num_classes; ...] tensor to [bs * ...; num_classes]
+    """
+    num_classes = tensor.size(1)
+    dims = [0] + list(range(2, tensor.dim())) + [1]
+    return tensor.permute(*dims).reshape(-1, num_classes)
+
+
+def _sum_class_losses(
+    loss: torch.Tensor, reduction: str, mask: torch.Tensor = None
+) -> torch.Tensor:
+    """
+    Reduces [N; num_classes] loss like the binary loss for each class
+    and sums up the results over the classes
+
+    Args:
+        loss: [N; num_classes] not reduced loss
+        reduction: reduction of the binary loss
+        mask: [N; num_classes] mask of the not ignored entries
+    """
+    if mask is not None:
+        loss = loss.masked_fill(~mask, 0)
+
+    if reduction == "mean":
+        num_entries = loss.size(0) if mask is None else mask.sum(0)
+        loss = (loss.sum(0) / num_entries).sum()
+    elif reduction in ["sum", "batchwise_mean"]:
+        loss = loss.sum()
+    else:
+        loss = loss.sum(1)
+    return loss
+
+
 class FocalLossMultiClass(FocalLossBinary):
     """
     Compute focal loss for multi-class problem.
     Ignores targets having -1 label
+
+    The loss is the sum of the binary focal losses over the classes,
+    all the classes are computed at once
     """
     def forward(self, logits, targets):
         """
@@ -68,53 +108,48 @@ class FocalLossMultiClass(FocalLossBinary):
             targets: [bs; ...]
         """
         num_classes = logits.size(1)
-        loss = 0
         targets = targets.view(-1)
-        logits = logits.view(-1, num_classes)
+        logits = _flatten_classes(logits)
 
         # Filter anchors with -1 label from loss computation
         if self.ignore is not None:
             not_ignored = targets != self.ignore
+            logits = logits[not_ignored]
+            targets = targets[not_ignored]
 
-        for cls in range(num_classes):
-            cls_label_target = (targets == (cls + 0)).long()
-            cls_label_input = logits[..., cls]
+        classes = torch.arange(num_classes, device=targets.device)
+        targets = (targets.unsqueeze(1) == classes).long()
+        loss = self.loss_fn(logits, targets, reduction="none")
+        loss = _sum_class_losses(loss, self.reduction)
 
-            if self.ignore is not None:
-                cls_label_target = cls_label_target[not_ignored]
-                cls_label_input = cls_label_input[not_ignored]
+        return loss
+
+
+class FocalLossMultiLabel(FocalLossBinary):
+    """
+    Compute focal loss for multi-label problem.
+    Ignores targets having ``ignore`` label
+
+    The loss is the sum of the binary focal losses over the classes,
+    all the classes are computed at once
+    """
+    def forward(self, logits, targets):
+        """
+        Args:
+            logits: [bs; num_classes; ...]
+            targets: [bs; num_classes; ...]
+        """
+        logits = _flatten_classes(logits)
+        targets = _flatten_classes(targets)
+
+        mask = None
+        if self.ignore is not None:
+            mask = targets != self.ignore
 
-            loss += self.loss_fn(cls_label_input, cls_label_target)
+        loss = self.loss_fn(logits, targets, reduction="none")
+        loss = _sum_class_losses(loss, self.reduction, mask=mask)
 
         return loss
 
 
-# @TODO: check
-# class FocalLossMultiLabel(_Loss):
-#     """
-#     Compute focal loss for multi-label problem.
-#     Ignores targets having -1 label
-#     """
-#
-#     def forward(self, logits, targets):
-#         """
-#         Args:
-#             logits: [bs; num_classes]
-#             targets: [bs; num_classes]
-#         """
-#         num_classes = logits.size(1)
-#         loss = 0
-#
-#         for cls in range(num_classes):
-#             # Filter anchors with -1 label from loss computation
-#             if cls == self.ignore:
-#                 continue
-#
-#             cls_label_target = targets[..., cls].long()
-#             cls_label_input = logits[..., cls]
-#
-#             loss += self.loss_fn(cls_label_input, cls_label_target)
-#
-#         return loss
-
-__all__ = ["FocalLossBinary", "FocalLossMultiClass"]
+__all__ = ["FocalLossBinary", "FocalLossMultiClass", "FocalLossMultiLabel"]
@@ -95,22 +95,101 @@ def create_negative_mask(
     return mask
 
 
-def triplet_loss(
-    embeddings: torch.Tensor, labels: torch.Tensor, margin: float = 0.3
-) -> torch.Tensor:
+def _batch_all_masks(labels: torch.Tensor, exclude_negatives: bool = True):
+    """
+    Factorizes the ``batch_all`` mask,
+    ``mask[i, j, k] = positive_mask[i, j] & negative_mask[i, k]``,
+    as ``labels[i] == labels[j] != labels[k]`` already
+    makes ``i``, ``j`` and ``k`` distinct if ``i != j``
+    """
+    batch_size = labels.size(0)
+    indices_equal = \
+        torch.eye(batch_size, device=labels.device).type(torch.bool)
+    label_equal = torch.eq(labels.unsqueeze(0), labels.unsqueeze(1))
 
-    cosine_dists = cosine_distance(embeddings)
-    mask = batch_all(labels)
+    positive_mask = label_equal & ~indices_equal
+    negative_mask = ~label_equal
+
+    if exclude_negatives:
+        # the same conditions as in ``create_negative_mask``
+        neg_label = -1
+        pos_labels = ~torch.ge(labels, neg_label)
+        k_equal = torch.eq(labels.unsqueeze(1) + neg_label, labels)
+        positive_mask = positive_mask \
+            & pos_labels.unsqueeze(1) & pos_labels.unsqueeze(0)
+        negative_mask = negative_mask & (k_equal | pos_labels.unsqueeze(0))
+
+    return positive_mask, negative_mask
 
-    anchor_positive_dist = cosine_dists.unsqueeze(2)
-    anchor_negative_dist = cosine_dists.unsqueeze(1)
-    triplet_loss_value = \
-        F.relu(anchor_positive_dist - anchor_negative_dist + margin)
-    triplet_loss_value = torch.mul(triplet_loss_value, mask)
 
-    num_positive_triplets = torch.gt(triplet_loss_value, _EPS).sum().float()
+def triplet_loss(
+    embeddings: torch.Tensor,
+    labels: torch.Tensor,
+    margin: float = 0.3,
+    exclude_negatives: bool = True,
+    max_block_numel: int = 2 ** 24,
+) -> torch.Tensor:
+    """
+    Batch all triplet loss, the mean over the triplets with a positive loss.
+
+    Triplets are processed in blocks of anchors,
+    so the temporary ``[block_size, batch_size, batch_size]`` tensors
+    have about ``max_block_numel`` elements
+    instead of the ``batch_size ** 3`` of all the triplets.
+    The gradient is computed in the same pass, so only the
+    ``[batch_size, batch_size]`` distances are kept for the backward pass.
+
+    Args:
+        embeddings (torch.Tensor): tensor of shape (batch_size, embed_dim)
+        labels (torch.Tensor): labels of the batch, of size (batch_size,)
+        margin (float): margin for triplet
+        exclude_negatives (bool): see ``batch_all``
+        max_block_numel (int): memory budget,
+            the number of the triplets processed at once
+
+    Returns:
+        torch.Tensor: scalar tensor containing the triplet loss
+    """
+    cosine_dists = cosine_distance(embeddings)
+    positive_mask, negative_mask = \
+        _batch_all_masks(labels, exclude_negatives=exclude_negatives)
+
+    with torch.no_grad():
+        dists = cosine_dists.detach()
+        loss_sum = dists.new_zeros(())
+        num_positive_triplets = dists.new_zeros(())
+        # d(loss_sum) / d(dists), as the number of the triplets
+        # with a positive loss the distance is a positive / negative in
+        dists_grad = torch.zeros_like(dists)
+
+        # invalid pairs make ``relu(ap - an + margin)`` zero, so no 3D mask
+        # is needed, anchors without positives have no triplets at all
+        anchors = torch.nonzero(positive_mask.any(1)).view(-1)
+        anchor_positive_dist = \
+            dists.masked_fill(~positive_mask, -float("inf")) + margin
+        anchor_negative_dist = \
+            dists.masked_fill(~negative_mask, float("inf"))
+
+        batch_size = labels.size(0)
+        block_size = max(1, max_block_numel // max(batch_size ** 2, 1))
+        for start in range(0, anchors.size(0), block_size):
+            block = anchors[start:start + block_size]
+            triplet_loss_value = F.relu(
+                anchor_positive_dist[block].unsqueeze(2)
+                - anchor_negative_dist[block].unsqueeze(1)
+            )
+
+            loss_sum += triplet_loss_value.sum()
+            num_positive_triplets += torch.gt(triplet_loss_value, _EPS).sum()
+
+            active = torch.gt(triplet_loss_value, 0)
+            dists_grad[block] += (active.sum(2) - active.sum(1)).to(dists)
+
+    # has ``loss_sum`` value and ``dists_grad`` gradient
+    surrogate = torch.sum(cosine_dists * dists_grad)
+    triplet_loss_value = loss_sum + (surrogate - surrogate.detach())
     triplet_loss_value = (
-        triplet_loss_value.sum() / (num_positive_triplets + _EPS)
+        triplet_loss_value / (num_positive_triplets + _EPS)
     )
 
     return triplet_loss_value
@@ -4,8 +4,6 @@ Lovasz-Softmax and Jaccard hinge loss in PyTorch
 Maxim Berman 2018 ESAT-PSI KU Leuven (MIT License)
 """
 
-from itertools import filterfalse as ifilterfalse
-
 import torch
 import torch.nn.functional as F
 from torch.nn.modules.loss import _Loss
@@ -13,85 +11,70 @@ from torch.nn.modules.loss import _Loss
 # --------------------------- HELPER FUNCTIONS ---------------------------
 
 
-def isnan(x):
-    return x != x
-
-
-def mean(values, ignore_nan=False, empty=0):
-    """
-    Nanmean compatible with generators.
-    """
-    values = iter(values)
-    if ignore_nan:
-        values = ifilterfalse(isnan, values)
-    try:
-        n = 1
-        acc = next(values)
-    except StopIteration:
-        if empty == "raise":
-            raise ValueError("Empty mean")
-        return empty
-    for n, v in enumerate(values, 2):
-        acc += v
-    if n == 1:
-        return acc
-    return acc / n
-
-
 def _lovasz_grad(gt_sorted):
     """
     Compute gradient of the Lovasz extension w.r.t sorted errors
     See Alg. 1 in paper
+
+    Args:
+        gt_sorted: [..., P] Tensor, ground truth sorted by errors,
+            the gradient is computed along the last dimension
     """
-    p = len(gt_sorted)
-    gts = gt_sorted.sum()
-    intersection = gts - gt_sorted.float().cumsum(0)
-    union = gts + (1 - gt_sorted).float().cumsum(0)
+    p = gt_sorted.size(-1)
+    gts = gt_sorted.sum(-1, keepdim=True)
+    intersection = gts - gt_sorted.cumsum(-1)
+    union = gts + (1 - gt_sorted).cumsum(-1)
     jaccard = 1. - intersection / union
     if p > 1:  # cover 1-pixel case
-        jaccard[1:p] = jaccard[1:p] - jaccard[0:-1]
+        jaccard[..., 1:p] = jaccard[..., 1:p] - jaccard[..., 0:-1]
     return jaccard
 
 
-# ---------------------------- BINARY LOSSES -----------------------------
+def _lovasz_sorted_dot(errors, gt, valid=None):
+    """
+    Sorts the errors and multiplies them by the Lovasz extension gradient,
+    all the rows are processed at once
 
+    Args:
+        errors: [..., P] Variable, errors at each prediction
+        gt: [..., P] Tensor, binary ground truth targets (0 or 1)
+        valid: [..., P] Tensor, mask of the not ignored predictions.
+            Ignored predictions are sorted last with ``-inf`` error,
+            so they change neither the loss nor the gradient
+
+    Returns:
+        [...] Variable, the loss for each row
+    """
+    gt = gt.to(errors.dtype)
+    if valid is not None:
+        errors = errors.masked_fill(~valid, -float("inf"))
+        gt = gt * valid
+    errors_sorted, perm = torch.sort(errors, dim=-1, descending=True)
+    gt_sorted = gt.gather(-1, perm)
+    grad = _lovasz_grad(gt_sorted)
+    return (F.relu(errors_sorted) * grad).sum(-1)
 
-def _flatten_binary_scores(logits, targets, ignore=None):
-    """
-    Flattens predictions in the batch (binary case)
-    Remove targets equal to "ignore"
-    """
-    logits = logits.reshape(-1)
-    targets = targets.reshape(-1)
-    if ignore is None:
-        return logits, targets
-    valid = (targets != ignore)
-    logits_ = logits[valid]
-    targets_ = targets[valid]
-    return logits_, targets_
+
+# ---------------------------- BINARY LOSSES -----------------------------
 
 
-def _lovasz_hinge_flat(logits, targets):
+def _lovasz_hinge_batch(logits, targets, ignore=None):
     """
-    Binary Lovasz hinge loss
+    Binary Lovasz hinge loss for each row
 
     Args:
-        logits: [P] Variable, logits at each prediction
-            (between -iinfinity and +iinfinity)
-        targets: [P] Tensor, binary ground truth targets (0 or 1)
+        logits: [G, P] Variable, logits at each prediction
+            (between -infinity and +infinity)
+        targets: [G, P] Tensor, binary ground truth targets (0 or 1)
         ignore: label to ignore
+
+    Returns:
+        [G] Variable, the loss for each row
     """
-    if len(targets) == 0:
-        # only void pixels, the gradients should be 0
-        return logits.sum() * 0.
-    signs = 2. * targets.float() - 1.
+    valid = None if ignore is None else (targets != ignore)
+    signs = 2. * targets.to(logits.dtype) - 1.
     errors = (1. - logits * signs)
-    errors_sorted, perm = torch.sort(errors, dim=0, descending=True)
-    perm = perm.data
-    gt_sorted = targets[perm]
-    grad = _lovasz_grad(gt_sorted)
-    loss = torch.dot(F.relu(errors_sorted), grad)
-    return loss
+    return _lovasz_sorted_dot(errors, targets, valid)
 
 
 def _lovasz_hinge(logits, targets, per_image=True, ignore=None):
@@ -105,85 +88,22 @@ def _lovasz_hinge(logits, targets, per_image=True, ignore=None):
         per_image: compute the loss per image instead of per batch
         ignore: void class id
     """
-    if per_image:
-        loss = mean(
-            _lovasz_hinge_flat(
-                *_flatten_binary_scores(
-                    logit.unsqueeze(0), target.unsqueeze(0), ignore
-                )
-            ) for logit, target in zip(logits, targets)
-        )
-    else:
-        loss = _lovasz_hinge_flat(
-            *_flatten_binary_scores(logits, targets, ignore)
-        )
+    rows = logits.size(0) if per_image else 1
+    loss = _lovasz_hinge_batch(
+        logits.reshape(rows, -1), targets.reshape(rows, -1), ignore
+    ).mean()
     return loss
 
 
 # --------------------------- MULTICLASS LOSSES ---------------------------
 
 
-def _flatten_probabilities(probabilities, targets, ignore=None):
-    """
-    Flattens predictions in the batch
-    """
-    if probabilities.dim() == 3:
-        # assumes output of a sigmoid layer
-        B, H, W = probabilities.size()
-        probabilities = probabilities.view(B, 1, H, W)
-    B, C, H, W = probabilities.size()
-    # B * H * W, C = P, C
-    probabilities = probabilities.permute(0, 2, 3, 1).contiguous().view(-1, C)
-    targets = targets.view(-1)
-    if ignore is None:
-        return probabilities, targets
-    valid = (targets != ignore)
-    probabilities_ = probabilities[valid.nonzero().squeeze()]
-    targets_ = targets[valid]
-    return probabilities_, targets_
-
-
-def _lovasz_softmax_flat(probabilities, targets, classes="present"):
-    """
-    Multi-class Lovasz-Softmax loss
-
-    Args:
-        probabilities: [P, C]
-            class probabilities at each prediction (between 0 and 1)
-        targets: [P] ground truth targets (between 0 and C - 1)
-        classes: "all" for all,
-            "present" for classes present in targets,
-             or a list of classes to average.
-    """
-    if probabilities.numel() == 0:
-        # only void pixels, the gradients should be 0
-        return probabilities * 0.
-    C = probabilities.size(1)
-    losses = []
-    class_to_sum = list(range(C)) if classes in ["all", "present"] else classes
-    for c in class_to_sum:
-        fg = (targets == c).float()  # foreground for class c
-        if classes == "present" and fg.sum() == 0:
-            continue
-        if C == 1:
-            if len(class_to_sum) > 1:
-                raise ValueError("Sigmoid output possible only with 1 class")
-            class_pred = probabilities[:, 0]
-        else:
-            class_pred = probabilities[:, c]
-        errors = (fg - class_pred).abs()
-        errors_sorted, perm = torch.sort(errors, 0, descending=True)
-        perm = perm.data
-        fg_sorted = fg[perm]
-        losses.append(torch.dot(errors_sorted, _lovasz_grad(fg_sorted)))
-    return mean(losses)
-
-
 def _lovasz_softmax(
     probabilities, targets, classes="present", per_image=False, ignore=None
 ):
     """
-    Multi-class Lovasz-Softmax loss
+    Multi-class Lovasz-Softmax loss,
+    all the images and classes are sorted at once
 
     Args:
         probabilities: [B, C, H, W]
@@ -197,21 +117,40 @@ def _lovasz_softmax(
         per_image: compute the loss per image instead of per batch
         ignore: void class targets
     """
-    if per_image:
-        loss = mean(
-            _lovasz_softmax_flat(
-                *_flatten_probabilities(
-                    prob.unsqueeze(0), lab.unsqueeze(0), ignore
-                ),
-                classes=classes
-            ) for prob, lab in zip(probabilities, targets)
-        )
+    if probabilities.dim() == 3:
+        # assumes output of a sigmoid layer
+        probabilities = probabilities.unsqueeze(1)
+    B, C = probabilities.shape[:2]
+    # [G, C, P], G is the number of images or 1
+    probabilities = probabilities.reshape(B, C, -1)
+    targets = targets.reshape(B, -1)
+    if not per_image:
+        probabilities = probabilities.transpose(0, 1).reshape(1, C, -1)
+        targets = targets.reshape(1, -1)
+
+    class_to_sum = list(range(C)) if classes in ["all", "present"] \
+        else list(classes)
+    if C == 1 and len(class_to_sum) > 1:
+        raise ValueError("Sigmoid output possible only with 1 class")
+    class_ids = torch.tensor(class_to_sum, device=targets.device)
+    pred_ids = torch.zeros_like(class_ids) if C == 1 else class_ids
+
+    # [G, K, P], K is the number of classes to sum
+    class_pred = probabilities[:, pred_ids]
+    fg = targets.unsqueeze(1) == class_ids.view(1, -1, 1)
+    valid = None
+    if ignore is not None:
+        valid = (targets != ignore).unsqueeze(1).expand_as(fg)
+        fg = fg & valid
+    errors = (fg.to(class_pred.dtype) - class_pred).abs()
+    losses = _lovasz_sorted_dot(errors, fg, valid)
+
+    if classes == "present":
+        present = fg.any(-1).to(losses.dtype)
+        losses = (losses * present).sum(-1) / present.sum(-1).clamp_min(1.)
     else:
-        loss = _lovasz_softmax_flat(
-            *_flatten_probabilities(probabilities, targets, ignore),
-            classes=classes
-        )
-    return loss
+        losses = losses.mean(-1)
+    return losses.mean()
 
 
 # ------------------------------ CRITERION -------------------------------
@@ -265,15 +204,17 @@ class LovaszLossMultiLabel(_Loss):
             logits: [bs; num_classes; ...]
             targets: [bs; num_classes; ...]
         """
-        losses = [
-            _lovasz_hinge(
-                logits[:, i, ...],
-                targets[:, i, ...],
-                per_image=self.per_image,
-                ignore=self.ignore
-            ) for i in range(logits.shape[1])
-        ]
-        loss = torch.mean(torch.stack(losses))
+        B, C = logits.shape[:2]
+        if self.per_image:
+            logits = logits.reshape(B * C, -1)
+            targets = targets.reshape(B * C, -1)
+        else:
+            logits = logits.transpose(0, 1).reshape(C, -1)
+            targets = targets.transpose(0, 1).reshape(C, -1)
+        # the mean over images and classes,
+        # all of them are sorted at once
+        loss = _lovasz_hinge_batch(logits, targets, ignore=self.ignore)
+        loss = loss.mean()
         return loss
 
 
@@ -1,5 +1,6 @@
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 
 from .functional import triplet_loss
 
@@ -75,11 +76,9 @@ class TripletLoss(nn.Module):
         Returns:
             mask: tf.bool `Tensor` with shape [batch_size, batch_size]
         """
-        indices_equal = torch.eye(labels.size(0)).bool()
-
-        # labels and indices should be on
-        # the same device, otherwise - exception
-        indices_equal = indices_equal.to("cuda" if labels.is_cuda else "cpu")
+        indices_equal = torch.eye(
+            labels.size(0), dtype=torch.bool, device=labels.device
+        )
 
         # Check that i and j are distinct
         indices_not_equal = ~indices_equal
@@ -135,12 +134,12 @@ class TripletLoss(nn.Module):
         # For each anchor, get the hardest positive
         # First, we need to get a mask for every valid
         # positive (they should have same label)
-        mask_anchor_positive = self._get_anchor_positive_triplet_mask(labels
-                                                                      ).float()
+        mask_anchor_positive = self._get_anchor_positive_triplet_mask(labels)
 
         # We put to 0 any element where (a, p) is not valid
         # (valid if a != p and label(a) == label(p))
-        anchor_positive_dist = mask_anchor_positive * pairwise_dist
+        anchor_positive_dist = \
+            pairwise_dist.masked_fill(~mask_anchor_positive, 0.0)
 
         # shape (batch_size, 1)
         hardest_positive_dist, _ = anchor_positive_dist.max(1, keepdim=True)
@@ -148,22 +147,23 @@ class TripletLoss(nn.Module):
         # For each anchor, get the hardest negative
         # First, we need to get a mask for every valid negative
         # (they should have different labels)
-        mask_anchor_negative = \
-            self._get_anchor_negative_triplet_mask(labels).float()
+        mask_anchor_negative = self._get_anchor_negative_triplet_mask(labels)
 
         # We add the maximum value in each row
         # to the invalid negatives (label(a) == label(n))
         max_anchor_negative_dist, _ = pairwise_dist.max(1, keepdim=True)
-        anchor_negative_dist = pairwise_dist + max_anchor_negative_dist * \
-            (1.0 - mask_anchor_negative)
+        anchor_negative_dist = torch.where(
+            mask_anchor_negative,
+            pairwise_dist,
+            pairwise_dist + max_anchor_negative_dist,
+        )
 
         # shape (batch_size,)
         hardest_negative_dist, _ = anchor_negative_dist.min(1, keepdim=True)
 
         # Combine biggest d(a, p) and smallest d(a, n) into final triplet loss
         tl = hardest_positive_dist - hardest_negative_dist + margin
-        tl[tl < 0] = 0
-        triplet_loss = tl.mean()
+        triplet_loss = F.relu(tl).mean()
 
         return triplet_loss
 
@@ -185,22 +185,27 @@ class TripletLossV2(nn.Module):
     """
     Args:
         margin (float): margin for triplet.
+        max_block_numel (int): memory budget,
+            the number of the triplets processed at once
     """
-    def __init__(self, margin=0.3):
+    def __init__(self, margin=0.3, max_block_numel: int = 2 ** 24):
         """
         Constructor method for the TripletLoss class.
 
         Args:
             margin: margin parameter.
+            max_block_numel: memory budget, number of triplets.
         """
         super().__init__()
         self.margin = margin
+        self.max_block_numel = max_block_numel
 
     def forward(self, embeddings, targets):
         return triplet_loss(
             embeddings,
             targets,
             margin=self.margin,
+            max_block_numel=self.max_block_numel,
         )
 
 
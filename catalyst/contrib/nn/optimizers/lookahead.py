@@ -4,6 +4,8 @@ from collections import defaultdict
 import torch
 from torch.optim import Optimizer
 
+from catalyst import utils
+
 
 class Lookahead(Optimizer):
     def __init__(self, optimizer: Optimizer, k: int = 5, alpha: float = 0.5):
@@ -21,14 +23,16 @@ class Lookahead(Optimizer):
             group["counter"] = 0
 
     def update(self, group):
+        fasts, slows = [], []
         for fast in group["params"]:
             param_state = self.state[fast]
             if "slow_param" not in param_state:
-                param_state["slow_param"] = torch.zeros_like(fast.data)
-                param_state["slow_param"].copy_(fast.data)
-            slow = param_state["slow_param"]
-            slow += (fast.data - slow) * self.alpha
-            fast.data.copy_(slow)
+                param_state["slow_param"] = fast.data.clone()
+            fasts.append(fast.data)
+            slows.append(param_state["slow_param"])
+        # slow += (fast - slow) * alpha; fast = slow
+        utils.lerp_tensors_(slows, fasts, self.alpha)
+        utils.lerp_tensors_(fasts, slows, 1.0)
 
     def update_lookahead(self):
         for group in self.param_groups:
@@ -1,4 +1,9 @@
+import pytest
+
+import torch
+
 from catalyst.contrib.nn import criterion as module
+from catalyst.contrib.nn.criterion import functional
 
 
 def test_criterion_init():
@@ -6,3 +11,109 @@ def test_criterion_init():
         if isinstance(cls, type):
             instance = cls()
             assert instance is not None
+
+
+def _dense_triplet_loss(embeddings, labels, margin, exclude_negatives):
+    cosine_dists = functional.cosine_distance(embeddings)
+    mask = functional.batch_all(labels, exclude_negatives=exclude_negatives)
+    loss = torch.relu(
+        cosine_dists.unsqueeze(2) - cosine_dists.unsqueeze(1) + margin
+    ) * mask
+    num_positive_triplets = torch.gt(loss, 1e-8).sum().float()
+    return loss.sum() / (num_positive_triplets + 1e-8)
+
+
+@pytest.mark.parametrize("exclude_negatives", [True, False])
+@pytest.mark.parametrize("max_block_numel", [1, 40 * 40 * 3, 2 ** 24])
+def test_triplet_loss_blocks(exclude_negatives, max_block_numel):
+    torch.manual_seed(42)
+    labels = torch.randint(-4, 4, (40, ))
+    embeddings = torch.randn(40, 8, requires_grad=True)
+    expected_embeddings = embeddings.detach().clone().requires_grad_()
+
+    loss = functional.triplet_loss(
+        embeddings,
+        labels,
+        exclude_negatives=exclude_negatives,
+        max_block_numel=max_block_numel,
+    )
+    expected_loss = _dense_triplet_loss(
+        expected_embeddings, labels, 0.3, exclude_negatives
+    )
+    loss.backward()
+    expected_loss.backward()
+
+    assert expected_loss.item() > 0
+    assert torch.allclose(loss, expected_loss)
+    assert torch.allclose(
+        embeddings.grad, expected_embeddings.grad, atol=1e-7
+    )
+
+
+def test_lovasz_hinge_per_image():
+    torch.manual_seed(42)
+    logits = torch.randn(4, 8, 8)
+    targets = torch.randint(0, 2, (4, 8, 8))
+
+    loss = module.LovaszLossBinary(per_image=True)(logits, targets)
+    expected_loss = torch.stack([
+        module.LovaszLossBinary()(logit, target)
+        for logit, target in zip(logits, targets)
+    ]).mean()
+
+    assert torch.allclose(loss, expected_loss)
+
+
+@pytest.mark.parametrize("per_image", [True, False])
+def test_lovasz_softmax_ignore(per_image):
+    torch.manual_seed(42)
+    probabilities = torch.randn(2, 5, 8, 8).softmax(1)
+    targets = torch.randint(0, 3, (2, 8, 8))
+    ignored_targets = targets.clone()
+    ignored_targets[:, :3] = 255
+
+    loss = module.LovaszLossMultiClass(per_image=per_image, ignore=255)(
+        probabilities, ignored_targets
+    )
+    # the same loss over the not ignored pixels only
+    expected_loss = module.LovaszLossMultiClass(per_image=per_image)(
+        probabilities[:, :, 3:], targets[:, 3:]
+    )
+
+    assert torch.allclose(loss, expected_loss)
+
+
+@pytest.mark.parametrize("reduction", ["mean", "sum", "none"])
+def test_focal_loss_multiclass(reduction):
+    torch.manual_seed(42)
+    logits = torch.randn(2, 4, 3, 3)
+    targets = torch.randint(-1, 4, (2, 3, 3))
+
+    loss = module.FocalLossMultiClass(ignore=-1, reduction=reduction)(
+        logits, targets
+    )
+    binary_loss = module.FocalLossBinary(reduction=reduction)
+    not_ignored = targets != -1
+    # the sum of the binary losses over the classes
+    expected_loss = sum(
+        binary_loss(
+            logits[:, i][not_ignored], (targets[not_ignored] == i).long()
+        ) for i in range(4)
+    )
+
+    assert torch.allclose(loss, expected_loss)
+
+
+def test_focal_loss_multilabel():
+    torch.manual_seed(42)
+    logits = torch.randn(8, 4)
+    targets = torch.randint(0, 2, (8, 4))
+    targets[0, 1] = -1
+
+    loss = module.FocalLossMultiLabel(ignore=-1)(logits, targets)
+    expected_loss = sum(
+        module.FocalLossBinary(ignore=-1)(logits[:, i], targets[:, i])
+        for i in range(4)
+    )
+
+    assert torch.allclose(loss, expected_loss)
@@ -7,7 +7,7 @@ from tqdm import tqdm
 
 from catalyst import utils
 from catalyst.core import _State, Callback, CallbackNode, CallbackOrder
-from catalyst.utils.tools.tensorboard import SummaryWriter
+from catalyst.utils.tools.tensorboard import AsyncSummaryWriter
 from . import formatters
 
 
@@ -160,6 +160,8 @@ class TensorboardLogger(Callback):
         metric_names: List[str] = None,
         log_on_batch_end: bool = True,
         log_on_epoch_end: bool = True,
+        batch_log_period: int = 1,
+        batch_log_interval: float = None,
     ):
         """
         Args:
@@ -167,11 +169,17 @@ class TensorboardLogger(Callback):
                 if none - logs everything
             log_on_batch_end (bool): logs per-batch metrics if set True
             log_on_epoch_end (bool): logs per-epoch metrics if set True
+            batch_log_period (int): per-batch metrics are averaged
+                and logged every ``batch_log_period`` batches
+            batch_log_interval (float): if set, per-batch metrics
+                are also logged at least every ``batch_log_interval`` seconds
         """
         super().__init__(order=CallbackOrder.Logging, node=CallbackNode.Master)
         self.metrics_to_log = metric_names
         self.log_on_batch_end = log_on_batch_end
         self.log_on_epoch_end = log_on_epoch_end
+        self.batch_log_period = batch_log_period
+        self.batch_log_interval = batch_log_interval
 
         if not (self.log_on_batch_end or self.log_on_epoch_end):
             raise ValueError("You have to log something!")
@@ -179,7 +187,12 @@ class TensorboardLogger(Callback):
         self.loggers = dict()
 
     def _log_metrics(
-        self, metrics: Dict[str, float], step: int, mode: str, suffix=""
+        self,
+        metrics: Dict[str, float],
+        step: int,
+        mode: str,
+        suffix="",
+        decimate: bool = False
     ):
         if self.metrics_to_log is None:
             metrics_to_log = sorted(list(metrics.keys()))
@@ -189,7 +202,7 @@ class TensorboardLogger(Callback):
         for name in metrics_to_log:
             if name in metrics:
                 self.loggers[mode].add_scalar(
-                    f"{name}{suffix}", metrics[name], step
+                    f"{name}{suffix}", metrics[name], step, decimate=decimate
                 )
 
     def on_loader_start(self, state):
@@ -200,7 +213,11 @@ class TensorboardLogger(Callback):
         lm = state.loader_name
         if lm not in self.loggers:
             log_dir = os.path.join(state.logdir, f"{lm}_log")
-            self.loggers[lm] = SummaryWriter(log_dir)
+            self.loggers[lm] = AsyncSummaryWriter(
+                log_dir,
+                log_period=self.batch_log_period,
+                log_interval=self.batch_log_interval
+            )
 
     def on_batch_end(self, state: _State):
         """Translate batch metrics to tensorboard"""
@@ -214,7 +231,8 @@ class TensorboardLogger(Callback):
                 metrics=metrics_,
                 step=state.global_step,
                 mode=mode,
-                suffix="/batch"
+                suffix="/batch",
+                decimate=True
             )
 
     def on_epoch_end(self, state: "_State"):
@@ -248,6 +266,7 @@ class TensorboardLogger(Callback):
 
         for logger in self.loggers.values():
             logger.close()
+        self.loggers = dict()
 
 
 __all__ = [
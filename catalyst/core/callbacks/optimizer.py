@@ -21,6 +21,7 @@ class OptimizerCallback(Callback):
         accumulation_steps: int = 1,
         grad_clip_params: Dict = None,
         decouple_weight_decay: bool = True,
+        set_grad_to_none: bool = None,
         # @TODO: add model grads support and visualization
         # save_model_grads: bool = False,
     ):
@@ -34,6 +35,10 @@ class OptimizerCallback(Callback):
             loss_key (str): key to get loss from ``state.loss``
             decouple_weight_decay (bool): If True - decouple weight decay
                 regularization.
+            set_grad_to_none (bool): If True - gradients are set to None
+                instead of zeroing after the optimizer step,
+                so no memset is made for them.
+                If None - the optimizer ``zero_grad`` default is used
             # save_model_grads (bool): If True - State.model_grads will
             #     contain gradients calculated
             # on backward propagation on current
@@ -53,6 +58,7 @@ class OptimizerCallback(Callback):
 
         self.decouple_weight_decay = decouple_weight_decay
         self._optimizer_wd: List[float] = [0.0]
+        self.set_grad_to_none = set_grad_to_none
         # self.save_model_grads = save_model_grads
 
     @staticmethod
@@ -63,7 +69,9 @@ class OptimizerCallback(Callback):
         grad_clip_fn: Callable = None
     ):
         """
-        Makes a gradient step for a given optimizer
+        Makes a gradient step for a given optimizer.
+        Weight decay is applied to all the group parameters
+        with grouped multi-tensor ops.
 
         Args:
             optimizer (Optimizer): the optimizer
@@ -73,12 +81,26 @@ class OptimizerCallback(Callback):
         """
         for group, wd in zip(optimizer.param_groups, optimizer_wds):
             if wd > 0:
-                for param in group["params"]:
-                    param.data = param.data.add(-wd * group["lr"], param.data)
+                # param = param - wd * lr * param
+                utils.scale_tensors_(
+                    [param.data for param in group["params"]],
+                    1.0 - wd * group["lr"],
+                )
             if grad_clip_fn is not None:
                 grad_clip_fn(group["params"])
         optimizer.step()
 
+    def _zero_grad(self, optimizer):
+        if isinstance(optimizer, dict):
+            for value in optimizer.values():
+                self._zero_grad(value)
+        elif hasattr(optimizer, "_amp_stash") \
+                or self.set_grad_to_none is None:
+            # apex patches ``zero_grad`` to clear the model fp16 grads too
+            optimizer.zero_grad()
+        else:
+            utils.zero_grad(optimizer, set_to_none=self.set_grad_to_none)
+
     def on_stage_start(self, state: _State):
         """
         Checks that the current stage has correct optimizer
@@ -120,7 +142,7 @@ class OptimizerCallback(Callback):
 
         self._accumulation_counter += 1
         need_gradient_step = \
-            (self._accumulation_counter + 1) % self.accumulation_steps == 0
+            self._accumulation_counter % self.accumulation_steps == 0
 
         # This is very hacky check whether we have AMP optimizer and this may
         # change in future.
@@ -151,7 +173,7 @@ class OptimizerCallback(Callback):
             #         tag = tag.replace(".", "/")
             #         state.model_grads[tag] = value.grad.cpu().numpy()
 
-            utils.maybe_recursive_call(optimizer, "zero_grad")
+            self._zero_grad(optimizer)
 
             self._accumulation_counter = 0
 
@@ -1,34 +1,85 @@
+from typing import List  # isort:skip
+from collections import defaultdict
+
+import numpy as np
+
+import torch
+
 from catalyst.core import _State, Callback, CallbackNode, CallbackOrder
 from catalyst.utils.tools.time_manager import TimeManager
 
 
 class TimerCallback(Callback):
     """
-    Logs pipeline execution time
+    Logs pipeline execution time:
+    per-batch data, model and batch time and throughput,
+    and their percentiles over the loader at the loader end
     """
-    def __init__(self):
+    def __init__(
+        self,
+        synchronize: bool = False,
+        percentiles: List[float] = (50, 90, 99),
+        tokens_key: str = None,
+    ):
+        """
+        Args:
+            synchronize (bool): if True, waits for the CUDA kernels
+                before the time measurements, so ``model_time``
+                includes the asynchronous execution time
+            percentiles (List[float]): percentiles of the timings
+                to log at the loader end, as ``_timer/batch_time/p50``
+            tokens_key (str): key of the input with the number of tokens
+                per sample (lengths) or the tokens mask,
+                if set, its sum is used to log ``_timer/_tokens_per_second``
+        """
         super().__init__(order=CallbackOrder.Metric + 1, node=CallbackNode.All)
         self.timer = TimeManager()
+        self.synchronize = synchronize and torch.cuda.is_available()
+        self.percentiles = list(percentiles)
+        self.tokens_key = tokens_key
+        self._timings = defaultdict(list)
 
     def on_loader_start(self, state: _State):
         self.timer.reset()
+        self._timings = defaultdict(list)
         self.timer.start("_timer/batch_time")
         self.timer.start("_timer/data_time")
 
     def on_loader_end(self, state: _State):
+        for key, values in self._timings.items():
+            values = np.asarray(values)
+            if len(self.percentiles) > 0:
+                percentiles = np.percentile(values, self.percentiles)
+                for percentile, value in zip(self.percentiles, percentiles):
+                    state.loader_metrics[f"{key}/p{percentile:g}"] = \
+                        float(value)
+            state.loader_metrics[f"{key}/max"] = float(values.max())
+
         self.timer.reset()
+        self._timings = defaultdict(list)
 
     def on_batch_start(self, state: _State):
+        if self.synchronize:
+            torch.cuda.synchronize()
         self.timer.stop("_timer/data_time")
         self.timer.start("_timer/model_time")
 
     def on_batch_end(self, state: _State):
+        if self.synchronize:
+            torch.cuda.synchronize()
         self.timer.stop("_timer/model_time")
         self.timer.stop("_timer/batch_time")
 
+        for key, value in self.timer.elapsed.items():
+            self._timings[key].append(value)
+
+        batch_time = self.timer.elapsed["_timer/batch_time"]
         # @TODO: just a trick
-        self.timer.elapsed["_timer/_fps"] = \
-            state.batch_size / self.timer.elapsed["_timer/batch_time"]
+        self.timer.elapsed["_timer/_fps"] = state.batch_size / batch_time
+        if self.tokens_key is not None:
+            num_tokens = float(state.batch_in[self.tokens_key].sum())
+            self.timer.elapsed["_timer/_tokens_per_second"] = \
+                num_tokens / batch_time
         for key, value in self.timer.elapsed.items():
             state.batch_metrics[key] = value
 
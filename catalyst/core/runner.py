@@ -1,4 +1,6 @@
-from typing import Any, Callable, Dict, Mapping, Tuple, Union  # isort:skip
+from typing import (  # isort:skip
+    Any, Callable, Dict, List, Mapping, Tuple, Union
+)
 
 from abc import ABC, abstractmethod
 from collections import OrderedDict
@@ -17,12 +19,36 @@ from .experiment import _Experiment
 from .state import _State
 
 
+def _get_event_handlers(
+    callbacks: "OrderedDict[str, Callback]"
+) -> Dict[str, List[Tuple[str, Callable]]]:
+    """
+    Builds the dispatch table: event -> ``(name, handler)`` list
+    of the callbacks, which override the event handler,
+    in the callbacks order
+    """
+    events = [event for event in dir(Callback) if event.startswith("on_")]
+    event_handlers = {event: [] for event in events}
+    for name, callback in callbacks.items():
+        for event in events:
+            # inherited no-op handlers are skipped
+            handler_fn = getattr(type(callback), event, None)
+            if handler_fn is getattr(Callback, event) \
+                    and event not in vars(callback):
+                continue
+            event_handlers[event].append((name, getattr(callback, event)))
+    return event_handlers
+
+
 class _Runner(ABC):
     """
     Abstract class for all runners inherited from
     """
     _experiment_fn: Callable = _Experiment
     _state_fn: Callable = _State
+    # dispatch table cache, see ``_get_event_handlers``
+    _event_handlers: Dict[str, List[Tuple[str, Callable]]] = None
+    _event_handlers_key: Tuple = None
 
     def __init__(
         self,
@@ -237,9 +263,27 @@ class _Runner(ABC):
     def _prepare_for_epoch(self, stage: str, epoch: int):
         pass
 
+    def _get_event_handlers(self, event: str) -> List[Tuple[str, Callable]]:
+        callbacks = self.state.callbacks
+        # the table is rebuilt only if the callbacks have changed,
+        # it holds the callbacks handlers, so their ids are not reused
+        key = (tuple(callbacks.keys()), tuple(map(id, callbacks.values())))
+        if key != self._event_handlers_key:
+            self._event_handlers = _get_event_handlers(callbacks)
+            self._event_handlers_key = key
+        return self._event_handlers[event]
+
     def _run_event(self, event: str):
-        for callback in self.state.callbacks.values():
-            getattr(callback, event)(self.state)
+        handlers = self._get_event_handlers(event)
+        profiler = self.state.profiler
+        if profiler is None:
+            for _, handler in handlers:
+                handler(self.state)
+        else:
+            for name, handler in handlers:
+                start = profiler.start()
+                handler(self.state)
+                profiler.stop(f"{event}/{name}", start, category="callback")
 
     def _batch2device(self, batch: Mapping[str, Any], device: Device):
         output = utils.any2device(batch, device)
@@ -268,14 +312,31 @@ class _Runner(ABC):
         return output
 
     def _run_batch(self, batch: Mapping[str, Any]):
+        profiler = self.state.profiler
+        if profiler is not None:
+            batch_start = profiler.start()
+
         self.state.global_step += self.state.batch_size
         batch = self._batch2device(batch, self.device)
         self.state.batch_in = batch
 
         self._run_event("on_batch_start")
+        if profiler is not None:
+            start = profiler.start()
         self._run_batch_train_step(batch=batch)
+        if profiler is not None:
+            profiler.stop(
+                f"{self.state.loader_name}/train_step", start, category="batch"
+            )
         self._run_event("on_batch_end")
 
+        if profiler is not None:
+            profiler.stop(
+                f"{self.state.loader_name}/batch",
+                batch_start,
+                category="batch"
+            )
+
     def _run_loader(self, loader: DataLoader):
         self.state.batch_size = (
             loader.batch_sampler.batch_size
@@ -286,12 +347,22 @@ class _Runner(ABC):
             or self.state.global_epoch * len(loader) * self.state.batch_size
         )
 
+        profiler = self.state.profiler
+        if profiler is not None:
+            start = profiler.start()
         for i, batch in enumerate(loader):
+            if profiler is not None:
+                # time of waiting for the data
+                profiler.stop(
+                    f"{self.state.loader_name}/data", start, category="batch"
+                )
             self.state.loader_step = i + 1
             self._run_batch(batch)
             if self.state.need_early_stop:
                 self.state.need_early_stop = False
                 break
+            if profiler is not None:
+                start = profiler.start()
 
     def _run_epoch(self, stage: str, epoch: int):
         self._prepare_for_epoch(stage=stage, epoch=epoch)
@@ -326,10 +397,16 @@ class _Runner(ABC):
             utils.set_global_seed(
                 self.experiment.initial_seed + state.global_epoch + 1
             )
+            if state.profiler is not None:
+                start = state.profiler.start()
             self._run_event("on_loader_start")
             with torch.set_grad_enabled(state.need_backward_pass):
                 self._run_loader(loader)
             self._run_event("on_loader_end")
+            if state.profiler is not None:
+                state.profiler.stop(
+                    f"{loader_name}/loader", start, category="loader"
+                )
 
     def _run_stage(self, stage: str):
         self._prepare_for_stage(stage)
@@ -352,6 +429,15 @@ class _Runner(ABC):
             state.epoch += 1
         self._run_event("on_stage_end")
 
+        if state.profiler is not None:
+            print(f"Profiling summary of {stage} stage, ms:")
+            print(state.profiler.format_summary())
+            if state.logdir is not None:
+                # every worker saves its own profile
+                prefix = stage if state.distributed_rank < 0 \
+                    else f"{stage}.rank{state.distributed_rank}"
+                state.profiler.save(f"{state.logdir}/profile", prefix=prefix)
+
     def run_experiment(self, experiment: _Experiment):
         """
         Starts the experiment
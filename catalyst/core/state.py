@@ -8,6 +8,7 @@ from torch.utils.data import DataLoader
 
 from catalyst import utils
 from catalyst.utils.tools.frozen_class import FrozenClass
+from catalyst.utils.tools.profiler import Profiler
 from catalyst.utils.tools.typing import (
     Criterion, Device, Model, Optimizer, Scheduler
 )
@@ -144,6 +145,10 @@ class _State(FrozenClass):
         False otherwise
 
     state.exception - python Exception instance to raise (or not ;) )
+
+    state.profiler - Profiler instance, if profiling is enabled,
+        records the time of every callback, batch and loader
+        None (default) otherwise
     """
     def __init__(
         self,
@@ -162,6 +167,7 @@ class _State(FrozenClass):
         valid_loader: str = "valid",
         checkpoint_data: Dict = None,
         is_check_run: bool = False,
+        profile: Union[bool, Dict] = False,
         **kwargs,
     ):
         # main part
@@ -235,6 +241,12 @@ class _State(FrozenClass):
         self.need_exception_reraise: bool = True
         self.exception: Optional[Exception] = None
 
+        # profiling
+        if isinstance(profile, bool):
+            profile = {} if profile else None
+        self.profiler: Optional[Profiler] = \
+            Profiler(**profile) if profile is not None else None
+
         # kwargs
         for k, v in kwargs.items():
             setattr(self, k, v)
@@ -3,7 +3,7 @@ import functools
 
 import numpy as np
 
-from catalyst.utils import get_one_hot, imread, mimread
+from catalyst import utils
 
 
 class ReaderSpec:
@@ -73,7 +73,7 @@ class ImageReader(ReaderSpec):
             np.ndarray: Image
         """
         image_name = str(element[self.input_key])
-        img = imread(
+        img = utils.imread(
             image_name, rootpath=self.rootpath, grayscale=self.grayscale
         )
 
@@ -117,7 +117,9 @@ class MaskReader(ReaderSpec):
             np.ndarray: Mask
         """
         mask_name = str(element[self.input_key])
-        mask = mimread(mask_name, rootpath=self.rootpath, clip_range=self.clip)
+        mask = utils.mimread(
+            mask_name, rootpath=self.rootpath, clip_range=self.clip
+        )
 
         output = {self.output_key: mask}
         return output
@@ -170,7 +172,7 @@ class ScalarReader(ReaderSpec):
         """
         scalar = self.dtype(element.get(self.input_key, self.default_value))
         if self.one_hot_classes is not None:
-            scalar = get_one_hot(
+            scalar = utils.get_one_hot(
                 scalar, self.one_hot_classes, smoothing=self.smoothing
             )
         output = {self.output_key: scalar}
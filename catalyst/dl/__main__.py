@@ -2,9 +2,10 @@ from argparse import ArgumentParser, RawTextHelpFormatter
 from collections import OrderedDict
 
 from catalyst.__version__ import __version__
-from catalyst.dl.scripts import init, run, trace
+from catalyst.dl.scripts import benchmark, init, run, trace
 
 COMMANDS = OrderedDict([
+    ("benchmark", benchmark),
     ("init", init),
     ("run", run),
     ("trace", trace),
@@ -1,7 +1,6 @@
 from typing import Dict, List  # isort:skip
 
 import numpy as np
-from sklearn.metrics import confusion_matrix as confusion_matrix_fn
 
 from catalyst.dl import Callback, CallbackNode, CallbackOrder, State, utils
 from catalyst.utils import meters
@@ -60,6 +59,8 @@ class ConfusionMatrixCallback(Callback):
         if self._version == "tnt":
             confusion_matrix = self.confusion_matrix.value()
         elif self._version == "sklearn":
+            from sklearn.metrics import confusion_matrix as confusion_matrix_fn
+
             confusion_matrix = confusion_matrix_fn(
                 y_true=self.targets, y_pred=self.outputs
             )
@@ -1,9 +1,7 @@
 from collections import defaultdict
 import os
 
-import imageio
 import numpy as np
-from skimage.color import label2rgb
 
 import torch
 import torch.nn.functional as F
@@ -99,6 +97,9 @@ class InferMaskCallback(Callback):
         os.makedirs(f"{self.out_prefix}/{lm}/", exist_ok=True)
 
     def on_batch_end(self, state: State):
+        import imageio
+        from skimage.color import label2rgb
+
         lm = state.loader_name
         names = state.batch_in.get(self.name_key, [])
 
@@ -51,7 +51,7 @@ class ConfigExperiment(Experiment):
         self.__prepare_logdir()
 
         self._config["stages"]["state_params"] = utils.merge_dicts(
-            deepcopy(self._config["stages"].get("state_params", {})),
+            self._config["stages"].get("state_params", {}),
             deepcopy(self._config.get("args", {})), {"logdir": self._logdir}
         )
         self.stages_config = self._get_stages_config(self._config["stages"])
@@ -74,15 +74,17 @@ class ConfigExperiment(Experiment):
         stages_defaults = {}
         stages_config_out = OrderedDict()
         for key in self.STAGE_KEYWORDS:
-            stages_defaults[key] = deepcopy(stages_config.get(key, {}))
+            stages_defaults[key] = stages_config.get(key, {})
         for stage in stages_config:
             if stage in self.STAGE_KEYWORDS \
                     or stages_config.get(stage) is None:
                 continue
             stages_config_out[stage] = {}
             for key in self.STAGE_KEYWORDS:
+                # ``merge_dicts`` copies the defaults itself,
+                # the stage part is copied as the getters modify it
                 stages_config_out[stage][key] = utils.merge_dicts(
-                    deepcopy(stages_defaults.get(key, {})),
+                    stages_defaults.get(key, {}),
                     deepcopy(stages_config[stage].get(key, {})),
                 )
 
@@ -139,6 +139,7 @@ class SupervisedRunner(Runner):
         fp16: Union[Dict, bool] = None,
         monitoring_params: Dict = None,
         check: bool = False,
+        profile: Union[Dict, bool] = False,
     ) -> None:
         """
         Starts the training process of the model.
@@ -176,6 +177,10 @@ class SupervisedRunner(Runner):
                 ``{"token": "api_token", "experiment": "experiment_name"}``
             check (bool): if True, then only checks that pipeline is working
                 (3 epochs only)
+            profile (Union[Dict, bool]): if True, then records the time
+                of every callback, batch and loader, and saves the summary
+                and Chrome trace timeline to ``{logdir}/profile``.
+                Dict is passed as ``catalyst.utils.tools.Profiler`` params
         """
         if len(loaders) == 1:
             valid_loader = list(loaders.keys())[0]
@@ -185,6 +190,8 @@ class SupervisedRunner(Runner):
             )
         if isinstance(fp16, bool) and fp16:
             fp16 = {"opt_level": "O1"}
+        if profile:
+            state_kwargs = {**(state_kwargs or {}), "profile": profile}
 
         if model is not None:
             self.model = model
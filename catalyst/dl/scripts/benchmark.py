@@ -0,0 +1,318 @@
+#!/usr/bin/env python
+# usage:
+# catalyst-dl benchmark --suites loop runner callbacks \
+#   --callbacks criterion optimizer --out ./benchmark.json
+from typing import Dict, List  # isort:skip
+import argparse
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import io
+import json
+import multiprocessing
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import torch
+from torch import nn
+from torch.utils.data import DataLoader, TensorDataset
+
+from catalyst.dl import (
+    BaseExperiment, Callback, CallbackOrder, CheckpointCallback,
+    ConsoleLogger, CriterionCallback, ExceptionCallback,
+    MetricManagerCallback, OptimizerCallback, SupervisedRunner,
+    TensorboardLogger, TimerCallback, ValidationManagerCallback
+)
+
+SUITES = ["loop", "runner", "callbacks"]
+CALLBACKS = OrderedDict(
+    [
+        ("criterion", CriterionCallback),
+        ("optimizer", OptimizerCallback),
+        ("timer", TimerCallback),
+        ("metrics", MetricManagerCallback),
+        ("validation", ValidationManagerCallback),
+        ("saver", CheckpointCallback),
+        ("console", ConsoleLogger),
+        ("tensorboard", TensorboardLogger),
+        ("exception", ExceptionCallback),
+    ]
+)
+
+
+def _get_loaders(args) -> "OrderedDict[str, DataLoader]":
+    generator = torch.Generator().manual_seed(args.seed)
+    features = torch.randn(
+        args.num_samples, args.num_features, generator=generator
+    )
+    targets = torch.randint(
+        args.num_classes, (args.num_samples, ), generator=generator
+    )
+    loader = DataLoader(
+        TensorDataset(features, targets),
+        batch_size=args.batch_size,
+        shuffle=False
+    )
+    return OrderedDict([("train", loader)])
+
+
+def _get_components(args):
+    torch.manual_seed(args.seed)
+    model = nn.Sequential(
+        nn.Linear(args.num_features, args.hidden_size),
+        nn.ReLU(),
+        nn.Linear(args.hidden_size, args.num_classes),
+    )
+    criterion = nn.CrossEntropyLoss()
+    optimizer = torch.optim.SGD(model.parameters(), lr=1e-3)
+    return model, criterion, optimizer
+
+
+class _BatchClockCallback(Callback):
+    """Records the time of every batch end, after all the other callbacks"""
+    def __init__(self, batch_times: List[float]):
+        super().__init__(order=CallbackOrder.External)
+        self.batch_times = batch_times
+
+    def on_batch_end(self, state):
+        self.batch_times.append(time.perf_counter())
+
+
+def _run_loop(args, loaders, logdir, batch_times):
+    model, criterion, optimizer = _get_components(args)
+    model.train()
+    for _ in range(args.num_epochs):
+        for features, targets in loaders["train"]:
+            optimizer.zero_grad()
+            loss = criterion(model(features), targets)
+            loss.backward()
+            optimizer.step()
+            batch_times.append(time.perf_counter())
+
+
+def _run_runner(args, loaders, logdir, batch_times):
+    model, criterion, optimizer = _get_components(args)
+    SupervisedRunner().train(
+        model=model,
+        criterion=criterion,
+        optimizer=optimizer,
+        loaders=loaders,
+        logdir=logdir,
+        num_epochs=args.num_epochs,
+        valid_loader="train",
+        callbacks=OrderedDict([("_clock", _BatchClockCallback(batch_times))]),
+    )
+
+
+def _run_callbacks(args, loaders, logdir, batch_times):
+    model, criterion, optimizer = _get_components(args)
+    callbacks = OrderedDict(
+        (f"_{name}", CALLBACKS[name]()) for name in args.callbacks
+    )
+    callbacks["_clock"] = _BatchClockCallback(batch_times)
+    experiment = BaseExperiment(
+        model=model,
+        loaders=loaders,
+        callbacks=callbacks,
+        logdir=logdir,
+        criterion=criterion,
+        optimizer=optimizer,
+        num_epochs=args.num_epochs,
+        valid_loader="train",
+    )
+    SupervisedRunner().run_experiment(experiment)
+
+
+_SUITE_FNS = {
+    "loop": _run_loop,
+    "runner": _run_runner,
+    "callbacks": _run_callbacks,
+}
+
+
+def _get_max_rss_mb() -> float:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macos
+    max_rss = max_rss / 2 ** 20 if sys.platform == "darwin" \
+        else max_rss / 2 ** 10
+    return max_rss
+
+
+def _run_suite(args, suite: str) -> Dict:
+    loaders = _get_loaders(args)
+    num_batches = args.num_epochs * len(loaders["train"])
+    assert num_batches > args.warmup_batches, \
+        "number of batches should be greater than --warmup-batches"
+    suite_fn = _SUITE_FNS[suite]
+    # peak memory of the process before the suite, imports and data
+    initial_rss = _get_max_rss_mb()
+
+    times = []
+    for i in range(args.warmup + args.repeats):
+        batch_times = []
+        logdir = tempfile.mkdtemp()
+        try:
+            # runners report to the console, keep the output clean
+            with contextlib.redirect_stdout(io.StringIO()):
+                suite_fn(args, loaders, logdir, batch_times)
+        finally:
+            shutil.rmtree(logdir, ignore_errors=True)
+        if i < args.warmup:
+            continue
+        # one-time setup and the first batches are not timed
+        start = batch_times[args.warmup_batches - 1] \
+            if args.warmup_batches > 0 else batch_times[0]
+        num_timed = len(batch_times) - max(args.warmup_batches, 1)
+        times.append((batch_times[-1] - start) / num_timed)
+    batch_time = float(np.median(times))
+
+    max_rss = _get_max_rss_mb()
+    return {
+        "batch_time": batch_time * 1e3,
+        "samples_per_second": args.batch_size / batch_time,
+        "max_rss_mb": max_rss,
+        "suite_rss_mb": max_rss - initial_rss,
+    }
+
+
+def run_benchmark(args) -> Dict:
+    """
+    Runs the benchmark suites,
+    every suite is run in a separate process,
+    so its memory statistics do not include the previous suites
+
+    Args:
+        args: command line arguments
+
+    Returns:
+        Dict: suite name -> statistics, times are in milliseconds
+    """
+    results = OrderedDict()
+    context = multiprocessing.get_context("spawn")
+    for suite in args.suites:
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            results[suite] = executor.submit(_run_suite, args, suite).result()
+
+    if "loop" in results:
+        loop_batch_time = results["loop"]["batch_time"]
+        for value in results.values():
+            value["overhead_per_batch"] = \
+                value["batch_time"] - loop_batch_time
+    return results
+
+
+def compare_with_baseline(
+    results: Dict, baseline: Dict, tolerance: float
+) -> List[str]:
+    """
+    Compares batch time of the suites with the baseline ones
+
+    Args:
+        results (Dict): ``run_benchmark`` results
+        baseline (Dict): stored ``run_benchmark`` results
+        tolerance (float): allowed relative slowdown
+
+    Returns:
+        List[str]: suites, which are slower than the baseline
+    """
+    regressions = []
+    for suite, value in results.items():
+        if suite not in baseline:
+            continue
+        ratio = value["batch_time"] / baseline[suite]["batch_time"]
+        value["baseline_ratio"] = ratio
+        if ratio > 1 + tolerance:
+            regressions.append(suite)
+    return regressions
+
+
+def build_args(parser):
+    parser.add_argument(
+        "--suites",
+        nargs="+",
+        choices=SUITES,
+        default=SUITES,
+        help="loop - bare PyTorch loop, "
+        "runner - SupervisedRunner with the default callbacks, "
+        "callbacks - runner with the --callbacks only"
+    )
+    parser.add_argument(
+        "--callbacks",
+        nargs="+",
+        choices=list(CALLBACKS.keys()),
+        default=["criterion", "optimizer"],
+        help="callbacks for the callbacks suite"
+    )
+    parser.add_argument("--num-samples", type=int, default=4096)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--num-features", type=int, default=16)
+    parser.add_argument("--hidden-size", type=int, default=32)
+    parser.add_argument("--num-classes", type=int, default=4)
+    parser.add_argument("--num-epochs", type=int, default=2)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="number of untimed runs"
+    )
+    parser.add_argument(
+        "--warmup-batches",
+        type=int,
+        default=10,
+        help="number of untimed batches at the start of every run"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--out", type=str, default=None, help="path to save the results json"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=None,
+        help="path to the results json to compare with"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="allowed relative slowdown against the baseline"
+    )
+
+    return parser
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    build_args(parser)
+    args = parser.parse_args()
+    return args
+
+
+def main(args, _=None):
+    results = run_benchmark(args)
+
+    regressions = []
+    if args.baseline is not None:
+        with open(args.baseline) as fin:
+            baseline = json.load(fin)
+        regressions = compare_with_baseline(
+            results, baseline, args.tolerance
+        )
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.out is not None:
+        with open(args.out, "w") as fout:
+            fout.write(output)
+
+    if len(regressions) > 0:
+        print(f"Slower than the baseline: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    main(args)
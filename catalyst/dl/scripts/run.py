@@ -2,6 +2,7 @@
 
 import argparse
 from argparse import ArgumentParser
+from copy import deepcopy
 import os
 from pathlib import Path
 
@@ -105,12 +106,26 @@ def main_worker(args, unknown_args):
     experiment = Experiment(config)
     runner = Runner(**runner_params)
 
+    dump_threads = []
     if experiment.logdir is not None and get_rank() <= 0:
-        utils.dump_environment(config, experiment.logdir, args.configs)
-        utils.dump_code(args.expdir, experiment.logdir)
+        # provenance is saved in background not to delay the first batch
+        dump_threads = [
+            utils.run_in_background(
+                utils.dump_environment,
+                deepcopy(config),
+                experiment.logdir,
+                args.configs,
+            ),
+            utils.run_in_background(
+                utils.dump_code, args.expdir, experiment.logdir
+            ),
+        ]
 
     runner.run_experiment(experiment)
 
+    for thread in dump_threads:
+        thread.join()
+
 
 def main(args, unknown_args):
     """Run the ``catalyst-dl run`` script"""
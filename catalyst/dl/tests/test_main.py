@@ -31,3 +31,15 @@ def test_arg_parser_fail_on_none():
     with pytest.raises(SystemExit):
         # Raises SystemExit when args are not ok
         parser.parse_known_args(["--config", "test.yml", "--unknown"])
+
+
+def test_arg_parser_benchmark():
+    parser = main.build_parser()
+
+    args, _ = parser.parse_known_args(
+        ["benchmark", "--suites", "loop", "callbacks", "--callbacks", "timer"]
+    )
+
+    assert args.command == "benchmark"
+    assert args.suites == ["loop", "callbacks"]
+    assert args.callbacks == ["timer"]
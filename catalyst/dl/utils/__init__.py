@@ -1,24 +1,29 @@
 # flake8: noqa
 
+import importlib.util
 import logging
 import os
 
-from catalyst.utils import *
-# from .trace import get_trace_name, load_traced_model, trace_model
-from .pipelines import clone_pipeline
-from .torch import get_loader
-from .visualization import plot_metrics
-from .wizard import run_wizard, Wizard
+from catalyst.utils.lazy import lazy_import
 
 logger = logging.getLogger(__name__)
 
-try:
-    import transformers  # noqa: F401
-    from .text import tokenize_text, process_bert_output
-except ImportError as ex:
-    if os.environ.get("USE_TRANSFORMERS", "0") == "1":
-        logger.warning(
-            "transformers not available, to install transformers,"
-            " run `pip install transformers`."
-        )
-        raise ex
+submodules = {
+    # ".trace": ["get_trace_name", "load_traced_model", "trace_model"],
+    ".pipelines": ["clone_pipeline"],
+    ".torch": ["get_loader"],
+    ".visualization": ["plot_metrics"],
+    ".wizard": ["run_wizard", "Wizard"],
+}
+
+if importlib.util.find_spec("transformers") is not None:
+    submodules[".text"] = ["tokenize_text", "process_bert_output"]
+elif os.environ.get("USE_TRANSFORMERS", "0") == "1":
+    logger.warning(
+        "transformers not available, to install transformers,"
+        " run `pip install transformers`."
+    )
+    raise ImportError("No module named 'transformers'")
+
+lazy_import(__name__, submodules, extends=["catalyst.utils"])
+del submodules
@@ -1,7 +1,9 @@
 # flake8: noqa
 
 from .actor import Actor, ActorSpec
-from .critic import ActionCritic, CriticSpec, StateActionCritic, StateCritic
+from .critic import (
+    ActionCritic, CriticSpec, EnsembleCritic, StateActionCritic, StateCritic
+)
 from .head import PolicyHead, ValueHead
 from .network import StateActionNet, StateNet
 from .policy import (
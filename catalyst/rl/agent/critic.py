@@ -1,7 +1,9 @@
-from typing import Dict, Tuple  # isort:skip
+from typing import Dict, List, Tuple  # isort:skip
 import copy
 
 from gym import spaces
+import torch
+from torch import nn
 
 from catalyst.rl.core import CriticSpec, EnvironmentSpec
 from .head import ValueHead
@@ -162,4 +164,155 @@ class StateActionCritic(CriticSpec):
         return net
 
 
-__all__ = ["CriticSpec", "StateCritic", "ActionCritic", "StateActionCritic"]
+class EnsembleCritic(CriticSpec):
+    """
+    Ensemble of the critics with the same architecture.
+    Their parameters are stacked along the first dimension,
+    so all the critics are evaluated with a single vectorized call
+    and their gradients are computed with a single backward.
+
+    Requires ``torch.func``, PyTorch 2.0 or newer.
+    """
+    def __init__(self, critics: List[CriticSpec]):
+        """
+        Args:
+            critics (List[CriticSpec]): critics to stack,
+                their current weights are copied
+        """
+        super().__init__()
+        assert hasattr(torch, "func"), "EnsembleCritic requires PyTorch>=2.0"
+        critics = list(critics)
+        self.num_critics = len(critics)
+
+        params, buffers = torch.func.stack_module_state(critics)
+        self._param_names = list(params.keys())
+        self._buffer_names = list(buffers.keys())
+        self.params = nn.ParameterList(
+            [nn.Parameter(params[name]) for name in self._param_names]
+        )
+        for i, name in enumerate(self._buffer_names):
+            self.register_buffer(f"buffer{i}", buffers[name])
+
+        # structure of the critic, without its own weights,
+        # it is kept in the list to be hidden from ``nn.Module``
+        self._critic = [copy.deepcopy(critics[0]).to("meta")]
+
+    @property
+    def critic(self) -> CriticSpec:
+        return self._critic[0]
+
+    @property
+    def num_outputs(self) -> int:
+        return self.critic.num_outputs
+
+    @property
+    def num_atoms(self) -> int:
+        return self.critic.num_atoms
+
+    @property
+    def distribution(self) -> str:
+        return self.critic.distribution
+
+    @property
+    def values_range(self) -> Tuple:
+        return self.critic.values_range
+
+    @property
+    def num_heads(self) -> int:
+        return self.critic.num_heads
+
+    @property
+    def hyperbolic_constant(self) -> float:
+        return self.critic.hyperbolic_constant
+
+    def _get_buffers(self) -> List[torch.Tensor]:
+        return [
+            getattr(self, f"buffer{i}")
+            for i in range(len(self._buffer_names))
+        ]
+
+    def train(self, mode: bool = True):
+        self.critic.train(mode)
+        return super().train(mode)
+
+    def forward(self, *inputs):
+        """
+        Returns:
+            torch.Tensor: stacked outputs of the critics,
+                ``[num_critics; *critic_output_shape]``
+        """
+        def _forward(params, buffers, *inputs_):
+            return torch.func.functional_call(
+                self.critic, (params, buffers), inputs_
+            )
+
+        params = dict(zip(self._param_names, self.params))
+        buffers = dict(zip(self._buffer_names, self._get_buffers()))
+        in_dims = (0, 0) + (None, ) * len(inputs)
+        x = torch.func.vmap(
+            _forward, in_dims=in_dims, randomness="different"
+        )(params, buffers, *inputs)
+        return x
+
+    @torch.no_grad()
+    def load_from_critics(self, critics: List[CriticSpec]) -> None:
+        """Copies the weights of ``critics`` into the ensemble"""
+        assert len(critics) == self.num_critics
+        tensors = self._get_tensors()
+        for i, critic in enumerate(critics):
+            for name, value in self._get_critic_tensors(critic).items():
+                tensors[name][i].copy_(value)
+
+    @torch.no_grad()
+    def copy_to_critics(self, critics: List[CriticSpec]) -> None:
+        """
+        Copies the weights of the ensemble into ``critics``,
+        so they could be saved with the usual ``state_dict``
+        """
+        assert len(critics) == self.num_critics
+        tensors = self._get_tensors()
+        for i, critic in enumerate(critics):
+            for name, value in self._get_critic_tensors(critic).items():
+                value.copy_(tensors[name][i])
+
+    def critic_parameters(self, index: int) -> List[torch.Tensor]:
+        """
+        Returns the parameters of the ``index``-th critic
+        as the views of the stacked ones, with the views of the gradients,
+        for example, to clip the gradients of every critic separately
+
+        Args:
+            index (int): index of the critic
+
+        Returns:
+            List[torch.Tensor]: parameters views, changing their ``grad``
+                in-place changes the gradients of the ensemble
+        """
+        params = []
+        for param in self.params:
+            param_i = param.detach()[index]
+            if param.grad is not None:
+                param_i.grad = param.grad[index]
+            params.append(param_i)
+        return params
+
+    def _get_tensors(self) -> Dict[str, torch.Tensor]:
+        tensors = {
+            **dict(zip(self._param_names, self.params)),
+            **dict(zip(self._buffer_names, self._get_buffers())),
+        }
+        return tensors
+
+    @staticmethod
+    def _get_critic_tensors(critic: CriticSpec) -> Dict[str, torch.Tensor]:
+        tensors = {
+            **dict(critic.named_parameters()),
+            **dict(critic.named_buffers()),
+        }
+        return tensors
+
+
+__all__ = [
+    "CriticSpec", "StateCritic", "ActionCritic", "StateActionCritic",
+    "EnsembleCritic"
+]
@@ -1,5 +1,7 @@
+from typing import List  # isort:skip
 from abc import ABC, abstractmethod
 from enum import Enum
+import time
 
 
 class DBSpec(ABC):
@@ -33,6 +35,37 @@ class DBSpec(ABC):
     def push_message(self, message: Message):
         pass
 
+    def wait_for_message(self, timeout: float = 1.0) -> bool:
+        """
+        Blocks until the DB flags or checkpoint change
+        or ``timeout`` seconds pass.
+        DBs without notifications support just sleep for ``timeout``.
+
+        Args:
+            timeout (float): max waiting time in seconds
+
+        Returns:
+            bool: ``True`` if something has changed, ``False`` on timeout
+        """
+        time.sleep(timeout)
+        return False
+
+    def wait_for_trajectory(self, timeout: float = 1.0) -> bool:
+        """
+        Blocks until a new trajectory is available for ``get_trajectory``
+        or ``timeout`` seconds pass.
+        DBs without notifications support just sleep for ``timeout``.
+
+        Args:
+            timeout (float): max waiting time in seconds
+
+        Returns:
+            bool: ``True`` if a new trajectory is available,
+            ``False`` on timeout
+        """
+        time.sleep(timeout)
+        return False
+
     @abstractmethod
     def put_trajectory(self, trajectory, raw: bool):
         pass
@@ -41,18 +74,79 @@ class DBSpec(ABC):
     def get_trajectory(self, index=None):
         pass
 
+    def put_trajectories(self, trajectories: List, raw: bool = False):
+        """
+        Pushes several trajectories to the DB at once.
+        DBs without bulk operations support push them one by one.
+
+        Args:
+            trajectories (List): trajectories to push
+            raw (bool): if ``True``, stores them as raw trajectories
+        """
+        for trajectory in trajectories:
+            self.put_trajectory(trajectory, raw=raw)
+
+    def get_trajectories(self, max_num: int = None) -> List:
+        """
+        Gets new trajectories from the DB at once.
+        DBs without bulk operations support get them one by one,
+        DBs with bulk operations support could limit the payload size
+        of one call, so the rest is returned on the next calls.
+
+        Args:
+            max_num (int): max number of trajectories to get,
+                all available trajectories if ``None``
+
+        Returns:
+            List: new trajectories, possibly empty
+        """
+        trajectories = []
+        while max_num is None or len(trajectories) < max_num:
+            trajectory = self.get_trajectory()
+            if trajectory is None:
+                break
+            trajectories.append(trajectory)
+        return trajectories
+
     @abstractmethod
     def del_trajectory(self):
         pass
 
     @abstractmethod
-    def put_checkpoint(self, checkpoint, epoch):
+    def put_checkpoint(self, checkpoint, epoch, keyframe: bool = False):
+        """
+        Stores the checkpoint under the next checkpoint version.
+
+        Args:
+            checkpoint: checkpoint to store
+            epoch (int): trainer epoch
+            keyframe (bool): if ``True``, the checkpoint is also stored
+                as the keyframe, see ``catalyst.rl.utils.WeightsEncoder``
+        """
         pass
 
     @abstractmethod
-    def get_checkpoint(self):
+    def get_checkpoint(self, keyframe: bool = False):
+        """
+        Args:
+            keyframe (bool): if ``True``, returns the last keyframe
+                instead of the last checkpoint
+
+        Returns:
+            the last checkpoint (keyframe) or ``None``
+        """
         pass
 
+    def get_checkpoint_version(self) -> int:
+        """
+        Cheap probe for the version of the last checkpoint,
+        which is incremented on every ``put_checkpoint`` call.
+
+        Returns:
+            int: checkpoint version, ``None`` if the DB has no versions
+        """
+        return None
+
     @abstractmethod
     def del_checkpoint(self):
         pass
@@ -76,6 +76,7 @@ class Sampler:
         self._prepare_logger(logdir, mode)
         self._sampling_flag = mp.Value(c_bool, False)
         self._training_flag = mp.Value(c_bool, True)
+        self._flags_event = threading.Event()
 
         # environment, model, exploration & action handlers
         self.env = env
@@ -99,6 +100,8 @@ class Sampler:
         self._gc_period = gc_period
         self._db_loop_thread = None
         self.checkpoint = None
+        self._checkpoint_version = None
+        self._weights_decoder = utils.WeightsDecoder()
 
         #  special
         self.monitoring_params = monitoring_params
@@ -124,7 +127,7 @@ class Sampler:
                 f"sampler.{mode}.{self._sampler_id}.{timestamp}"
             os.makedirs(logpath, exist_ok=True)
             self.logdir = logpath
-            self.logger = tools.SummaryWriter(logpath)
+            self.logger = tools.AsyncSummaryWriter(logpath)
         else:
             self.logdir = None
             self.logger = None
@@ -141,16 +144,32 @@ class Sampler:
         )
         self._db_loop_thread.start()
 
+    def _get_db_checkpoint(self, db_server: DBSpec):
+        checkpoint = db_server.get_checkpoint()
+        # ``None`` if the checkpoint is a delta with the outdated keyframe
+        checkpoint = self._weights_decoder.decode(
+            checkpoint,
+            get_keyframe_fn=lambda: db_server.get_checkpoint(keyframe=True)
+        )
+        return checkpoint
+
     def load_checkpoint(
         self, *, filepath: str = None, db_server: DBSpec = None
     ):
         if filepath is not None:
             checkpoint = utils.load_checkpoint(filepath)
         elif db_server is not None:
-            checkpoint = db_server.get_checkpoint()
+            version = db_server.get_checkpoint_version()
+            if version is not None \
+                    and version == self._checkpoint_version \
+                    and self.checkpoint is not None:
+                # the weights have not changed since the last sync
+                return
+            checkpoint = self._get_db_checkpoint(db_server)
             while checkpoint is None:
-                time.sleep(3.0)
-                checkpoint = db_server.get_checkpoint()
+                db_server.wait_for_message(timeout=3.0)
+                checkpoint = self._get_db_checkpoint(db_server)
+            self._checkpoint_version = version
         else:
             raise NotImplementedError("No checkpoint found")
 
@@ -278,7 +297,8 @@ class Sampler:
             while not self._sampling_flag.value:
                 if not self._training_flag.value:
                     return
-                time.sleep(5.0)
+                self._flags_event.wait(timeout=5.0)
+                self._flags_event.clear()
 
             # 1 – load from db, 2 – resume load trick (already have checkpoint)
             need_checkpoint = \
@@ -357,14 +377,14 @@ class ValidSampler(Sampler):
             checkpoint = utils.load_checkpoint(filepath)
         elif db_server is not None:
             current_epoch = db_server.epoch
-            checkpoint = db_server.get_checkpoint()
+            checkpoint = self._get_db_checkpoint(db_server)
             if not db_server.training_enabled \
                     and db_server.epoch == current_epoch:
                 return False
 
             while checkpoint is None or db_server.epoch <= current_epoch:
-                time.sleep(3.0)
-                checkpoint = db_server.get_checkpoint()
+                db_server.wait_for_message(timeout=3.0)
+                checkpoint = self._get_db_checkpoint(db_server)
 
                 if not db_server.training_enabled \
                         and db_server.epoch == current_epoch:
@@ -504,8 +524,10 @@ def _db2sampler_loop(sampler: Sampler):
         sampler._sampling_flag.value = flag
         if not flag and not sampler.db_server.training_enabled:
             sampler._training_flag.value = False
+            sampler._flags_event.set()
             return
-        time.sleep(5.0)
+        sampler._flags_event.set()
+        sampler.db_server.wait_for_message(timeout=5.0)
 
 
 __all__ = ["Sampler", "ValidSampler"]
@@ -49,6 +49,8 @@ class TrainerSpec:
         seed: int = 42,
         epoch_limit: int = None,
         monitoring_params: Dict = None,
+        weights_encoder_params: Dict = None,
+        logger_params: Dict = None,
         **kwargs,
     ):
         # algorithm & environment
@@ -57,7 +59,7 @@ class TrainerSpec:
 
         # logging
         self.logdir = logdir
-        self._prepare_logger(logdir)
+        self._prepare_logger(logdir, **(logger_params or {}))
         self._seeder = tools.Seeder(init_seed=seed)
 
         # updates & counters
@@ -79,6 +81,9 @@ class TrainerSpec:
         self.min_num_transitions = min_num_transitions
         self.save_period = save_period
         self.weights_sync_period = weights_sync_period
+        self.weights_encoder = utils.WeightsEncoder(
+            **(weights_encoder_params or {})
+        )
 
         self._gc_period = gc_period
 
@@ -125,11 +130,12 @@ class TrainerSpec:
                 WANDB_ENABLED = False
         self.wandb_mode = "trainer"
 
-    def _prepare_logger(self, logdir):
+    def _prepare_logger(self, logdir, **logger_params):
         timestamp = utils.get_utcnow_time()
         logpath = f"{logdir}/trainer.{timestamp}"
         os.makedirs(logpath, exist_ok=True)
-        self.logger = tools.SummaryWriter(logpath)
+        # per-batch metrics are decimated by ``log_period``
+        self.logger = tools.AsyncSummaryWriter(logpath, **logger_params)
 
     def _prepare_seed(self):
         seed = self._seeder()[0]
@@ -219,8 +225,11 @@ class TrainerSpec:
                     for k, v in checkpoint[key].items()
                 }
 
+            checkpoint, keyframe = self.weights_encoder.encode(
+                checkpoint, keyframe_id=self.epoch
+            )
             self.db_server.put_checkpoint(
-                checkpoint=checkpoint, epoch=self.epoch
+                checkpoint=checkpoint, epoch=self.epoch, keyframe=keyframe
             )
 
     def _update_target_weights(self, update_step) -> Dict:
@@ -249,10 +258,13 @@ class TrainerSpec:
             )
 
             for key, value in metrics.items():
-                self.logger.add_scalar(key, value, self.update_step)
-            self._log_to_wandb(
-                step=self.update_step, suffix="_batch", **metrics
-            )
+                self.logger.add_scalar(
+                    key, value, self.update_step, decimate=True
+                )
+            if self.update_step % self.logger.log_period == 0:
+                self._log_to_wandb(
+                    step=self.update_step, suffix="_batch", **metrics
+                )
 
         elapsed_time = time.time() - start_time
         elapsed_num_updates = len(loader) * loader.batch_size
@@ -1,4 +1,5 @@
 # flake8: noqa
 
+from .local import LocalDB
 from .mongo import MongoDB
 from .redis import RedisDB
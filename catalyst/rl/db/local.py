@@ -0,0 +1,334 @@
+import fcntl
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from catalyst.rl import utils
+from catalyst.rl.core import DBSpec
+
+
+def _get_default_path(prefix: str):
+    # tmpfs, so the data never leaves the memory
+    root = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    # the runs with different prefixes or users do not share the data
+    return os.path.join(
+        root, f"catalyst_db_{os.getuid()}", prefix or "default"
+    )
+
+
+class LocalDB(DBSpec):
+    """
+    DB for the single-host setup, which needs no external server.
+    Trainer and samplers exchange trajectories, checkpoints and flags
+    through files under ``path``, by default in the shared memory.
+    Data is stored in the binary format and is mapped to the memory
+    on reading, so numpy arrays are passed without pickling and copying.
+    """
+    def __init__(
+        self,
+        path: str = None,
+        prefix: str = None,
+        sync_epoch: bool = False,
+        compression: bool = False,
+        poll_period: float = 0.01,
+        hole_timeout: float = 10.0,
+    ):
+        """
+        Args:
+            path (str): DB directory, shared by all the processes,
+                ``/dev/shm/catalyst_db_{uid}/{prefix}`` by default,
+                it outlives the run, so the runs with the same prefix
+                should not overlap
+            prefix (str): agent prefix, as for the other DBs
+            sync_epoch (bool): if ``True``, trajectories collected
+                with the outdated weights are skipped
+            compression (bool): if ``True``, compresses arrays with lz4,
+                usually it is not worth it for the shared memory
+            poll_period (float): period in seconds
+                for the changes polling in ``wait_for_*`` methods
+            hole_timeout (float): time in seconds, after which
+                the reserved, but not written trajectory is skipped,
+                for example, if its sampler has died
+        """
+        self._path = path or _get_default_path(prefix)
+        self._prefix = "" if prefix is None else prefix
+        self._compression = compression
+        self._poll_period = poll_period
+        self._hole_timeout = hole_timeout
+
+        self._shared_dir = os.path.join(self._path, "shared")
+        self._agent_dir = os.path.join(self._path, f"agent_{self._prefix}")
+        for dirname in ["trajectories", "raw_trajectories"]:
+            os.makedirs(os.path.join(self._shared_dir, dirname), exist_ok=True)
+        os.makedirs(self._agent_dir, exist_ok=True)
+
+        self._index = 0
+        # (index, time) of the first miss of the reserved trajectory
+        self._hole = None
+        self._epoch = 0
+        self._sync_epoch = sync_epoch
+        # last seen messages counter, per waiting thread
+        self._local = threading.local()
+
+    @staticmethod
+    def _write(filepath, data: bytes):
+        # readers see either the old file or the new one, never a part
+        tmp_filepath = \
+            f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_filepath, "wb") as fout:
+            fout.write(data)
+        os.replace(tmp_filepath, filepath)
+
+    @staticmethod
+    def _read(filepath):
+        try:
+            with open(filepath, "rb") as fin:
+                # the mapping outlives the file, arrays are its views
+                return mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _get_counter(self, filepath) -> int:
+        try:
+            with open(filepath, "rb") as fin:
+                return int(fin.read())
+        except FileNotFoundError:
+            return 0
+
+    def _update_counter(self, filepath, fn) -> int:
+        with open(f"{filepath}.lock", "wb") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            value = self._get_counter(filepath)
+            self._write(filepath, str(fn(value)).encode())
+        return value
+
+    def _notify(self):
+        self._update_counter(
+            os.path.join(self._agent_dir, "messages"), lambda x: x + 1
+        )
+
+    def _wait_for(self, condition, timeout):
+        deadline = time.time() + timeout
+        while not condition():
+            if time.time() >= deadline:
+                return False
+            time.sleep(self._poll_period)
+        return True
+
+    def _set_flag(self, key, value):
+        self._write(os.path.join(self._agent_dir, key), str(value).encode())
+        self._notify()
+
+    def _get_flag(self, key, default=None):
+        try:
+            with open(os.path.join(self._agent_dir, key), "rb") as fin:
+                return int(fin.read())
+        except FileNotFoundError:
+            return default
+
+    @property
+    def training_enabled(self) -> bool:
+        flag = self._get_flag("training_flag", 1)  # enabled by default
+        flag = int(flag) == int(1)
+        return flag
+
+    @property
+    def sampling_enabled(self) -> bool:
+        flag = self._get_flag("sampling_flag", -1)  # disabled by default
+        flag = int(flag) == int(1)
+        return flag
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    @property
+    def num_trajectories(self) -> int:
+        num_trajectories = self._get_counter(
+            os.path.join(self._shared_dir, "trajectories.index")
+        )
+        return num_trajectories
+
+    def push_message(self, message: DBSpec.Message):
+        if message == DBSpec.Message.ENABLE_SAMPLING:
+            self._set_flag("sampling_flag", 1)
+        elif message == DBSpec.Message.DISABLE_SAMPLING:
+            self._set_flag("sampling_flag", 0)
+        elif message == DBSpec.Message.DISABLE_TRAINING:
+            self._set_flag("sampling_flag", 0)
+            self._set_flag("training_flag", 0)
+        elif message == DBSpec.Message.ENABLE_TRAINING:
+            self._set_flag("training_flag", 1)
+        else:
+            raise NotImplementedError("unknown message", message)
+
+    def wait_for_message(self, timeout: float = 1.0) -> bool:
+        filepath = os.path.join(self._agent_dir, "messages")
+        last_value = getattr(self._local, "messages", None)
+        if last_value is None:
+            last_value = self._local.messages = self._get_counter(filepath)
+
+        def _condition():
+            self._local.messages = self._get_counter(filepath)
+            return self._local.messages != last_value
+
+        return self._wait_for(_condition, timeout)
+
+    def wait_for_trajectory(self, timeout: float = 1.0) -> bool:
+        def _condition():
+            filepath = self._get_trajectory_path("trajectories", self._index)
+            return os.path.exists(filepath) or self._is_expired_hole()
+
+        return self._wait_for(_condition, timeout)
+
+    def _is_expired_hole(self) -> bool:
+        """
+        Checks if the current index was reserved by a writer,
+        but is not written for ``hole_timeout`` seconds
+        """
+        if self._index >= self.num_trajectories:
+            self._hole = None
+            return False
+        now = time.time()
+        if self._hole is None or self._hole[0] != self._index:
+            self._hole = (self._index, now)
+        return now - self._hole[1] >= self._hole_timeout
+
+    def _read_next_trajectory(self):
+        while True:
+            trajectory = self._read(
+                self._get_trajectory_path("trajectories", self._index)
+            )
+            if trajectory is not None:
+                self._index += 1
+                return trajectory
+            if not self._is_expired_hole():
+                return None
+            # the writer has died, the trajectory never appears
+            self._index += 1
+
+    def _get_trajectory_path(self, name, index):
+        return os.path.join(self._shared_dir, name, f"{index:012d}")
+
+    def _pack_trajectory(self, trajectory):
+        trajectory = utils.structed2dict_trajectory(trajectory)
+        trajectory = {"trajectory": trajectory, "epoch": self._epoch}
+        trajectory = utils.binary_pack(
+            trajectory, compression=self._compression
+        )
+        return trajectory
+
+    def _unpack_trajectory(self, trajectory):
+        trajectory = utils.binary_unpack(trajectory)
+        trajectory, trajectory_epoch = \
+            trajectory["trajectory"], trajectory["epoch"]
+        if self._sync_epoch and self._epoch != trajectory_epoch:
+            trajectory = None
+        else:
+            trajectory = utils.dict2structed_trajectory(trajectory)
+        return trajectory
+
+    def put_trajectory(self, trajectory, raw=False):
+        self.put_trajectories([trajectory], raw=raw)
+
+    def put_trajectories(self, trajectories, raw=False):
+        name = "raw_trajectories" if raw else "trajectories"
+        trajectories = [
+            self._pack_trajectory(trajectory) for trajectory in trajectories
+        ]
+        start = self._reserve_indices(name, len(trajectories))
+        for index, trajectory in enumerate(trajectories, start=start):
+            self._write(self._get_trajectory_path(name, index), trajectory)
+
+    def _reserve_indices(self, name, num) -> int:
+        # reserves the indices, so the writes do not need the lock
+        return self._update_counter(
+            os.path.join(self._shared_dir, f"{name}.index"),
+            lambda x: x + num
+        )
+
+    def get_trajectory(self, index=None):
+        if index is None:
+            trajectory = self._read_next_trajectory()
+        else:
+            trajectory = self._read(
+                self._get_trajectory_path("trajectories", index)
+            )
+            if trajectory is not None:
+                self._index = index + 1
+        if trajectory is not None:
+            trajectory = self._unpack_trajectory(trajectory)
+
+        return trajectory
+
+    def get_trajectories(self, max_num=None):
+        trajectories = []
+        while max_num is None or len(trajectories) < max_num:
+            trajectory = self._read_next_trajectory()
+            if trajectory is None:
+                break
+            trajectory = self._unpack_trajectory(trajectory)
+            if trajectory is not None:
+                trajectories.append(trajectory)
+        return trajectories
+
+    def del_trajectory(self):
+        dirname = os.path.join(self._shared_dir, "trajectories")
+
+        def _reset(_):
+            shutil.rmtree(dirname, ignore_errors=True)
+            os.makedirs(dirname, exist_ok=True)
+            return 0
+
+        self._update_counter(
+            os.path.join(self._shared_dir, "trajectories.index"), _reset
+        )
+        self._index = 0
+        self._hole = None
+
+    def put_checkpoint(self, checkpoint, epoch, keyframe=False):
+        self._epoch = epoch
+        checkpoint = {"checkpoint": checkpoint, "epoch": self._epoch}
+        checkpoint = utils.binary_pack(
+            checkpoint, compression=self._compression
+        )
+        if keyframe:
+            self._write(
+                os.path.join(self._agent_dir, "checkpoint_keyframe"),
+                checkpoint
+            )
+        self._write(os.path.join(self._agent_dir, "checkpoint"), checkpoint)
+        self._update_counter(
+            os.path.join(self._agent_dir, "checkpoint_version"),
+            lambda x: x + 1
+        )
+        self._notify()
+
+    def get_checkpoint(self, keyframe=False):
+        name = "checkpoint_keyframe" if keyframe else "checkpoint"
+        checkpoint = self._read(os.path.join(self._agent_dir, name))
+        if checkpoint is None:
+            return None
+        checkpoint = utils.binary_unpack(checkpoint)
+        if not keyframe:
+            self._epoch = checkpoint.get("epoch")
+        return checkpoint["checkpoint"]
+
+    def get_checkpoint_version(self) -> int:
+        version = self._get_counter(
+            os.path.join(self._agent_dir, "checkpoint_version")
+        )
+        return version
+
+    def del_checkpoint(self):
+        for name in ["checkpoint", "checkpoint_keyframe"]:
+            try:
+                os.remove(os.path.join(self._agent_dir, name))
+            except FileNotFoundError:
+                pass
+
+
+__all__ = ["LocalDB"]
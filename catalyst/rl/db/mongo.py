@@ -16,10 +16,13 @@ class MongoDB(DBSpec):
         prefix: str = None,
         sync_epoch: bool = False,
         reconnect_timeout: int = 3,
+        max_payload_size: int = int(16e6),
     ):
         self._server = pymongo.MongoClient(host=host, port=port)
         self._prefix = "" if prefix is None else prefix
         self._reconnect_timeout = reconnect_timeout
+        # max size in bytes of one bulk insert or read request
+        self._max_payload_size = max_payload_size
 
         self._shared_db = self._server["shared"]
         self._agent_db = self._server[f"agent_{self._prefix}"]
@@ -31,9 +34,28 @@ class MongoDB(DBSpec):
         self._message_collection = self._agent_db["messages"]
 
         self._last_datetime = datetime.datetime.min
+        # trajectories with the same date, which were already read
+        self._last_ids = []
 
         self._epoch = 0
         self._sync_epoch = sync_epoch
+        # change streams are available only on replica sets
+        self._change_streams_enabled = True
+
+    def _wait_for_change(self, watchable, timeout):
+        if self._change_streams_enabled:
+            try:
+                with watchable.watch(
+                    max_await_time_ms=int(timeout * 1000)
+                ) as stream:
+                    return stream.try_next() is not None
+            except pymongo.errors.AutoReconnect:
+                time.sleep(self._reconnect_timeout)
+                return False
+            except pymongo.errors.OperationFailure:
+                self._change_streams_enabled = False
+        time.sleep(timeout)
+        return False
 
     def _set_flag(self, key, value):
         try:
@@ -90,51 +112,157 @@ class MongoDB(DBSpec):
         else:
             raise NotImplementedError("unknown message", message)
 
+    def wait_for_message(self, timeout: float = 1.0) -> bool:
+        # flags and checkpoints both live in the agent database
+        return self._wait_for_change(self._agent_db, timeout)
+
+    def _get_new_trajectories_filter(self):
+        # several trajectories could be inserted with the same date
+        return {
+            "$or": [
+                {
+                    "date": {
+                        "$gt": self._last_datetime
+                    }
+                },
+                {
+                    "date": self._last_datetime,
+                    "_id": {
+                        "$nin": self._last_ids
+                    }
+                },
+            ]
+        }
+
+    def _update_last_datetime(self, trajectory_objs):
+        last_datetime = trajectory_objs[-1]["date"]
+        last_ids = [
+            obj["_id"] for obj in trajectory_objs
+            if obj["date"] == last_datetime
+        ]
+        if last_datetime == self._last_datetime:
+            last_ids = self._last_ids + last_ids
+        self._last_datetime = last_datetime
+        self._last_ids = last_ids
+
+    def _pack_trajectory(self, trajectory, date):
+        trajectory = utils.structed2dict_trajectory(trajectory)
+        trajectory = utils.pack(trajectory)
+        trajectory_obj = {
+            "trajectory": trajectory,
+            "date": date,
+            "epoch": self._epoch
+        }
+        return trajectory_obj
+
+    def _unpack_trajectory(self, trajectory_obj):
+        trajectory, trajectory_epoch = \
+            utils.unpack(trajectory_obj["trajectory"]), \
+            trajectory_obj["epoch"]
+        if self._sync_epoch and self._epoch != trajectory_epoch:
+            trajectory = None
+        else:
+            trajectory = utils.dict2structed_trajectory(trajectory)
+        return trajectory
+
+    def wait_for_trajectory(self, timeout: float = 1.0) -> bool:
+        try:
+            available = self._trajectory_collection.find_one(
+                self._get_new_trajectories_filter(),
+                projection={"_id": True}
+            ) is not None
+        except pymongo.errors.AutoReconnect:
+            time.sleep(self._reconnect_timeout)
+            return self.wait_for_trajectory(timeout)
+        if available:
+            return True
+        return self._wait_for_change(self._trajectory_collection, timeout)
+
     def put_trajectory(self, trajectory, raw=False):
         try:
-            trajectory_ = utils.structed2dict_trajectory(trajectory)
-            trajectory_ = utils.pack(trajectory_)
+            trajectory_obj = self._pack_trajectory(
+                trajectory, datetime.datetime.utcnow()
+            )
             collection = self._raw_trajectory_collection if raw \
                 else self._trajectory_collection
 
-            collection.insert_one(
-                {
-                    "trajectory": trajectory_,
-                    "date": datetime.datetime.utcnow(),
-                    "epoch": self._epoch
-                }
-            )
+            collection.insert_one(trajectory_obj)
         except pymongo.errors.AutoReconnect:
             time.sleep(self._reconnect_timeout)
             return self.put_trajectory(trajectory, raw)
 
+    def put_trajectories(self, trajectories, raw=False):
+        collection = self._raw_trajectory_collection if raw \
+            else self._trajectory_collection
+        date = datetime.datetime.utcnow()
+        trajectory_objs = [
+            self._pack_trajectory(trajectory, date)
+            for trajectory in trajectories
+        ]
+
+        chunk, chunk_size = [], 0
+        for trajectory_obj in trajectory_objs:
+            payload_size = len(trajectory_obj["trajectory"])
+            if len(chunk) > 0 \
+                    and chunk_size + payload_size > self._max_payload_size:
+                self._insert_many(collection, chunk)
+                chunk, chunk_size = [], 0
+            chunk.append(trajectory_obj)
+            chunk_size += payload_size
+
+        if len(chunk) > 0:
+            self._insert_many(collection, chunk)
+
+    def _insert_many(self, collection, trajectory_objs):
+        try:
+            collection.insert_many(trajectory_objs, ordered=True)
+        except pymongo.errors.AutoReconnect:
+            time.sleep(self._reconnect_timeout)
+            return self._insert_many(collection, trajectory_objs)
+
     def get_trajectory(self, index=None):
         assert index is None
 
+        trajectories = self._get_trajectories(max_num=1)
+        trajectory = trajectories[0] if len(trajectories) > 0 else None
+        return trajectory
+
+    def get_trajectories(self, max_num=None):
+        trajectories = self._get_trajectories(max_num=max_num)
+        trajectories = [
+            trajectory for trajectory in trajectories
+            if trajectory is not None
+        ]
+        return trajectories
+
+    def _get_trajectories(self, max_num=None):
         try:
-            trajectory_obj = self._trajectory_collection.find_one(
-                {"date": {
-                    "$gt": self._last_datetime
-                }}
-            )
+            cursor = self._trajectory_collection.find(
+                self._get_new_trajectories_filter()
+            ).sort([("date", pymongo.ASCENDING), ("_id", pymongo.ASCENDING)])
+            if max_num is not None:
+                cursor = cursor.limit(max_num)
+            trajectory_objs, payload_size = [], 0
+            for trajectory_obj in cursor:
+                trajectory_objs.append(trajectory_obj)
+                payload_size += len(trajectory_obj["trajectory"])
+                if payload_size >= self._max_payload_size:
+                    # the rest is read on the next call
+                    cursor.close()
+                    break
         except pymongo.errors.AutoReconnect:
             time.sleep(self._reconnect_timeout)
-            return self.get_trajectory(index)
-
-        if trajectory_obj is not None:
-            self._last_datetime = trajectory_obj["date"]
-
-            trajectory, trajectory_epoch = \
-                utils.unpack(trajectory_obj["trajectory"]), \
-                trajectory_obj["epoch"]
-            if self._sync_epoch and self._epoch != trajectory_epoch:
-                trajectory = None
-            else:
-                trajectory = utils.dict2structed_trajectory(trajectory)
-        else:
-            trajectory = None
+            return self._get_trajectories(max_num)
 
-        return trajectory
+        if len(trajectory_objs) == 0:
+            return []
+        self._update_last_datetime(trajectory_objs)
+
+        trajectories = [
+            self._unpack_trajectory(trajectory_obj)
+            for trajectory_obj in trajectory_objs
+        ]
+        return trajectories
 
     def del_trajectory(self):
         try:
@@ -143,45 +271,67 @@ class MongoDB(DBSpec):
             time.sleep(self._reconnect_timeout)
             return self.del_trajectory()
 
-    def put_checkpoint(self, checkpoint, epoch):
+    def put_checkpoint(self, checkpoint, epoch, keyframe=False):
         try:
             self._epoch = epoch
             checkpoint_ = utils.pack(checkpoint)
-            if self._checkpoint_collection.exists({"filename": "checkpoint"}):
-                self.del_checkpoint()
-
-            self._checkpoint_collection.put(
-                checkpoint_,
-                encoding="ascii",
-                filename="checkpoint",
-                epoch=self._epoch
-            )
+            version = self.get_checkpoint_version() + 1
+
+            filenames = ["checkpoint_keyframe", "checkpoint"] \
+                if keyframe \
+                else ["checkpoint"]
+            for filename in filenames:
+                if self._checkpoint_collection.exists({"filename": filename}):
+                    self.del_checkpoint(filename)
+
+                self._checkpoint_collection.put(
+                    checkpoint_,
+                    filename=filename,
+                    epoch=self._epoch,
+                    version=version
+                )
 
         except pymongo.errors.AutoReconnect:
             time.sleep(self._reconnect_timeout)
-            return self.put_checkpoint(checkpoint, epoch)
+            return self.put_checkpoint(checkpoint, epoch, keyframe)
 
-    def get_checkpoint(self):
+    def get_checkpoint(self, keyframe=False):
+        filename = "checkpoint_keyframe" if keyframe else "checkpoint"
         try:
             checkpoint_obj = self._checkpoint_collection.find_one(
-                {"filename": "checkpoint"}
+                {"filename": filename}
             )
         except pymongo.errors.AutoReconnect:
             time.sleep(self._reconnect_timeout)
-            return self.get_checkpoint()
+            return self.get_checkpoint(keyframe)
 
         if checkpoint_obj is not None:
-            checkpoint = checkpoint_obj.read().decode("ascii")
-            self._epoch = checkpoint_obj.epoch
+            checkpoint = checkpoint_obj.read()
+            if not keyframe:
+                self._epoch = checkpoint_obj.epoch
             checkpoint = utils.unpack(checkpoint)
         else:
             checkpoint = None
         return checkpoint
 
-    def del_checkpoint(self):
+    def get_checkpoint_version(self) -> int:
+        try:
+            checkpoint_obj = self._agent_db["checkpoints.files"].find_one(
+                {"filename": "checkpoint"}, projection={"version": True}
+            )
+        except pymongo.errors.AutoReconnect:
+            time.sleep(self._reconnect_timeout)
+            return self.get_checkpoint_version()
+
+        version = checkpoint_obj.get("version", 0) \
+            if checkpoint_obj is not None \
+            else 0
+        return version
+
+    def del_checkpoint(self, filename="checkpoint"):
         id_ = self._checkpoint_collection.find_one(
             {
-                "filename": "checkpoint"
+                "filename": filename
             }
         )._id
         self._checkpoint_collection.delete(id_)
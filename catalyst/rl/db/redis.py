@@ -1,3 +1,6 @@
+import threading
+import time
+
 from redis import Redis
 
 from catalyst.rl import utils
@@ -6,17 +9,57 @@ from catalyst.rl.core import DBSpec
 
 class RedisDB(DBSpec):
     def __init__(
-        self, host="127.0.0.1", port=12000, prefix=None, sync_epoch=False
+        self,
+        host="127.0.0.1",
+        port=12000,
+        prefix=None,
+        sync_epoch=False,
+        max_payload_size=int(64e6),
     ):
         self._server = Redis(host=host, port=port)
         self._prefix = "" if prefix is None else prefix
+        # max size in bytes of one bulk push or pull request
+        self._max_payload_size = max_payload_size
 
         self._index = 0
         self._epoch = 0
         self._sync_epoch = sync_epoch
 
+        # pubsub connections are not thread-safe,
+        # so each thread gets its own subscriptions
+        self._local = threading.local()
+        self._messages_channel = f"{self._prefix}_messages"
+        self._trajectories_channel = "trajectories_updates"
+
+    def _get_pubsub(self, channel):
+        pubsubs = getattr(self._local, "pubsubs", None)
+        if pubsubs is None:
+            pubsubs = self._local.pubsubs = {}
+        pubsub = pubsubs.get(channel)
+        if pubsub is None:
+            pubsub = self._server.pubsub()
+            pubsub.subscribe(channel)
+            pubsubs[channel] = pubsub
+        return pubsub
+
+    def _wait_for_notification(self, pubsub, timeout):
+        deadline = time.time() + timeout
+        notified = False
+        while not notified:
+            message = pubsub.get_message(
+                timeout=max(deadline - time.time(), 0)
+            )
+            if message is None:
+                break
+            notified = message["type"] == "message"
+        # several notifications could be queued, one wake up is enough
+        while pubsub.get_message() is not None:
+            pass
+        return notified
+
     def _set_flag(self, key, value):
         self._server.set(f"{self._prefix}_{key}", value)
+        self._server.publish(self._messages_channel, key)
 
     def _get_flag(self, key, default=None):
         flag = self._server.get(f"{self._prefix}_{key}")
@@ -57,47 +100,139 @@ class RedisDB(DBSpec):
         else:
             raise NotImplementedError("unknown message", message)
 
-    def put_trajectory(self, trajectory, raw=False):
+    def wait_for_message(self, timeout: float = 1.0) -> bool:
+        pubsub = self._get_pubsub(self._messages_channel)
+        return self._wait_for_notification(pubsub, timeout)
+
+    def wait_for_trajectory(self, timeout: float = 1.0) -> bool:
+        # subscribe first, so no notification is lost after the check
+        pubsub = self._get_pubsub(self._trajectories_channel)
+        if self._server.llen("trajectories") > self._index:
+            return True
+        return self._wait_for_notification(pubsub, timeout)
+
+    def _pack_trajectory(self, trajectory):
         trajectory = utils.structed2dict_trajectory(trajectory)
         trajectory = {"trajectory": trajectory, "epoch": self._epoch}
         trajectory = utils.pack(trajectory)
+        return trajectory
+
+    def _unpack_trajectory(self, trajectory):
+        trajectory = utils.unpack(trajectory)
+        trajectory, trajectory_epoch = \
+            trajectory["trajectory"], trajectory["epoch"]
+        if self._sync_epoch and self._epoch != trajectory_epoch:
+            trajectory = None
+        else:
+            trajectory = utils.dict2structed_trajectory(trajectory)
+        return trajectory
+
+    def put_trajectory(self, trajectory, raw=False):
+        trajectory = self._pack_trajectory(trajectory)
         name = "raw_trajectories" if raw else "trajectories"
         self._server.rpush(name, trajectory)
+        if not raw:
+            self._server.publish(self._trajectories_channel, 1)
+
+    def put_trajectories(self, trajectories, raw=False):
+        name = "raw_trajectories" if raw else "trajectories"
+        pipeline = self._server.pipeline(transaction=False)
+        chunk, chunk_size = [], 0
+        for trajectory in trajectories:
+            trajectory = self._pack_trajectory(trajectory)
+            if len(chunk) > 0 \
+                    and chunk_size + len(trajectory) > self._max_payload_size:
+                self._push_chunk(pipeline, name, chunk, raw)
+                chunk, chunk_size = [], 0
+            chunk.append(trajectory)
+            chunk_size += len(trajectory)
+
+        if len(chunk) > 0:
+            self._push_chunk(pipeline, name, chunk, raw)
+
+    def _push_chunk(self, pipeline, name, chunk, raw):
+        pipeline.rpush(name, *chunk)
+        if not raw:
+            # consumers start reading while the next chunks are packed
+            pipeline.publish(self._trajectories_channel, len(chunk))
+        pipeline.execute()
 
     def get_trajectory(self, index=None):
         index = index if index is not None else self._index
         trajectory = self._server.lindex("trajectories", index)
         if trajectory is not None:
             self._index = index + 1
-
-            trajectory = utils.unpack(trajectory)
-            trajectory, trajectory_epoch = \
-                trajectory["trajectory"], trajectory["epoch"]
-            if self._sync_epoch and self._epoch != trajectory_epoch:
-                trajectory = None
-            else:
-                trajectory = utils.dict2structed_trajectory(trajectory)
+            trajectory = self._unpack_trajectory(trajectory)
 
         return trajectory
 
+    def get_trajectories(self, max_num=None):
+        # redis does not report the sizes of the list items,
+        # so they are read in windows sized by the average item size,
+        # until about ``max_payload_size`` bytes are read
+        trajectories, payload_size, window = [], 0, 1
+        while payload_size < self._max_payload_size:
+            if max_num is not None:
+                window = min(window, max_num - len(trajectories))
+                if window <= 0:
+                    break
+            start = self._index + len(trajectories)
+            items = self._server.lrange(
+                "trajectories", start, start + window - 1
+            )
+            trajectories.extend(items)
+            payload_size += sum(len(item) for item in items)
+            if len(items) < window:
+                break
+            window = max(
+                int(
+                    (self._max_payload_size - payload_size) *
+                    len(trajectories) / payload_size
+                ), 1
+            )
+        self._index += len(trajectories)
+
+        trajectories = [
+            self._unpack_trajectory(trajectory) for trajectory in trajectories
+        ]
+        trajectories = [
+            trajectory for trajectory in trajectories
+            if trajectory is not None
+        ]
+        return trajectories
+
     def del_trajectory(self):
         self._server.delete("trajectories")
         self._index = 0
 
-    def put_checkpoint(self, checkpoint, epoch):
+    def put_checkpoint(self, checkpoint, epoch, keyframe=False):
         self._epoch = epoch
         checkpoint = {"checkpoint": checkpoint, "epoch": self._epoch}
         checkpoint = utils.pack(checkpoint)
-        self._server.set(f"{self._prefix}_checkpoint", checkpoint)
-
-    def get_checkpoint(self):
-        checkpoint = self._server.get(f"{self._prefix}_checkpoint")
+        # the version and the checkpoint are updated atomically
+        pipeline = self._server.pipeline(transaction=True)
+        pipeline.set(f"{self._prefix}_checkpoint", checkpoint)
+        if keyframe:
+            pipeline.set(f"{self._prefix}_checkpoint_keyframe", checkpoint)
+        pipeline.incr(f"{self._prefix}_checkpoint_version")
+        pipeline.publish(self._messages_channel, "checkpoint")
+        pipeline.execute()
+
+    def get_checkpoint(self, keyframe=False):
+        name = "checkpoint_keyframe" if keyframe else "checkpoint"
+        checkpoint = self._server.get(f"{self._prefix}_{name}")
         if checkpoint is None:
             return None
         checkpoint = utils.unpack(checkpoint)
-        self._epoch = checkpoint.get("epoch")
+        if not keyframe:
+            self._epoch = checkpoint.get("epoch")
         return checkpoint["checkpoint"]
 
+    def get_checkpoint_version(self) -> int:
+        version = self._server.get(f"{self._prefix}_checkpoint_version")
+        version = int(version) if version is not None else 0
+        return version
+
     def del_checkpoint(self):
         self._server.delete(f"{self._prefix}_weights")
 
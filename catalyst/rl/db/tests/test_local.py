@@ -0,0 +1,111 @@
+import os
+
+import numpy as np
+
+from catalyst.rl.db.local import _get_default_path, LocalDB
+
+
+def _get_trajectory(value):
+    observations = np.full((3, 2), value, dtype=np.float32)
+    actions = np.full((3, ), value, dtype=np.int64)
+    rewards = np.full((3, ), value, dtype=np.float32)
+    dones = np.array([False, False, True])
+    return observations, actions, rewards, dones
+
+
+def _get_values(trajectories):
+    return [int(trajectory[0][0, 0]) for trajectory in trajectories]
+
+
+def test_put_get(tmp_path):
+    sampler = LocalDB(path=str(tmp_path), prefix="test")
+    trainer = LocalDB(path=str(tmp_path), prefix="test")
+
+    sampler.put_trajectory(_get_trajectory(0))
+    sampler.put_trajectories([_get_trajectory(1), _get_trajectory(2)])
+    assert trainer.num_trajectories == 3
+    assert trainer.wait_for_trajectory(timeout=0.0)
+
+    trajectories = trainer.get_trajectories()
+    assert _get_values(trajectories) == [0, 1, 2]
+    for array, expected in zip(trajectories[1], _get_trajectory(1)):
+        assert np.array_equal(array, expected)
+    assert trainer.get_trajectory() is None
+    assert not trainer.wait_for_trajectory(timeout=0.0)
+
+    trainer.del_trajectory()
+    assert trainer.num_trajectories == 0
+    sampler.put_trajectory(_get_trajectory(3))
+    assert _get_values([trainer.get_trajectory()]) == [3]
+
+
+def test_out_of_order_writes(tmp_path):
+    slow_sampler = LocalDB(path=str(tmp_path))
+    fast_sampler = LocalDB(path=str(tmp_path))
+    trainer = LocalDB(path=str(tmp_path))
+
+    # the slow sampler has reserved the index, but has not written yet
+    index = slow_sampler._reserve_indices("trajectories", 1)
+    fast_sampler.put_trajectory(_get_trajectory(1))
+    assert trainer.get_trajectories() == []
+    assert not trainer.wait_for_trajectory(timeout=0.0)
+
+    slow_sampler._write(
+        slow_sampler._get_trajectory_path("trajectories", index),
+        slow_sampler._pack_trajectory(_get_trajectory(0))
+    )
+    assert _get_values(trainer.get_trajectories()) == [0, 1]
+
+
+def test_skip_abandoned_index(tmp_path):
+    dead_sampler = LocalDB(path=str(tmp_path))
+    sampler = LocalDB(path=str(tmp_path))
+    trainer = LocalDB(path=str(tmp_path), hole_timeout=0.05)
+
+    dead_sampler._reserve_indices("trajectories", 1)
+    sampler.put_trajectory(_get_trajectory(1))
+    assert trainer.get_trajectories() == []
+
+    assert trainer.wait_for_trajectory(timeout=1.0)
+    assert _get_values(trainer.get_trajectories()) == [1]
+
+    # the next reserved index waits for the timeout again
+    dead_sampler._reserve_indices("trajectories", 1)
+    sampler.put_trajectory(_get_trajectory(2))
+    assert trainer.get_trajectories() == []
+
+
+def test_checkpoint(tmp_path):
+    trainer = LocalDB(path=str(tmp_path), prefix="test")
+    sampler = LocalDB(path=str(tmp_path), prefix="test")
+    assert sampler.get_checkpoint() is None
+    assert sampler.get_checkpoint_version() == 0
+
+    weights = {"actor": {"weight": np.arange(6, dtype=np.float32)}}
+    trainer.put_checkpoint(weights, epoch=1, keyframe=True)
+    delta = {"actor": {"weight": np.ones(6, dtype=np.float32)}}
+    trainer.put_checkpoint(delta, epoch=2)
+    assert sampler.get_checkpoint_version() == 2
+
+    checkpoint = sampler.get_checkpoint(keyframe=True)
+    assert np.array_equal(
+        checkpoint["actor"]["weight"], weights["actor"]["weight"]
+    )
+    checkpoint = sampler.get_checkpoint()
+    assert np.array_equal(
+        checkpoint["actor"]["weight"], delta["actor"]["weight"]
+    )
+    assert sampler.epoch == 2
+
+    # the other agents do not see the checkpoint
+    other = LocalDB(path=str(tmp_path), prefix="other")
+    assert other.get_checkpoint() is None
+    assert other.get_checkpoint_version() == 0
+
+    trainer.del_checkpoint()
+    assert sampler.get_checkpoint() is None
+
+
+def test_default_path():
+    assert _get_default_path("first") != _get_default_path("second")
+    assert os.path.basename(_get_default_path(None)) == "default"
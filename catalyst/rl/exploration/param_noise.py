@@ -8,61 +8,135 @@ from catalyst.rl.utils import get_network_weights, set_network_weights
 EPS = 1e-6
 
 
+def _get_distances(actor, states, orig_actions, weights, noise, sigmas):
+    """
+    Computes the distance between the non-perturbed and perturbed policy
+    for each noise magnitude in ``sigmas``.
+    All the perturbed actors are evaluated in one batched forward
+    if ``torch.func`` is available.
+    """
+    def _get_weights(sigma):
+        return {
+            key: weight + sigma * noise[key]
+            for key, weight in weights.items()
+        }
+
+    if hasattr(torch, "func"):
+        stacked_weights = {
+            key: weight.unsqueeze(0)
+            + sigmas.view(-1, *[1] * weight.dim()) * noise[key]
+            for key, weight in weights.items()
+        }
+        new_actions = torch.func.vmap(
+            lambda weights_: torch.func.functional_call(
+                actor, weights_, (states, )
+            ),
+            randomness="different",
+        )(stacked_weights)
+    else:
+        new_actions = []
+        for sigma in sigmas.tolist():
+            set_network_weights(actor, _get_weights(sigma), strict=False)
+            new_actions.append(actor(states))
+        new_actions = torch.stack(new_actions)
+
+    distances = (new_actions - orig_actions) \
+        .flatten(start_dim=2).pow(2).sum(2).sqrt().mean(1)
+    return distances.tolist()
+
+
+@torch.no_grad()
 def _set_params_noise(
-    actor, states, noise_delta=0.2, tol=1e-3, max_steps=1000
+    actor,
+    states,
+    noise_delta=0.2,
+    tol=1e-3,
+    max_steps=1000,
+    sigma=None,
+    num_candidates=16,
 ):
     """
     Perturbs parameters of the policy represented by the actor network.
-    Binary search is employed to find the appropriate magnitude of the noise
+    Search is employed to find the appropriate magnitude of the noise
     corresponding to the desired distance measure (noise_delta) between
     non-perturbed and perturbed policy.
 
+    The noise is sampled once and scaled by the candidate magnitudes,
+    ``num_candidates`` of them are evaluated at each step
+    in one batched forward, and the interval with the desired distance
+    is split further, so a few steps are usually enough.
+
     Args:
         actor: torch.nn.Module, neural network which represents actor
         states: batch of states to estimate the distance measure between the
             non-perturbed and perturbed policy
         noise_delta: float, parameter noise threshold value
-        tol: float, controls the tolerance of binary search
-        max_steps: maximum number of steps in binary search
+        tol: float, controls the tolerance of search
+        max_steps: maximum number of steps in search
+        sigma: float, noise magnitude found previously to start search from
+        num_candidates: number of noise magnitudes evaluated at each step
+
+    Returns:
+        tuple: distance measure and noise magnitude of the perturbed policy
     """
     if states is None:
-        return noise_delta
+        return noise_delta, sigma
 
     exclude_norm = True
     orig_weights = get_network_weights(actor, exclude_norm=exclude_norm)
+    orig_weights = {
+        key: weight
+        for key, weight in orig_weights.items() if weight.is_floating_point()
+    }
     orig_actions = actor(states)
+    noise = {
+        key: torch.randn_like(weight)
+        for key, weight in orig_weights.items()
+    }
 
-    sigma_min = 0.
     sigma_max = 100.
-    sigma = sigma_max
+    sigma_low = 0.
+    sigma_high = sigma_max if sigma is None else min(2 * sigma, sigma_max)
+    best_sigma, best_distance = 0., 0.
 
     for step in range(max_steps):
-        noise_dist = torch.distributions.normal.Normal(0, sigma)
-        weights = {
-            key: w.clone() + noise_dist.sample(w.shape)
-            for key, w in orig_weights.items()
-        }
-        set_network_weights(actor, weights, strict=not exclude_norm)
-
-        new_actions = actor(states)
-        distance = \
-            (new_actions - orig_actions).pow(2).sum(1).sqrt().mean().item()
+        sigmas = torch.linspace(sigma_low, sigma_high, num_candidates + 1)
+        sigmas = sigmas[1:].to(orig_actions.device)
+        distances = _get_distances(
+            actor, states, orig_actions, orig_weights, noise, sigmas
+        )
+        sigmas = sigmas.tolist()
 
-        distance_mismatch = distance - noise_delta
+        mismatches = [abs(distance - noise_delta) for distance in distances]
+        index = int(np.argmin(mismatches))
+        if mismatches[index] < np.abs(best_distance - noise_delta):
+            best_sigma, best_distance = sigmas[index], distances[index]
 
         # the difference between current distance
         # and desired distance is too small
-        if np.abs(distance_mismatch) < tol:
+        if mismatches[index] < tol:
             break
-        # too big sigma
-        if distance_mismatch > 0:
-            sigma_max = sigma
-        # too small sigma
+
+        too_big = [i for i, x in enumerate(distances) if x > noise_delta]
+        # too small sigmas
+        if len(too_big) == 0:
+            if sigma_high >= sigma_max:
+                break
+            sigma_low, sigma_high = sigma_high, sigma_max
+        # the desired distance is between the neighbours
         else:
-            sigma_min = sigma
-        sigma = sigma_min + (sigma_max - sigma_min) / 2
+            index = too_big[0]
+            if index > 0:
+                sigma_low = sigmas[index - 1]
+            sigma_high = sigmas[index]
+
+    weights = {
+        key: weight + best_sigma * noise[key]
+        for key, weight in orig_weights.items()
+    }
+    set_network_weights(actor, weights, strict=False)
 
-    return distance
+    return best_distance, best_sigma
 
 
 class ParameterSpaceNoise(ExplorationStrategy):
@@ -72,21 +146,33 @@ class ParameterSpaceNoise(ExplorationStrategy):
     forcing it to produce more diverse actions.
     Paper: https://arxiv.org/abs/1706.01905
     """
-    def __init__(self, target_sigma, tolerance=1e-3, max_steps=1000):
+    def __init__(
+        self, target_sigma, tolerance=1e-3, max_steps=1000, num_candidates=16
+    ):
         super().__init__()
 
         self.target_sigma = target_sigma
         self.tol = tolerance
         self.max_steps = max_steps
+        self.num_candidates = num_candidates
+        # noise magnitude of the previous episode, to start search from
+        self._sigma = None
 
     def set_power(self, value):
         super().set_power(value)
         self.target_sigma *= self._power
 
     def update_actor(self, actor, states):
-        return _set_params_noise(
-            actor, states, self.target_sigma, self.tol, self.max_steps
+        distance, self._sigma = _set_params_noise(
+            actor,
+            states,
+            self.target_sigma,
+            self.tol,
+            self.max_steps,
+            sigma=self._sigma,
+            num_candidates=self.num_candidates,
         )
+        return distance
 
     def get_action(self, action):
         return action
@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+from gym.spaces import Box
+import pytest
+import torch
+
+from catalyst.rl.exploration import param_noise
+from catalyst.rl.registry import AGENTS
+from catalyst.rl.utils import get_network_weights, set_network_weights
+
+NOISE_DELTA = 0.2
+TOL = 1e-3
+
+
+def _get_actor():
+    env_spec = SimpleNamespace(
+        observation_space=Box(-1, 1, (4, )),
+        state_space=Box(-1, 1, (1, 4)),
+        action_space=Box(-1, 1, (2, )),
+    )
+    net_params = {
+        "features": [32],
+        "use_bias": False,
+        "normalization": "LayerNorm",
+        "activation": "ReLU",
+    }
+    torch.manual_seed(0)
+    return AGENTS.get_from_params(
+        agent="Actor",
+        env_spec=env_spec,
+        state_net_params={
+            "observation_net_params": {
+                "_network_type": "linear",
+                "history_len": 1,
+                **net_params,
+            },
+            "main_net_params": net_params,
+        },
+        policy_head_params={
+            "in_features": 32,
+            "policy_type": None,
+            "out_activation": "Tanh",
+        },
+    )
+
+
+def _get_distance(actor, states, orig_actions):
+    with torch.no_grad():
+        actions = actor(states)
+    return (actions - orig_actions).pow(2).sum(1).sqrt().mean().item()
+
+
+def _count_steps(monkeypatch):
+    steps = []
+    get_distances = param_noise._get_distances
+
+    def _get_distances(*args, **kwargs):
+        steps.append(None)
+        return get_distances(*args, **kwargs)
+
+    monkeypatch.setattr(param_noise, "_get_distances", _get_distances)
+    return steps
+
+
+@pytest.mark.parametrize("vmap", [True, False])
+def test_set_params_noise(monkeypatch, vmap):
+    if not vmap:
+        # the fallback without ``torch.func``
+        monkeypatch.delattr(torch, "func", raising=False)
+    steps = _count_steps(monkeypatch)
+    actor = _get_actor()
+    orig_weights = get_network_weights(actor)
+    states = torch.randn(64, 1, 4, generator=torch.Generator().manual_seed(0))
+    with torch.no_grad():
+        orig_actions = actor(states)
+
+    torch.manual_seed(1)
+    distance, sigma = param_noise._set_params_noise(
+        actor, states, noise_delta=NOISE_DELTA, tol=TOL
+    )
+    assert abs(distance - NOISE_DELTA) < TOL
+    # the actor is perturbed with the found noise
+    assert _get_distance(actor, states, orig_actions) \
+        == pytest.approx(distance, abs=1e-5)
+    num_steps = len(steps)
+
+    # the next episode search starts from the found magnitude
+    set_network_weights(actor, orig_weights)
+    del steps[:]
+    torch.manual_seed(2)
+    distance, _ = param_noise._set_params_noise(
+        actor, states, noise_delta=NOISE_DELTA, tol=TOL, sigma=sigma
+    )
+    assert abs(distance - NOISE_DELTA) < TOL
+    assert _get_distance(actor, states, orig_actions) \
+        == pytest.approx(distance, abs=1e-5)
+    assert len(steps) <= num_steps
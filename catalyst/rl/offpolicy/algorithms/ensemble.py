@@ -0,0 +1,102 @@
+from typing import Dict, List  # isort:skip
+
+import torch
+
+from catalyst.rl import utils
+from catalyst.rl.agent import EnsembleCritic
+
+
+class EnsembleCriticsMixin:
+    """
+    Evaluates and updates all the ``critics``
+    of the multi-critic algorithms at once with ``EnsembleCritic``,
+    if ``fused_critics`` is enabled.
+    ``critics`` keep the weights only for the checkpoints.
+    """
+    def _init_critics_ensemble(self, fused_critics: bool = False):
+        self._fused_critics = fused_critics
+        if not self._fused_critics:
+            return
+
+        self.critics_ensemble = EnsembleCritic(self.critics)
+        self.target_critics_ensemble = EnsembleCritic(self.target_critics)
+        critics_components = utils.get_trainer_components(
+            agent=self.critics_ensemble,
+            loss_params=None,
+            optimizer_params=self._critic_optimizer_params,
+            scheduler_params=self._critic_scheduler_params,
+            grad_clip_params=None
+        )
+        self.critics_ensemble_optimizer = critics_components["optimizer"]
+        self.critics_ensemble_scheduler = critics_components["scheduler"]
+
+    def _critics_forward(
+        self, states, actions, target: bool = False
+    ) -> List[torch.Tensor]:
+        if self._fused_critics:
+            critics = self.target_critics_ensemble \
+                if target \
+                else self.critics_ensemble
+            # [num_critics; ...] -> {num_critics} * [...]
+            return critics(states, actions).unbind(dim=0)
+
+        critics = self.target_critics if target else self.critics
+        return [x(states, actions) for x in critics]
+
+    def _pack_critics_ensemble(
+        self, checkpoint: Dict, with_optimizer: bool = True
+    ) -> None:
+        if not (self._fused_critics and with_optimizer):
+            return
+
+        key = "critics_ensemble"
+        for key2 in ["optimizer", "scheduler"]:
+            key2 = f"{key}_{key2}"
+            value2 = getattr(self, key2, None)
+            if value2 is not None:
+                checkpoint[f"{key2}_state_dict"] = value2.state_dict()
+
+    def _unpack_critics_ensemble(
+        self, checkpoint: Dict, with_optimizer: bool = True
+    ) -> None:
+        if not self._fused_critics:
+            return
+
+        self.critics_ensemble.load_from_critics(self.critics)
+        if with_optimizer:
+            key = "critics_ensemble"
+            for key2 in ["optimizer", "scheduler"]:
+                key2 = f"{key}_{key2}"
+                value_l = getattr(self, key2, None)
+                value_r = checkpoint.get(f"{key2}_state_dict")
+                if value_l is not None and value_r is not None:
+                    value_l.load_state_dict(value_r)
+
+    def _fused_critic_update(self, loss: List[torch.Tensor]) -> Dict:
+        self.critics_ensemble.zero_grad()
+        self.critics_ensemble_optimizer.zero_grad()
+        # the critics losses are independent,
+        # so the gradients of the sum are the per-critic ones
+        torch.sum(torch.stack(loss)).backward()
+        if self.critic_grad_clip_fn is not None:
+            # every critic is clipped separately, as without the ensemble
+            for i in range(self.critics_ensemble.num_critics):
+                self.critic_grad_clip_fn(
+                    self.critics_ensemble.critic_parameters(i)
+                )
+        self.critics_ensemble_optimizer.step()
+        metrics = {}
+        if self.critics_ensemble_scheduler is not None:
+            self.critics_ensemble_scheduler.step()
+            lr = self.critics_ensemble_scheduler.get_lr()[0]
+            metrics = {f"lr_critic{i}": lr for i in range(len(loss))}
+        return metrics
+
+    def _fused_target_critic_update(self) -> None:
+        utils.soft_update(
+            self.target_critics_ensemble, self.critics_ensemble,
+            self._critic_tau
+        )
+
+
+__all__ = ["EnsembleCriticsMixin"]
@@ -8,9 +8,10 @@ from catalyst.rl import utils
 from catalyst.rl.core import AlgorithmSpec, CriticSpec, EnvironmentSpec
 from catalyst.rl.registry import AGENTS
 from .actor_critic import OffpolicyActorCritic
+from .ensemble import EnsembleCriticsMixin
 
 
-class TD3(OffpolicyActorCritic):
+class TD3(EnsembleCriticsMixin, OffpolicyActorCritic):
     """
     Swiss Army knife TD3 algorithm.
     """
@@ -19,6 +20,7 @@ class TD3(OffpolicyActorCritic):
         critics: List[CriticSpec],
         action_noise_std: float = 0.2,
         action_noise_clip: float = 0.5,
+        fused_critics: bool = False,
     ):
         self.action_noise_std = action_noise_std
         self.action_noise_clip = action_noise_clip
@@ -44,6 +46,8 @@ class TD3(OffpolicyActorCritic):
         self.critics_scheduler = [self.critic_scheduler] + critics_scheduler
         self.target_critics = [self.target_critic] + target_critics
 
+        self._init_critics_ensemble(fused_critics)
+
         # value distribution approximation
         critic_distribution = self.critic.distribution
         self._loss_fn = self._base_loss
@@ -112,9 +116,8 @@ class TD3(OffpolicyActorCritic):
         actions_tp0 = self.actor(states_t)
         # For now we use the same actions for each head
         # {num_critics} * [bs; num_heads; 1]
-        q_values_tp0 = [
-            x(states_t, actions_tp0).squeeze_(dim=3) for x in self.critics
-        ]
+        q_values_tp0 = self._critics_forward(states_t, actions_tp0)
+        q_values_tp0 = [x.squeeze(dim=3) for x in q_values_tp0]
         # {num_critics} * [bs; num_heads; 1] -> concat
         # [bs; num_heads, num_critics] -> many-heads view transform
         # [{bs * num_heads}; num_critics] ->   min over all critics
@@ -133,13 +136,14 @@ class TD3(OffpolicyActorCritic):
         # {num_critics} * [bs; num_heads; 1, 1]
         # -> many-heads view transform
         # {num_critics} * [{bs * num_heads}; 1]
-        q_values_t = [x(states_t, actions_t).view(-1, 1) for x in self.critics]
+        q_values_t = self._critics_forward(states_t, actions_t)
+        q_values_t = [x.view(-1, 1) for x in q_values_t]
 
         # {num_critics} * [bs; num_heads; 1]
-        q_values_tp1 = [
-            x(states_tp1, actions_tp1).squeeze_(dim=3)
-            for x in self.target_critics
-        ]
+        q_values_tp1 = self._critics_forward(
+            states_tp1, actions_tp1, target=True
+        )
+        q_values_tp1 = [x.squeeze(dim=3) for x in q_values_tp1]
         # {num_critics} * [bs; num_heads; 1] -> concat
         # [bs; num_heads; num_critics] -> min over all critics
         # [bs; num_heads; 1]
@@ -171,9 +175,9 @@ class TD3(OffpolicyActorCritic):
         # {num_critics} * [bs; num_heads; num_atoms]
         # -> many-heads view transform
         # {num_critics} * [{bs * num_heads}; num_atoms]
+        logits_tp0 = self._critics_forward(states_t, actions_tp0)
         logits_tp0 = [
-            x(states_t, actions_tp0).squeeze_(dim=2).view(-1, self.num_atoms)
-            for x in self.critics
+            x.squeeze(dim=2).view(-1, self.num_atoms) for x in logits_tp0
         ]
         # -> categorical probs
         # {num_critics} * [{bs * num_heads}; num_atoms]
@@ -196,16 +200,16 @@ class TD3(OffpolicyActorCritic):
         # {num_critics} * [bs; num_heads; num_atoms]
         # -> many-heads view transform
         # {num_critics} * [{bs * num_heads}; num_atoms]
+        logits_t = self._critics_forward(states_t, actions_t)
         logits_t = [
-            x(states_t, actions_t).squeeze_(dim=2).view(-1, self.num_atoms)
-            for x in self.critics
+            x.squeeze(dim=2).view(-1, self.num_atoms) for x in logits_t
         ]
 
         # {num_critics} * [bs; num_heads; num_atoms]
-        logits_tp1 = [
-            x(states_tp1, actions_tp1).squeeze_(dim=2)
-            for x in self.target_critics
-        ]
+        logits_tp1 = self._critics_forward(
+            states_tp1, actions_tp1, target=True
+        )
+        logits_tp1 = [x.squeeze(dim=2) for x in logits_tp1]
         # {num_critics} * [{bs * num_heads}; num_atoms]
         probs_tp1 = [torch.softmax(x, dim=-1) for x in logits_tp1]
         # {num_critics} * [bs; num_heads; 1]
@@ -263,10 +267,8 @@ class TD3(OffpolicyActorCritic):
         # [bs; action_size]
         actions_tp0 = self.actor(states_t)
         # {num_critics} * [bs; num_heads; num_atoms; 1]
-        atoms_tp0 = [
-            x(states_t, actions_tp0).squeeze_(dim=2).unsqueeze_(-1)
-            for x in self.critics
-        ]
+        atoms_tp0 = self._critics_forward(states_t, actions_tp0)
+        atoms_tp0 = [x.squeeze(dim=2).unsqueeze(-1) for x in atoms_tp0]
         # [bs; num_heads, num_atoms; num_critics] -> many-heads view transform
         # [{bs * num_heads}; num_atoms; num_critics] ->  quantile value
         # [{bs * num_heads}; num_critics] ->  min over all critics
@@ -286,18 +288,15 @@ class TD3(OffpolicyActorCritic):
         # {num_critics} * [bs; num_heads; num_atoms]
         # -> many-heads view transform
         # {num_critics} * [{bs * num_heads}; num_atoms]
-        atoms_t = [
-            x(states_t, actions_t).squeeze_(dim=2).view(-1, self.num_atoms)
-            for x in self.critics
-        ]
+        atoms_t = self._critics_forward(states_t, actions_t)
+        atoms_t = [x.squeeze(dim=2).view(-1, self.num_atoms) for x in atoms_t]
 
         # [bs; num_heads; num_atoms; num_critics]
+        atoms_tp1 = self._critics_forward(
+            states_tp1, actions_tp1, target=True
+        )
         atoms_tp1 = torch.cat(
-            [
-                x(states_tp1, actions_tp1).squeeze_(dim=2).unsqueeze_(-1)
-                for x in self.target_critics
-            ],
-            dim=-1
+            [x.squeeze(dim=2).unsqueeze(-1) for x in atoms_tp1], dim=-1
         )
         # @TODO: smarter way to do this (other than reshaping)?
         # [{bs * num_heads}; ]
@@ -334,6 +333,9 @@ class TD3(OffpolicyActorCritic):
         return policy_loss, value_loss
 
     def pack_checkpoint(self, with_optimizer: bool = True):
+        if self._fused_critics:
+            self.critics_ensemble.copy_to_critics(self.critics)
+
         checkpoint = {}
 
         for key in ["actor", "critic"]:
@@ -359,6 +361,8 @@ class TD3(OffpolicyActorCritic):
                             value2_i = value2_i.state_dict()
                             checkpoint[f"{key2}{i}_state_dict"] = value2_i
 
+        self._pack_critics_ensemble(checkpoint, with_optimizer)
+
         return checkpoint
 
     def unpack_checkpoint(self, checkpoint, with_optimizer: bool = True):
@@ -375,11 +379,17 @@ class TD3(OffpolicyActorCritic):
                 for key2 in ["optimizer", "scheduler"]:
                     key2 = f"{key}_{key2}"
                     value_l = getattr(self, key2, None)
-                    if value_l is not None:
-                        value_r = checkpoint[f"{key2}_state_dict"]
+                    value_l = value_l[i] if value_l is not None else None
+                    value_r = checkpoint.get(f"{key2}{i}_state_dict")
+                    if value_l is not None and value_r is not None:
                         value_l.load_state_dict(value_r)
 
+        self._unpack_critics_ensemble(checkpoint, with_optimizer)
+
     def critic_update(self, loss):
+        if self._fused_critics:
+            return self._fused_critic_update(loss)
+
         metrics = {}
         for i in range(len(self.critics)):
             self.critics[i].zero_grad()
@@ -395,6 +405,9 @@ class TD3(OffpolicyActorCritic):
         return metrics
 
     def target_critic_update(self):
+        if self._fused_critics:
+            return self._fused_target_critic_update()
+
         for target, source in zip(self.target_critics, self.critics):
             utils.soft_update(target, source, self._critic_tau)
 
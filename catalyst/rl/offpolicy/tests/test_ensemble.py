@@ -0,0 +1,161 @@
+import copy
+from types import SimpleNamespace
+
+from gym.spaces import Box
+import pytest
+import torch
+
+from catalyst.rl.registry import OFFPOLICY_ALGORITHMS
+
+NUM_CRITICS = 3
+
+
+def _get_net_params(features, **kwargs):
+    return {
+        "features": features,
+        "use_bias": False,
+        "normalization": "LayerNorm",
+        "activation": "ReLU",
+        **kwargs,
+    }
+
+
+def _get_obs_net_params(features):
+    return _get_net_params(features, _network_type="linear", history_len=1)
+
+
+def _get_config(algorithm, fused_critics):
+    policy_type = "squashing-gauss" if algorithm == "SAC" else None
+    return {
+        "agents": {
+            "actor": {
+                "agent": "Actor",
+                "state_net_params": {
+                    "observation_net_params": _get_obs_net_params([16]),
+                    "main_net_params": _get_net_params([16]),
+                },
+                "policy_head_params": {
+                    "in_features": 16,
+                    "policy_type": policy_type,
+                    "out_activation": "Tanh",
+                },
+            },
+            "critic": {
+                "agent": "StateActionCritic",
+                "state_action_net_params": {
+                    "observation_net_params": _get_obs_net_params([16, 8]),
+                    "action_net_params": _get_net_params(
+                        [16, 8], _network_type="linear"
+                    ),
+                    "main_net_params": _get_net_params([16]),
+                },
+                "value_head_params": {
+                    "in_features": 16,
+                    "out_features": 1,
+                },
+            },
+        },
+        "algorithm": {
+            "n_step": 1,
+            "gamma": 0.99,
+            "actor_tau": 0.01,
+            "critic_tau": 0.01,
+            "num_critics": NUM_CRITICS,
+            "fused_critics": fused_critics,
+            "critic_loss_params": {
+                "criterion": "HuberLoss",
+                "clip_delta": 15.0,
+            },
+            "actor_optimizer_params": {
+                "optimizer": "SGD",
+                "lr": 0.1,
+            },
+            # adaptive optimizers hide the gradients scale,
+            # so the clipping differences are seen only with SGD
+            "critic_optimizer_params": {
+                "optimizer": "SGD",
+                "lr": 0.1,
+            },
+            "critic_grad_clip_params": {
+                "func": "clip_grad_norm_",
+                "max_norm": 0.05,
+            },
+        },
+    }
+
+
+def _get_env_spec():
+    return SimpleNamespace(
+        observation_space=Box(-1, 1, (2, )),
+        state_space=Box(-1, 1, (1, 2)),
+        action_space=Box(-1, 1, (2, )),
+    )
+
+
+def _get_algorithm(algorithm, fused_critics):
+    config = _get_config(algorithm, fused_critics)
+    torch.manual_seed(0)
+    return OFFPOLICY_ALGORITHMS.get(algorithm).prepare_for_trainer(
+        env_spec=_get_env_spec(), config=copy.deepcopy(config)
+    )
+
+
+def _get_batch(seed, batch_size=32):
+    generator = torch.Generator().manual_seed(seed)
+    return {
+        "state": torch.randn(batch_size, 1, 2, generator=generator),
+        "action": torch.rand(batch_size, 2, generator=generator) * 2 - 1,
+        "reward": torch.randn(batch_size, generator=generator),
+        "next_state": torch.randn(batch_size, 1, 2, generator=generator),
+        "done": (torch.rand(batch_size, generator=generator) > 0.9).float(),
+    }
+
+
+def _get_weights(checkpoint):
+    return {
+        (key, name): value
+        for key, state_dict in checkpoint.items()
+        if key.endswith("state_dict") and "optimizer" not in key
+        for name, value in state_dict.items()
+    }
+
+
+@pytest.mark.parametrize("algorithm", ["TD3", "SAC"])
+def test_fused_critics(algorithm):
+    """Fused critics are trained and saved as the separate ones"""
+    algorithms = [
+        _get_algorithm(algorithm, fused_critics=fused_critics)
+        for fused_critics in [False, True]
+    ]
+    for step in range(5):
+        metrics = []
+        for algorithm_ in algorithms:
+            # the same noise for the target actions
+            torch.manual_seed(step)
+            metrics.append(algorithm_.train(_get_batch(seed=step)))
+            algorithm_.target_critic_update()
+        assert metrics[0].keys() == metrics[1].keys()
+        for key in metrics[0]:
+            assert metrics[0][key] == pytest.approx(metrics[1][key], abs=1e-5)
+
+    weights, fused_weights = [
+        _get_weights(algorithm_.pack_checkpoint())
+        for algorithm_ in algorithms
+    ]
+    assert weights.keys() == fused_weights.keys()
+    for key, value in weights.items():
+        assert torch.allclose(value, fused_weights[key], atol=1e-5), key
+
+    # the checkpoint is loaded into the ensemble
+    checkpoint = algorithms[1].pack_checkpoint()
+    reloaded = _get_algorithm(algorithm, fused_critics=True)
+    reloaded.unpack_checkpoint(checkpoint)
+    batch = _get_batch(seed=0)
+    with torch.no_grad():
+        values, reloaded_values = [
+            torch.stack(algorithm_._critics_forward(
+                batch["state"], batch["action"]
+            ))
+            for algorithm_ in [algorithms[1], reloaded]
+        ]
+    assert torch.allclose(values, reloaded_values)
@@ -14,22 +14,31 @@ from catalyst.rl.core import DBSpec, TrainerSpec
 def _db2buffer_loop(
     db_server: DBSpec,
     buffer: utils.OffpolicyReplayBuffer,
+    buffer_event: threading.Event = None,
+    max_num_trajectories: int = 100,
 ):
-    trajectory = None
+    trajectories, trajectory = [], None
     while True:
         try:
             if trajectory is None:
-                trajectory = db_server.get_trajectory()
+                if len(trajectories) == 0:
+                    trajectories = db_server.get_trajectories(
+                        max_num=max_num_trajectories
+                    )
+                if len(trajectories) > 0:
+                    trajectory = trajectories.pop(0)
 
             if trajectory is not None:
                 if buffer.push_trajectory(trajectory):
                     trajectory = None
+                    if buffer_event is not None:
+                        buffer_event.set()
                 else:
                     time.sleep(1.0)
             else:
                 if not db_server.training_enabled:
                     return
-                time.sleep(1.0)
+                db_server.wait_for_trajectory(timeout=1.0)
         except Exception as ex:
             print("=" * 80)
             print("Something go wrong with trajectory:")
@@ -90,6 +99,7 @@ class OffpolicyTrainer(TrainerSpec):
         )
 
         self._db_loop_thread = None
+        self._buffer_event = threading.Event()
 
     def _start_db_loop(self):
         self._db_loop_thread = threading.Thread(
@@ -97,6 +107,7 @@ class OffpolicyTrainer(TrainerSpec):
             kwargs={
                 "db_server": self.db_server,
                 "buffer": self.replay_buffer,
+                "buffer_event": self._buffer_event,
             }
         )
         self._db_loop_thread.start()
@@ -130,7 +141,8 @@ class OffpolicyTrainer(TrainerSpec):
             self.last_epoch_transitions + self.min_transitions_per_epoch
         while expected_updates_per_sample > self.max_updates_per_sample \
                 or self.replay_buffer.num_transitions < min_epoch_transitions:
-            time.sleep(5.0)
+            self._buffer_event.wait(timeout=5.0)
+            self._buffer_event.clear()
             self.replay_buffer.recalculate_index()
             expected_num_updates = (
                 self.num_updates + len(self.loader) * self.loader.batch_size
@@ -157,25 +169,31 @@ class OffpolicyTrainer(TrainerSpec):
 
     def _fetch_initial_buffer(self):
         buffer_size = len(self.replay_buffer)
+        last_log_time = 0
         while buffer_size < self.min_num_transitions:
+            self._buffer_event.clear()
             self.replay_buffer.recalculate_index()
 
             num_trajectories = self.replay_buffer.num_trajectories
             num_transitions = self.replay_buffer.num_transitions
             buffer_size = len(self.replay_buffer)
 
-            metrics = [
-                f"fps: {0:7.1f}",
-                f"updates per sample: {0:7.1f}",
-                f"trajectories: {num_trajectories:09d}",
-                f"transitions: {num_transitions:09d}",
-                f"buffer size: "
-                f"{buffer_size:09d}/{self.min_num_transitions:09d}",
-            ]
-            metrics = " | ".join(metrics)
-            print(f"--- {metrics}")
-
-            time.sleep(1.0)
+            if time.time() - last_log_time >= 1.0 \
+                    or buffer_size >= self.min_num_transitions:
+                metrics = [
+                    f"fps: {0:7.1f}",
+                    f"updates per sample: {0:7.1f}",
+                    f"trajectories: {num_trajectories:09d}",
+                    f"transitions: {num_transitions:09d}",
+                    f"buffer size: "
+                    f"{buffer_size:09d}/{self.min_num_transitions:09d}",
+                ]
+                metrics = " | ".join(metrics)
+                print(f"--- {metrics}")
+                last_log_time = time.time()
+
+            if buffer_size < self.min_num_transitions:
+                self._buffer_event.wait(timeout=1.0)
 
     def _start_train_loop(self):
         self._start_db_loop()
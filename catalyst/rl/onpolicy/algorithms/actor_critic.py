@@ -1,4 +1,4 @@
-from typing import Dict, Union  # isort:skip
+from typing import Dict, List, Union  # isort:skip
 from copy import deepcopy
 
 from catalyst.rl import utils
@@ -188,6 +188,19 @@ class OnpolicyActorCritic(AlgorithmSpec):
     def get_rollout(self, states, actions, rewards, dones):
         raise NotImplementedError()
 
+    def get_rollouts(self, trajectories: List) -> List[Dict]:
+        """
+        Computes rollouts for several trajectories at once,
+        algorithms could override it to batch the computations
+
+        Args:
+            trajectories (List): ``(states, actions, rewards, dones)`` tuples
+
+        Returns:
+            List[Dict]: rollout of each trajectory
+        """
+        return [self.get_rollout(*trajectory) for trajectory in trajectories]
+
     def postprocess_buffer(self, buffers, len):
         raise NotImplementedError()
 
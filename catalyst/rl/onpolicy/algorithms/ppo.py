@@ -172,7 +172,7 @@ class PPO(OnpolicyActorCritic):
         }
 
     @torch.no_grad()
-    def get_rollout(self, states, actions, rewards, dones):
+    def _get_rollout_outputs(self, states, actions, rewards, dones):
         assert len(states) == len(actions) == len(rewards) == len(dones)
 
         trajectory_len = \
@@ -190,44 +190,47 @@ class PPO(OnpolicyActorCritic):
         values = values.cpu().numpy()[:trajectory_len + 1, ...]
         _, logprobs = self.actor(states, logprob=actions)
         logprobs = logprobs.cpu().numpy().reshape(-1)[:trajectory_len]
-        # len x num_heads
-        deltas = rewards[:, None, None] \
-            + self._gammas[:, None] * values[1:] - values[:-1]
-
-        # For each gamma in the list of gammas compute the
-        # advantage and returns
-        # len x num_heads x num_atoms
-        advantages = np.stack(
-            [
-                utils.geometric_cumsum(gamma * self.gae_lambda, deltas[:, i])
-                for i, gamma in enumerate(self._gammas)
-            ],
-            axis=1
-        )
-
-        # len x num_heads
-        returns = np.stack(
-            [
-                utils.geometric_cumsum(gamma, rewards[:, None])[:, 0]
-                for gamma in self._gammas
-            ],
-            axis=1
-        )
-
-        # final rollout
         dones = dones[:trajectory_len]
-        values = values[:trajectory_len]
-        assert len(logprobs) == len(advantages) \
-            == len(dones) == len(returns) == len(values)
-        rollout = {
-            "action_logprob": logprobs,
-            "advantage": advantages,
-            "done": dones,
-            "return": returns,
-            "value": values,
-        }
 
-        return rollout
+        return rewards, values, logprobs, dones
+
+    def get_rollout(self, states, actions, rewards, dones):
+        return self.get_rollouts([(states, actions, rewards, dones)])[0]
+
+    def get_rollouts(self, trajectories):
+        outputs = [
+            self._get_rollout_outputs(*trajectory)
+            for trajectory in trajectories
+        ]
+        rewards, values, logprobs, dones = zip(*outputs)
+
+        # all the trajectories are zero-padded to compute
+        # the advantages and returns for all gammas in one pass
+        # num_trajectories x max_len
+        rewards, lengths = utils.pad_sequences(rewards)
+        # num_trajectories x (max_len + 1) x num_heads x num_atoms
+        values_padded, _ = utils.pad_sequences(values, extra_len=1)
+        # num_trajectories x max_len x num_heads x num_atoms
+        advantages = utils.get_gae_advantages(
+            self._gammas, self.gae_lambda, rewards, values_padded, lengths
+        )
+        # num_trajectories x max_len x num_heads
+        returns = utils.get_discounted_returns(self._gammas, rewards, lengths)
+
+        # final rollouts
+        rollouts = []
+        for i, trajectory_len in enumerate(lengths):
+            rollout = {
+                "action_logprob": logprobs[i],
+                "advantage": advantages[i, :trajectory_len],
+                "done": dones[i],
+                "return": returns[i, :trajectory_len],
+                "value": values[i][:trajectory_len],
+            }
+            assert all(len(x) == trajectory_len for x in rollout.values())
+            rollouts.append(rollout)
+
+        return rollouts
 
     def postprocess_buffer(self, buffers, len):
         adv = buffers["advantage"][:len]
@@ -23,7 +23,7 @@ class REINFORCE(OnpolicyActor):
         }
 
     @torch.no_grad()
-    def get_rollout(self, states, actions, rewards, dones):
+    def _get_rollout_outputs(self, states, actions, rewards, dones):
         assert len(states) == len(actions) == len(rewards) == len(dones)
 
         trajectory_len = \
@@ -36,11 +36,34 @@ class REINFORCE(OnpolicyActor):
         _, logprobs = self.actor(states, logprob=actions)
         logprobs = logprobs.cpu().numpy().reshape(-1)[:trajectory_len]
 
-        returns = utils.geometric_cumsum(self.gamma, rewards[:, None])[:, 0]
+        return rewards, logprobs
 
-        assert len(returns) == len(logprobs)
-        rollout = {"return": returns, "action_logprob": logprobs}
-        return rollout
+    def get_rollout(self, states, actions, rewards, dones):
+        return self.get_rollouts([(states, actions, rewards, dones)])[0]
+
+    def get_rollouts(self, trajectories):
+        outputs = [
+            self._get_rollout_outputs(*trajectory)
+            for trajectory in trajectories
+        ]
+        rewards, logprobs = zip(*outputs)
+
+        # returns of all the zero-padded trajectories in one pass
+        rewards, lengths = utils.pad_sequences(rewards)
+        returns = utils.get_discounted_returns(
+            self.gamma, rewards, lengths
+        )[..., 0]
+
+        rollouts = []
+        for i, trajectory_len in enumerate(lengths):
+            assert len(logprobs[i]) == trajectory_len
+            rollouts.append(
+                {
+                    "return": returns[i, :trajectory_len],
+                    "action_logprob": logprobs[i]
+                }
+            )
+        return rollouts
 
     def postprocess_buffer(self, buffers, len):
         pass
@@ -1,5 +1,6 @@
 from typing import Dict  # isort:skip
-
+import queue
+import threading
 import time
 
 import numpy as np
@@ -8,7 +9,7 @@ import torch
 from torch.utils.data import DataLoader
 
 from catalyst.rl import utils
-from catalyst.rl.core import TrainerSpec
+from catalyst.rl.core import DBSpec, TrainerSpec
 
 
 def _get_states_from_observations(observations: np.ndarray, history_len=1):
@@ -43,18 +44,109 @@ def _get_states_from_observations(observations: np.ndarray, history_len=1):
     return states
 
 
+def _db2queue_loop(
+    db_server: DBSpec,
+    trajectories_queue: queue.Queue,
+    stop_event: threading.Event,
+    history_len: int = 1,
+):
+    """
+    Fetches trajectories from the DB, transforms observations into states
+    and puts them into the queue, until ``stop_event`` is set.
+    """
+    trajectories, trajectory = [], None
+    while not stop_event.is_set():
+        try:
+            if trajectory is None:
+                if len(trajectories) == 0:
+                    trajectories = db_server.get_trajectories(
+                        max_num=trajectories_queue.maxsize or None
+                    )
+                if len(trajectories) == 0:
+                    db_server.wait_for_trajectory(timeout=0.1)
+                    continue
+
+                trajectory = trajectories.pop(0)
+                observations, actions, rewards, dones = trajectory
+                states = _get_states_from_observations(
+                    observations, history_len
+                )
+                trajectory = states, actions, rewards, dones
+
+            trajectories_queue.put(trajectory, timeout=0.1)
+            trajectory = None
+        except queue.Full:
+            pass
+        except Exception as ex:
+            print("=" * 80)
+            print("Something go wrong with trajectory:")
+            print(ex)
+            print(trajectory)
+            print("=" * 80)
+            trajectory = None
+
+
 class OnpolicyTrainer(TrainerSpec):
     def _init(
         self,
         num_mini_epochs: int = 1,
         min_num_trajectories: int = 100,
-        rollout_batch_size: int = None
+        rollout_batch_size: int = None,
+        max_queue_size: int = None,
+        prefetch_trajectories: bool = False,
     ):
+        """
+        Args:
+            num_mini_epochs (int): number of passes over the rollout buffer
+            min_num_trajectories (int): number of trajectories
+                to collect before each epoch
+            rollout_batch_size (int): max number of states
+                for one ``get_rollout`` call
+            max_queue_size (int): max number of fetched trajectories
+                waiting for the rollout computation,
+                ``min_num_trajectories`` by default
+            prefetch_trajectories (bool): if ``True``, samplers are not
+                stopped during the optimization and the trajectories
+                for the next epoch are fetched in the background,
+                so they lag behind the trained policy by one epoch
+        """
         super()._init()
         self.num_mini_epochs = num_mini_epochs
         self.min_num_trajectories = min_num_trajectories
         self.max_num_transitions = self.min_num_transitions * 3
         self.rollout_batch_size = rollout_batch_size
+        self.prefetch_trajectories = prefetch_trajectories
+
+        self._trajectories_queue = queue.Queue(
+            maxsize=max_queue_size or min_num_trajectories
+        )
+        self._db_loop_stop_event = threading.Event()
+        self._db_loop_thread = None
+
+    def _start_db_loop(self):
+        self._db_loop_stop_event.clear()
+        self._db_loop_thread = threading.Thread(
+            target=_db2queue_loop,
+            kwargs={
+                "db_server": self.db_server,
+                "trajectories_queue": self._trajectories_queue,
+                "stop_event": self._db_loop_stop_event,
+                "history_len": self.env_spec.history_len,
+            },
+            # does not keep the process alive if the trainer is interrupted
+            daemon=True,
+        )
+        self._db_loop_thread.start()
+
+    def _stop_db_loop(self):
+        if self._db_loop_thread is None:
+            return
+        self._db_loop_stop_event.set()
+        self._db_loop_thread.join()
+        self._db_loop_thread = None
+        # drop trajectories collected with the outdated policy
+        while not self._trajectories_queue.empty():
+            self._trajectories_queue.get_nowait()
 
     def _get_rollout_in_batches(self, states, actions, rewards, dones):
 
@@ -81,10 +173,16 @@ class OnpolicyTrainer(TrainerSpec):
 
         return rollout
 
-    def _fetch_trajectories(self):
+    def _get_rollouts(self, trajectories):
+        if self.rollout_batch_size is None:
+            return self.algorithm.get_rollouts(trajectories)
 
-        # cleanup trajectories
-        self.db_server.del_trajectory()
+        return [
+            self._get_rollout_in_batches(*trajectory)
+            for trajectory in trajectories
+        ]
+
+    def _fetch_trajectories(self):
         num_trajectories = 0
         num_transitions = 0
         del self.replay_buffer
@@ -97,6 +195,11 @@ class OnpolicyTrainer(TrainerSpec):
             **rollout_spec
         )
 
+        if self._db_loop_thread is None:
+            # cleanup trajectories
+            self.db_server.del_trajectory()
+            self._start_db_loop()
+
         # start samplers
         self.db_server.push_message(self.db_server.Message.ENABLE_SAMPLING)
 
@@ -123,31 +226,41 @@ class OnpolicyTrainer(TrainerSpec):
             )
 
             try:
-                trajectory = self.db_server.get_trajectory()
-                assert trajectory is not None
-            except AssertionError:
-                time.sleep(1.0)
+                trajectories = [self._trajectories_queue.get(timeout=1.0)]
+            except queue.Empty:
                 continue
-
             num_trajectories += 1
-            num_transitions += len(trajectory[-1])
+            num_transitions += len(trajectories[-1][-1])
+
+            # the trajectories, which are already fetched and decoded
+            # by the db loop thread, are processed together
+            while num_trajectories < self.min_num_trajectories \
+                    and num_transitions < self.min_num_transitions:
+                try:
+                    trajectories.append(self._trajectories_queue.get_nowait())
+                except queue.Empty:
+                    break
+                num_trajectories += 1
+                num_transitions += len(trajectories[-1][-1])
+
+            # the next trajectories are fetched
+            # by the db loop thread, while the rollouts are computed here
+            rollouts = self._get_rollouts(trajectories)
+            for (states, actions, rewards, _), rollout \
+                    in zip(trajectories, rollouts):
+                self.replay_buffer.push_rollout(
+                    state=states,
+                    action=actions,
+                    reward=rewards,
+                    **rollout,
+                )
 
-            observations, actions, rewards, dones = trajectory
-            states = _get_states_from_observations(
-                observations, self.env_spec.history_len
-            )
-            rollout = self._get_rollout_in_batches(
-                states, actions, rewards, dones
+        if not self.prefetch_trajectories:
+            # stop samplers
+            self.db_server.push_message(
+                self.db_server.Message.DISABLE_SAMPLING
             )
-            self.replay_buffer.push_rollout(
-                state=states,
-                action=actions,
-                reward=rewards,
-                **rollout,
-            )
-
-        # stop samplers
-        self.db_server.push_message(self.db_server.Message.DISABLE_SAMPLING)
+            self._stop_db_loop()
 
         self._num_trajectories += num_trajectories
         self._num_transitions += num_transitions
@@ -189,15 +302,15 @@ class OnpolicyTrainer(TrainerSpec):
     def _run_train_stage(self):
         self.db_server.push_message(self.db_server.Message.ENABLE_TRAINING)
         epoch_limit = self._epoch_limit or np.iinfo(np.int32).max
-        while self.epoch < epoch_limit:
-            try:
+        try:
+            while self.epoch < epoch_limit:
                 # get trajectories
                 self._fetch_trajectories()
                 # train & update
                 self._run_epoch_loop()
-            except Exception as ex:
-                self.db_server.push_message(
-                    self.db_server.Message.DISABLE_TRAINING
-                )
-                raise ex
-        self.db_server.push_message(self.db_server.Message.DISABLE_TRAINING)
+        finally:
+            # also on KeyboardInterrupt and other BaseExceptions
+            self.db_server.push_message(
+                self.db_server.Message.DISABLE_TRAINING
+            )
+            self._stop_db_loop()
@@ -8,13 +8,16 @@ import pickle
 from tqdm import tqdm
 
 from catalyst import utils
-from catalyst.rl.db import MongoDB, RedisDB
+from catalyst.rl.db import LocalDB, MongoDB, RedisDB
 from catalyst.rl.utils import structed2dict_trajectory
 
 
 def build_args(parser):
     parser.add_argument("--host", type=str, default="127.0.0.1")
     parser.add_argument("--port", type=int, default=12000)
+    parser.add_argument(
+        "--path", type=str, default=None, help="LocalDB directory"
+    )
     parser.add_argument("--out-pkl", type=str, required=True)
     parser.add_argument("--chunk-size", type=int, default=None)
     parser.add_argument("--start-from", type=int, default=0)
@@ -22,7 +25,7 @@ def build_args(parser):
     parser.add_argument(
         "--db",
         type=str,
-        choices=["redis", "mongo"],
+        choices=["redis", "mongo", "local"],
         default=None,
         required=True
     )
@@ -38,14 +41,17 @@ def parse_args():
 
 
 def main(args, _=None):
-    db_fn = RedisDB if args.db == "redis" else MongoDB
-    db = db_fn(host=args.host, port=args.port)
+    if args.db == "local":
+        db = LocalDB(path=args.path)
+    else:
+        db_fn = RedisDB if args.db == "redis" else MongoDB
+        db = db_fn(host=args.host, port=args.port)
     db_len = db.num_trajectories
     trajectories = []
 
     i = 0
     for i in tqdm(range(args.start_from, db_len)):
-        if args.db == "redis":
+        if args.db in ["redis", "local"]:
             trajectory = db.get_trajectory(i)
         else:
             # mongo does not support indexing yet
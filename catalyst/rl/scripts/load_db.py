@@ -9,12 +9,15 @@ import numpy as np
 from tqdm import tqdm
 
 from catalyst import utils
-from catalyst.rl.db import MongoDB, RedisDB
+from catalyst.rl.db import LocalDB, MongoDB, RedisDB
 
 
 def build_args(parser):
     parser.add_argument("--host", type=str, default="127.0.0.1")
     parser.add_argument("--port", type=int, default=12000)
+    parser.add_argument(
+        "--path", type=str, default=None, help="LocalDB directory"
+    )
     parser.add_argument(
         "--in-pkl",
         "-P",
@@ -26,7 +29,7 @@ def build_args(parser):
     parser.add_argument(
         "--db",
         type=str,
-        choices=["redis", "mongo"],
+        choices=["redis", "mongo", "local"],
         default=None,
         required=True
     )
@@ -46,13 +49,17 @@ def parse_args():
 
 
 def main(args, _=None):
-    db_fn = RedisDB if args.db == "redis" else MongoDB
-    db = db_fn(host=args.host, port=args.port)
+    if args.db == "local":
+        db = LocalDB(path=args.path)
+    else:
+        db_fn = RedisDB if args.db == "redis" else MongoDB
+        db = db_fn(host=args.host, port=args.port)
 
     for in_pkl_ in args.in_pkl:
         with open(in_pkl_, "rb") as fin:
             trajectories = pickle.load(fin)
 
+        trajectories_ = []
         for trajectory in tqdm(trajectories):
             trajectory = utils.unpack_if_needed(trajectory)
 
@@ -64,7 +71,9 @@ def main(args, _=None):
                 observation, action, reward, done = trajectory
                 trajectory = observation, action, np.zeros_like(reward), done
 
-            db.put_trajectory(trajectory)
+            trajectories_.append(trajectory)
+
+        db.put_trajectories(trajectories_)
 
 
 if __name__ == "__main__":
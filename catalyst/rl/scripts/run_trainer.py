@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import argparse
+from copy import deepcopy
 import os
 
 from catalyst import utils
@@ -14,7 +15,7 @@ from catalyst.rl.scripts.misc import (
 )
 from catalyst.utils import (
     boolean_flag, dump_code, dump_environment, import_module, parse_args_uargs,
-    prepare_cudnn, set_global_seed
+    prepare_cudnn, run_in_background, set_global_seed
 )
 
 
@@ -57,14 +58,22 @@ def main(args, unknown_args):
     set_global_seed(args.seed)
     prepare_cudnn(args.deterministic, args.benchmark)
 
+    # provenance is saved in background not to delay the training start
+    dump_threads = []
     if args.logdir is not None:
         os.makedirs(args.logdir, exist_ok=True)
-        dump_environment(config, args.logdir, args.configs)
+        dump_threads.append(
+            run_in_background(
+                dump_environment, deepcopy(config), args.logdir, args.configs
+            )
+        )
 
     if args.expdir is not None:
         module = import_module(expdir=args.expdir)  # noqa: F841
         if args.logdir is not None:
-            dump_code(args.expdir, args.logdir)
+            dump_threads.append(
+                run_in_background(dump_code, args.expdir, args.logdir)
+            )
 
     env = ENVIRONMENTS.get_from_params(**config["environment"])
 
@@ -108,6 +117,9 @@ def main(args, unknown_args):
 
     trainer.run()
 
+    for thread in dump_threads:
+        thread.join()
+
 
 if __name__ == "__main__":
     args, unknown_args = parse_args()
@@ -1,16 +1,30 @@
 # flake8: noqa
 
-from catalyst.utils import *
-from .agent import (
-    get_observation_net, process_state_ff, process_state_ff_kv,
-    process_state_temporal, process_state_temporal_kv
-)
-from .buffer import OffpolicyReplayBuffer, OnpolicyRolloutBuffer
-from .criterion import categorical_loss, quantile_loss
-from .gamma import hyperbolic_gammas
-from .gym import extend_space
-from .sampler import OffpolicyReplaySampler, OnpolicyRolloutSampler
-from .torch import (
-    get_network_weights, get_trainer_components, set_network_weights
+from catalyst.utils.lazy import lazy_import
+
+lazy_import(
+    __name__,
+    {
+        ".agent": [
+            "get_observation_net", "process_state_ff", "process_state_ff_kv",
+            "process_state_temporal", "process_state_temporal_kv"
+        ],
+        ".buffer": ["OffpolicyReplayBuffer", "OnpolicyRolloutBuffer"],
+        ".criterion": ["categorical_loss", "quantile_loss"],
+        ".gamma": ["hyperbolic_gammas"],
+        ".gym": ["extend_space"],
+        ".rollout": [
+            "get_discounted_returns", "get_gae_advantages", "pad_sequences"
+        ],
+        ".sampler": ["OffpolicyReplaySampler", "OnpolicyRolloutSampler"],
+        ".torch": [
+            "get_network_weights", "get_trainer_components",
+            "set_network_weights"
+        ],
+        ".trajectory": [
+            "dict2structed_trajectory", "structed2dict_trajectory"
+        ],
+        ".weights": ["WeightsDecoder", "WeightsEncoder"],
+    },
+    extends=["catalyst.utils"],
 )
-from .trajectory import dict2structed_trajectory, structed2dict_trajectory
@@ -0,0 +1,82 @@
+import numpy as np
+
+from catalyst import utils
+
+
+def pad_sequences(sequences, extra_len: int = 0):
+    """
+    Stacks variable-length sequences into one zero-padded array,
+    to process several trajectories at once.
+
+    Args:
+        sequences (List[np.ndarray]): sequences, [len_i; ...]
+        extra_len (int): number of the extra steps
+            of each sequence over its length, for example,
+            1 for the values with the bootstrap value at the end
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: padded sequences
+            [num_sequences; max_len + extra_len; ...]
+            and their lengths without ``extra_len``, [num_sequences]
+    """
+    sequences = [np.asarray(x) for x in sequences]
+    lengths = np.array([len(x) - extra_len for x in sequences], dtype=int)
+    max_len = lengths.max(initial=0) + extra_len
+    padded = np.zeros(
+        (len(sequences), max_len) + sequences[0].shape[1:],
+        dtype=np.result_type(*sequences),
+    )
+    for i, x in enumerate(sequences):
+        padded[i, :len(x)] = x
+    return padded, lengths
+
+
+def get_discounted_returns(gammas, rewards, lengths=None):
+    """
+    Computes discounted returns for several discount factors
+    and for a batch of zero-padded trajectories at once.
+
+    Args:
+        gammas (np.ndarray): discount factors, [num_gammas]
+        rewards (np.ndarray): rewards, [batch_size; max_len]
+        lengths (np.ndarray): trajectories lengths, [batch_size]
+
+    Returns:
+        np.ndarray: discounted returns, [batch_size; max_len; num_gammas]
+    """
+    rewards = np.asarray(rewards)[:, :, None]
+    returns = utils.geometric_cumsum_batch(gammas, rewards, lengths)
+    return returns
+
+
+def get_gae_advantages(gammas, gae_lambda, rewards, values, lengths=None):
+    """
+    Computes Generalized Advantage Estimation
+    for several discount factors
+    and for a batch of zero-padded trajectories at once.
+
+    Args:
+        gammas (np.ndarray): discount factors, [num_gammas]
+        gae_lambda (float): GAE lambda parameter
+        rewards (np.ndarray): rewards, [batch_size; max_len]
+        values (np.ndarray): critic values,
+            [batch_size; max_len + 1; num_gammas; ...],
+            where ``values[i, lengths[i]]`` is the bootstrap value
+            of the i-th trajectory (zero for the terminal one)
+        lengths (np.ndarray): trajectories lengths, [batch_size]
+
+    Returns:
+        np.ndarray: advantages, [batch_size; max_len; num_gammas; ...]
+    """
+    values = np.asarray(values)
+    extra_dims = (1, ) * (values.ndim - 3)
+    gammas = np.asarray(gammas)
+    gammas = gammas.reshape(gammas.shape + extra_dims)
+    rewards = np.asarray(rewards)
+    rewards = rewards.reshape(rewards.shape + (1, ) + extra_dims)
+
+    deltas = rewards + gammas * values[:, 1:] - values[:, :-1]
+    advantages = utils.geometric_cumsum_batch(
+        gammas * gae_lambda, deltas, lengths
+    )
+    return advantages
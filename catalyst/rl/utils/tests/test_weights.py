@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from catalyst.rl.utils import WeightsDecoder, WeightsEncoder
+
+
+def _get_checkpoint(seed=0):
+    rng = np.random.RandomState(seed)
+    return {
+        "actor": {
+            "weight": rng.randn(8, 4).astype(np.float32),
+            "num_batches_tracked": np.array(seed, dtype=np.int64),
+        }
+    }
+
+
+def _assert_close(decoded, checkpoint, atol):
+    for key in checkpoint:
+        for name, value in checkpoint[key].items():
+            # fp16 weights are loaded into the float32 networks as is
+            assert decoded[key][name].dtype.kind == value.dtype.kind
+            assert np.allclose(decoded[key][name], value, atol=atol)
+
+
+@pytest.mark.parametrize(
+    "precision,atol", [(None, 0.0), ("fp16", 1e-2), ("int8", 5e-2)]
+)
+@pytest.mark.parametrize("delta", [False, True])
+def test_round_trip(precision, atol, delta):
+    encoder = WeightsEncoder(precision=precision, delta=delta)
+    decoder = WeightsDecoder()
+    for epoch in range(3):
+        checkpoint = _get_checkpoint(epoch)
+        encoded, keyframe = encoder.encode(checkpoint, keyframe_id=epoch)
+        assert keyframe == (delta and epoch == 0)
+        decoded = decoder.decode(encoded)
+        _assert_close(decoded, checkpoint, atol)
+
+
+def test_missed_delta_recovers_on_keyframe():
+    encoder = WeightsEncoder(delta=True, keyframe_period=2)
+    decoder = WeightsDecoder()
+    encoded, _ = encoder.encode(_get_checkpoint(0), keyframe_id=0)
+    decoder.decode(encoded)
+
+    # the delta is lost, the next keyframe restores the weights
+    encoder.encode(_get_checkpoint(1), keyframe_id=1)
+    encoded, keyframe = encoder.encode(_get_checkpoint(2), keyframe_id=2)
+    assert keyframe
+    _assert_close(decoder.decode(encoded), _get_checkpoint(2), 1e-6)
+
+
+def test_delta_with_new_keyframe():
+    encoder = WeightsEncoder(delta=True)
+    keyframe, _ = encoder.encode(_get_checkpoint(0), keyframe_id=0)
+    delta, _ = encoder.encode(_get_checkpoint(1), keyframe_id=1)
+
+    # the sampler started after the keyframe, it is fetched separately
+    decoded = WeightsDecoder().decode(delta, get_keyframe_fn=lambda: keyframe)
+    _assert_close(decoded, _get_checkpoint(1), 1e-6)
+    assert WeightsDecoder().decode(delta) is None
+
+
+def test_other_run_keyframe_is_rejected():
+    decoder = WeightsDecoder()
+    old_encoder = WeightsEncoder(delta=True)
+    old_keyframe, _ = old_encoder.encode(_get_checkpoint(0), keyframe_id=0)
+    decoder.decode(old_keyframe)
+
+    # the restarted trainer reuses the same keyframe ids
+    encoder = WeightsEncoder(delta=True)
+    encoder.encode(_get_checkpoint(1), keyframe_id=0)
+    delta, keyframe = encoder.encode(_get_checkpoint(2), keyframe_id=1)
+    assert not keyframe
+
+    decoded = decoder.decode(delta, get_keyframe_fn=lambda: old_keyframe)
+    assert decoded is None
@@ -0,0 +1,174 @@
+from typing import Callable, Dict, Tuple  # isort:skip
+import uuid
+
+import numpy as np
+
+WEIGHTS_ENCODING_KEY = "_weights_encoding"
+
+
+def _encode_array(array: np.ndarray, precision: str):
+    if not np.issubdtype(array.dtype, np.floating) or precision is None:
+        return array
+    elif precision == "fp16":
+        return array.astype(np.float16)
+    elif precision == "int8":
+        scale = float(np.max(np.abs(array))) / 127.0 if array.size else 0.0
+        scale = scale or 1.0
+        quantized = np.round(array / scale).astype(np.int8)
+        return {"quantized": quantized, "scale": scale, "dtype": array.dtype}
+    else:
+        raise NotImplementedError(f"Unknown precision: {precision}")
+
+
+def _decode_array(array):
+    if isinstance(array, dict):
+        return (array["quantized"] * array["scale"]).astype(array["dtype"])
+    return array
+
+
+def _map_checkpoint(fn: Callable, *checkpoints: Dict) -> Dict:
+    checkpoint = {
+        key: {
+            name: fn(*(x[key][name] for x in checkpoints))
+            for name in checkpoints[0][key]
+        }
+        for key in checkpoints[0]
+    }
+    return checkpoint
+
+
+class WeightsEncoder:
+    """
+    Encodes network weights for the broadcast from the trainer to samplers.
+
+    Every ``keyframe_period``-th call produces a keyframe
+    with the full weights, other calls produce the difference
+    between the current weights and the last keyframe.
+    Both could be stored with reduced precision.
+    The difference is computed against the keyframe,
+    as samplers decode it, so the error does not accumulate.
+    Keyframes ids are prefixed with the random id of the encoder,
+    so the deltas of the restarted trainer
+    are never applied to the keyframes of the previous run.
+    """
+    def __init__(
+        self,
+        precision: str = None,
+        delta: bool = False,
+        keyframe_period: int = 10,
+    ):
+        """
+        Args:
+            precision (str): precision of floating point weights,
+                one of ``None`` (as is), ``"fp16"`` or ``"int8"``
+                (per-tensor symmetric quantization)
+            delta (bool): if ``True``, sends differences from the keyframe
+            keyframe_period (int): number of broadcasts between keyframes
+        """
+        assert precision in [None, "fp16", "int8"]
+        self.precision = precision
+        self.delta = delta
+        self.keyframe_period = keyframe_period
+
+        self._run_id = uuid.uuid4().hex
+        self._num_encoded = 0
+        self._keyframe = None
+        self._keyframe_id = None
+
+    def encode(self, checkpoint: Dict, keyframe_id: int) -> Tuple[Dict, bool]:
+        """
+        Args:
+            checkpoint (Dict): ``{key: {name: np.ndarray}}`` weights
+            keyframe_id (int): id of the keyframe, if a new one is produced,
+                unique within the run, usually the trainer epoch
+
+        Returns:
+            (Dict, bool): encoded checkpoint and the flag,
+                if it should be also stored as the keyframe
+                for the next deltas, only with ``delta=True``
+        """
+        is_keyframe = not self.delta \
+            or self._keyframe is None \
+            or self._num_encoded % self.keyframe_period == 0
+        self._num_encoded += 1
+
+        if is_keyframe:
+            state = _map_checkpoint(
+                lambda x: _encode_array(x, self.precision), checkpoint
+            )
+            if self.delta:
+                self._keyframe = _map_checkpoint(_decode_array, state)
+                self._keyframe_id = f"{self._run_id}.{keyframe_id}"
+        else:
+            state = _map_checkpoint(
+                lambda x, y: _encode_array(x - y, self.precision)
+                if np.issubdtype(x.dtype, np.floating) else x,
+                checkpoint, self._keyframe
+            )
+
+        encoding = {
+            "precision": self.precision,
+            "keyframe": is_keyframe,
+            "keyframe_id": self._keyframe_id,
+        }
+        encoded = {WEIGHTS_ENCODING_KEY: encoding, "state": state}
+        # without deltas nobody needs the separate keyframe
+        return encoded, is_keyframe and self.delta
+
+
+class WeightsDecoder:
+    """
+    Decodes weights encoded by :py:class:`WeightsEncoder`,
+    keeping the last keyframe.
+    Not encoded checkpoints are returned as is.
+    """
+    def __init__(self):
+        self._keyframe = None
+        self._keyframe_id = None
+
+    @staticmethod
+    def is_encoded(checkpoint: Dict) -> bool:
+        return checkpoint is not None and WEIGHTS_ENCODING_KEY in checkpoint
+
+    def decode(
+        self, checkpoint: Dict, get_keyframe_fn: Callable = None
+    ) -> Dict:
+        """
+        Args:
+            checkpoint (Dict): encoded checkpoint
+            get_keyframe_fn (Callable): function, which returns
+                the last keyframe, is called only
+                if the decoder has no the required one
+
+        Returns:
+            Dict: decoded checkpoint or ``None``,
+                if the required keyframe is unavailable
+        """
+        if not self.is_encoded(checkpoint):
+            return checkpoint
+
+        encoding = checkpoint[WEIGHTS_ENCODING_KEY]
+        state = _map_checkpoint(_decode_array, checkpoint["state"])
+        if encoding["keyframe"]:
+            self._keyframe = state
+            self._keyframe_id = encoding["keyframe_id"]
+            return state
+
+        if self._keyframe_id != encoding["keyframe_id"]:
+            keyframe = get_keyframe_fn() \
+                if get_keyframe_fn is not None \
+                else None
+            if not self.is_encoded(keyframe) \
+                    or keyframe[WEIGHTS_ENCODING_KEY]["keyframe_id"] \
+                    != encoding["keyframe_id"]:
+                return None
+            self.decode(keyframe)
+
+        state = _map_checkpoint(
+            lambda x, y: x + y if np.issubdtype(y.dtype, np.floating) else x,
+            state, self._keyframe
+        )
+        return state
+
+
+__all__ = ["WeightsEncoder", "WeightsDecoder"]
@@ -1,86 +1,111 @@
 # flake8: noqa
 # isort:skip_file
+# submodules, and their heavy dependencies like pandas, sklearn or plotly,
+# are imported on first access to their names
+from .lazy import lazy_import
 
-from .argparse import boolean_flag
-from .callbacks import process_callbacks
-from .checkpoint import (
-    load_checkpoint, pack_checkpoint, save_checkpoint, unpack_checkpoint
-)
-from .compression import pack, pack_if_needed, unpack, unpack_if_needed
-from .config import load_config, save_config
-from .confusion_matrix import (
-    calculate_tp_fp_fn, calculate_confusion_matrix_from_arrays,
-    calculate_confusion_matrix_from_tensors
-)
-from .dataset import (
-    create_dataset, split_dataset_train_test, create_dataframe
-)
-from .ddp import get_nn_from_ddp_module, is_wrapped_with_ddp
-from .dict import (
-    append_dict, flatten_dict, merge_dicts, get_dictkey_auto_fn,
-    split_dict_to_subdicts
-)
-# from .frozen import *
-from .hash import get_hash, get_short_hash
-from .image import (
-    has_image_extension, imread, imwrite, imsave, mask_to_overlay_image,
-    mimread, mimwrite_with_meta, tensor_from_rgb_image, tensor_to_ndimage
-)
-from .initialization import (
-    bias_init_with_prob, constant_init, create_optimal_inner_init,
-    kaiming_init, normal_init, outer_init, uniform_init, xavier_init
-)
-from .misc import (
-    args_are_not_none,
-    copy_directory,
-    format_metric,
-    get_fn_default_params,
-    get_fn_argsnames,
-    get_utcnow_time,
-    is_exception,
-    make_tuple,
-    maybe_recursive_call,
-    pairwise,
-)
-from .numpy import (
-    dict2structed, geometric_cumsum, get_one_hot, np_softmax, structed2dict
-)
-from .pandas import (
-    dataframe_to_list, folds_to_list, split_dataframe_train_test,
-    split_dataframe_on_folds, split_dataframe_on_stratified_folds,
-    split_dataframe_on_column_folds, map_dataframe, separate_tags,
-    get_dataset_labeling, split_dataframe, merge_multiple_fold_csv,
-    read_multiple_dataframes, read_csv_data, balance_classes
-)
-from .parallel import parallel_imap, tqdm_parallel_imap, get_pool
-from .parser import parse_config_args, parse_args_uargs
-from .plotly import plot_tensorboard_log
-# from .registry import *
-from .scripts import (
-    import_module,
-    dump_code,
-    dump_python_files,
-    import_experiment_and_runner,
-    dump_base_experiment_code,
-)
-from .seed import set_global_seed
-from .serialization import deserialize, serialize
-from .sys import (
-    get_environment_vars,
-    list_conda_packages,
-    list_pip_packages,
-    dump_environment,
-)
-from .torch import (
-    any2device, ce_with_logits, detach, get_activation_fn, get_available_gpus,
-    get_device, get_network_output, get_optimizable_params,
-    get_optimizer_momentum, log1p_exp, normal_logprob, normal_sample,
-    prepare_cudnn, process_model_params, set_optimizer_momentum,
-    set_requires_grad, soft_update
-)
-from .visualization import plot_confusion_matrix, render_figure_to_tensor
-
-from .distributed import (
-    get_rank, is_apex_available, distributed_mean, process_components,
-    assert_fp16_available, distributed_run
+lazy_import(
+    __name__,
+    {
+        ".argparse": ["boolean_flag"],
+        ".callbacks": ["process_callbacks"],
+        ".checkpoint": [
+            "load_checkpoint", "pack_checkpoint", "save_checkpoint",
+            "unpack_checkpoint"
+        ],
+        ".cache": [
+            "get_cache_dir", "copy_file_cached", "write_text_cached",
+            "copy_tree_cached"
+        ],
+        ".compression": [
+            "binary_pack", "binary_unpack", "pack", "pack_if_needed",
+            "unpack", "unpack_if_needed"
+        ],
+        ".config": ["load_config", "save_config"],
+        ".confusion_matrix": [
+            "calculate_tp_fp_fn", "calculate_confusion_matrix_from_arrays",
+            "calculate_confusion_matrix_from_tensors"
+        ],
+        ".dataset": [
+            "create_dataset", "split_dataset_train_test", "create_dataframe"
+        ],
+        ".ddp": ["get_nn_from_ddp_module", "is_wrapped_with_ddp"],
+        ".dict": [
+            "append_dict", "flatten_dict", "merge_dicts",
+            "get_dictkey_auto_fn", "split_dict_to_subdicts"
+        ],
+        # ".frozen": [...],
+        ".hash": ["get_hash", "get_short_hash"],
+        ".image": [
+            "has_image_extension", "imread", "imwrite", "imsave",
+            "mask_to_overlay_image", "mimread", "mimwrite_with_meta",
+            "tensor_from_rgb_image", "tensor_to_ndimage"
+        ],
+        ".initialization": [
+            "bias_init_with_prob", "constant_init",
+            "create_optimal_inner_init", "kaiming_init", "normal_init",
+            "outer_init", "uniform_init", "xavier_init"
+        ],
+        ".misc": [
+            "args_are_not_none",
+            "copy_directory",
+            "format_metric",
+            "get_fn_default_params",
+            "get_fn_argsnames",
+            "get_utcnow_time",
+            "is_exception",
+            "make_tuple",
+            "maybe_recursive_call",
+            "pairwise",
+        ],
+        ".numpy": [
+            "dict2structed", "geometric_cumsum", "geometric_cumsum_batch",
+            "get_one_hot", "np_softmax", "structed2dict"
+        ],
+        ".pandas": [
+            "dataframe_to_list", "folds_to_list",
+            "split_dataframe_train_test", "split_dataframe_on_folds",
+            "split_dataframe_on_stratified_folds",
+            "split_dataframe_on_column_folds", "map_dataframe",
+            "separate_tags", "get_dataset_labeling", "split_dataframe",
+            "merge_multiple_fold_csv", "read_multiple_dataframes",
+            "read_csv_data", "balance_classes"
+        ],
+        ".parallel": [
+            "parallel_imap", "tqdm_parallel_imap", "get_pool",
+            "run_in_background"
+        ],
+        ".parser": ["parse_config_args", "parse_args_uargs"],
+        ".plotly": ["plot_tensorboard_log"],
+        # ".registry": [...],
+        ".scripts": [
+            "import_module",
+            "dump_code",
+            "dump_python_files",
+            "import_experiment_and_runner",
+            "dump_base_experiment_code",
+        ],
+        ".seed": ["set_global_seed", "derive_seed"],
+        ".serialization": ["deserialize", "serialize"],
+        ".sys": [
+            "get_environment_vars",
+            "list_conda_packages",
+            "list_pip_packages",
+            "dump_environment",
+        ],
+        ".torch": [
+            "any2device", "ce_with_logits", "detach", "get_activation_fn",
+            "get_available_gpus", "get_device", "get_network_output",
+            "get_optimizable_params", "get_optimizer_momentum", "log1p_exp",
+            "normal_logprob", "normal_sample", "prepare_cudnn",
+            "process_model_params", "set_optimizer_momentum",
+            "set_requires_grad", "lerp_tensors_", "scale_tensors_",
+            "soft_update", "zero_grad"
+        ],
+        ".visualization": ["plot_confusion_matrix", "render_figure_to_tensor"],
+        ".distributed": [
+            "get_rank", "is_apex_available", "distributed_mean",
+            "process_components", "assert_fp16_available", "distributed_run"
+        ],
+    },
 )
@@ -0,0 +1,138 @@
+from typing import Callable, List, Union  # isort:skip
+from hashlib import sha256
+import os
+from pathlib import Path
+import shutil
+import stat
+import tempfile
+
+_CHUNK_SIZE = 1 << 20
+_DEFAULT_IGNORE = ["__pycache__", "*.pyc", ".ipynb_checkpoints"]
+
+
+def get_cache_dir() -> Path:
+    """
+    Returns the host-wide catalyst cache directory,
+    ``$CATALYST_CACHE_DIR`` or ``$XDG_CACHE_HOME/catalyst``,
+    ``~/.cache/catalyst`` by default
+    """
+    cache_dir = os.environ.get("CATALYST_CACHE_DIR", None)
+    if cache_dir is None:
+        cache_dir = os.path.join(
+            os.environ.get("XDG_CACHE_HOME", "~/.cache"), "catalyst"
+        )
+    return Path(os.path.expanduser(cache_dir))
+
+
+def _get_object_path(digest: str) -> Path:
+    return get_cache_dir() / "objects" / digest[:2] / digest[2:]
+
+
+def _put_object(write_fn: Callable, digest: str) -> Path:
+    object_path = _get_object_path(digest)
+    if not object_path.exists():
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        # several runs can store the same object at the same time,
+        # the object is written to a temporary file and renamed atomically
+        fd, tmp_path = tempfile.mkstemp(dir=str(object_path.parent))
+        try:
+            with os.fdopen(fd, "wb") as fout:
+                write_fn(fout)
+            # objects are shared between the runs with hardlinks
+            os.chmod(tmp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(tmp_path, str(object_path))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    return object_path
+
+
+def _link_object(object_path: Path, dst: Path, fallback: Callable) -> None:
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+    try:
+        os.link(str(object_path), str(dst))
+    except OSError:
+        # for example, the cache and ``dst`` are on different devices
+        fallback()
+
+
+def copy_file_cached(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """
+    Copies ``src`` file to ``dst`` through the content-addressed cache,
+    the content is stored once per host and hardlinked to ``dst``,
+    so unchanged files are not copied again.
+    Falls back to the regular copy if hardlinks are not supported.
+
+    Args:
+        src (Union[str, Path]): file to copy
+        dst (Union[str, Path]): path to copy to
+    """
+    src, dst = Path(src), Path(dst)
+    hasher = sha256()
+    with open(src, "rb") as fin:
+        for chunk in iter(lambda: fin.read(_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+
+    def _write(fout):
+        with open(src, "rb") as fin:
+            shutil.copyfileobj(fin, fout, _CHUNK_SIZE)
+
+    object_path = _put_object(_write, hasher.hexdigest())
+    _link_object(object_path, dst, lambda: shutil.copy2(str(src), str(dst)))
+
+
+def write_text_cached(text: str, dst: Union[str, Path]) -> None:
+    """
+    Writes ``text`` to ``dst`` through the content-addressed cache,
+    like ``copy_file_cached``
+
+    Args:
+        text (str): text to write
+        dst (Union[str, Path]): path to write to
+    """
+    dst = Path(dst)
+    data = text.encode("UTF-8")
+    object_path = _put_object(
+        lambda fout: fout.write(data), sha256(data).hexdigest()
+    )
+    _link_object(object_path, dst, lambda: dst.write_bytes(data))
+
+
+def copy_tree_cached(
+    src: Union[str, Path],
+    dst: Union[str, Path],
+    ignore: List[str] = None,
+) -> None:
+    """
+    Copies ``src`` directory to ``dst`` like ``shutil.copytree``,
+    but through the content-addressed cache, see ``copy_file_cached``
+
+    Args:
+        src (Union[str, Path]): directory to copy
+        dst (Union[str, Path]): path to copy to, replaced if exists
+        ignore (List[str]): glob patterns of the files and directories
+            to skip, python caches by default
+    """
+    ignore = shutil.ignore_patterns(
+        *(_DEFAULT_IGNORE if ignore is None else ignore)
+    )
+    src, dst = Path(src), Path(dst)
+    if dst.exists():
+        shutil.rmtree(str(dst))
+
+    for root, dirs, files in os.walk(str(src), followlinks=True):
+        ignored = ignore(root, dirs + files)
+        dirs[:] = [name for name in dirs if name not in ignored]
+        dst_root = dst / os.path.relpath(root, str(src))
+        dst_root.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            if name in ignored:
+                continue
+            copy_file_cached(Path(root) / name, dst_root / name)
+
+
+__all__ = [
+    "get_cache_dir", "copy_file_cached", "write_text_cached",
+    "copy_tree_cached"
+]
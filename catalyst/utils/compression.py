@@ -1,6 +1,9 @@
 import base64
+import io
 import logging
 import os
+import pickle
+import struct
 
 import numpy as np
 from six import string_types
@@ -54,13 +57,165 @@ def decompress_if_needed(data):
     return data
 
 
-if LZ4_ENABLED:
-    pack = compress
-    pack_if_needed = compress_if_needed
-    unpack = decompress
-    unpack_if_needed = decompress_if_needed
-else:
-    pack = serialize
-    pack_if_needed = serialize
-    unpack = deserialize
-    unpack_if_needed = deserialize
+# Binary format, version 1:
+# | magic (4 bytes) | version (uint8) | skeleton size (uint32) | skeleton |
+# | padding | array 0 | padding | array 1 | ... |
+# where skeleton is a pickle of the data with numpy arrays replaced
+# by persistent ids ``(codec, dtype, shape, offset, nbytes)``.
+# Arrays are aligned, so they could be read without copying.
+BINARY_MAGIC = b"\x89CTL"
+BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct("<4sBI")
+_BINARY_ALIGNMENT = 64
+# arrays smaller than this are never compressed
+_MIN_COMPRESSION_SIZE = 1024
+# compressed array is used only if it saves at least 10% of the size
+_MIN_COMPRESSION_RATIO = 0.9
+
+
+def _align(size: int) -> int:
+    return (size + _BINARY_ALIGNMENT - 1) // _BINARY_ALIGNMENT \
+        * _BINARY_ALIGNMENT
+
+
+class _BinaryPickler(pickle.Pickler):
+    def __init__(self, file, compression: bool):
+        super().__init__(file, protocol=4)
+        self.compression = compression and LZ4_ENABLED
+        self.buffers = []
+        self.size = 0
+
+    def persistent_id(self, obj):
+        if not isinstance(obj, np.ndarray) or obj.dtype.hasobject:
+            return None
+
+        buffer = memoryview(
+            np.ascontiguousarray(obj).reshape(-1).view(np.uint8)
+        )
+        codec = "raw"
+        if self.compression and buffer.nbytes >= _MIN_COMPRESSION_SIZE:
+            compressed = lz4.frame.compress(buffer)
+            if len(compressed) < _MIN_COMPRESSION_RATIO * buffer.nbytes:
+                buffer = compressed
+                codec = "lz4"
+
+        nbytes = len(buffer)
+        array_id = (codec, obj.dtype, obj.shape, self.size, nbytes)
+        self.buffers.append(buffer)
+        self.size += _align(nbytes)
+        return array_id
+
+
+class _BinaryUnpickler(pickle.Unpickler):
+    def __init__(self, file, buffer: memoryview, offset: int):
+        super().__init__(file)
+        self.buffer = buffer
+        self.offset = offset
+
+    def persistent_load(self, array_id):
+        codec, dtype, shape, offset, nbytes = array_id
+        offset = self.offset + offset
+        buffer = self.buffer[offset:offset + nbytes]
+        if codec == "lz4":
+            buffer = lz4.frame.decompress(buffer)
+        elif codec != "raw":
+            raise ValueError(f"Unknown array codec: {codec}")
+        # no copy for not compressed arrays, the result is read-only
+        array = np.frombuffer(buffer, dtype=dtype).reshape(shape)
+        return array
+
+
+def is_binary_packed(data) -> bool:
+    """
+    Checks if the data was packed with the binary format.
+
+    Args:
+        data: packed data
+
+    Returns:
+        bool: ``True`` if ``data`` starts with the binary format header
+    """
+    return isinstance(data, (bytes, bytearray, memoryview)) \
+        and bytes(data[:len(BINARY_MAGIC)]) == BINARY_MAGIC
+
+
+def binary_pack(data, compression: bool = True) -> bytes:
+    """
+    Packs the data into the versioned binary format.
+    Numpy arrays are stored as raw aligned buffers,
+    optionally lz4-compressed one by one,
+    everything else is pickled.
+
+    Args:
+        data: a value, usually a (nested) dict of numpy arrays
+        compression (bool): if ``True`` and lz4 is available,
+            compresses arrays, which become noticeably smaller
+
+    Returns:
+        bytes: packed data
+    """
+    skeleton = io.BytesIO()
+    pickler = _BinaryPickler(skeleton, compression=compression)
+    pickler.dump(data)
+    skeleton = skeleton.getbuffer()
+
+    header = _BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, len(skeleton))
+    header_size = len(header) + len(skeleton)
+    chunks = [header, skeleton, bytes(_align(header_size) - header_size)]
+    for buffer in pickler.buffers:
+        nbytes = len(buffer)
+        chunks.extend([buffer, bytes(_align(nbytes) - nbytes)])
+
+    return b"".join(chunks)
+
+
+def binary_unpack(data):
+    """
+    Unpacks the data packed with :py:func:`binary_pack`.
+    Not compressed arrays are read-only views of ``data``.
+
+    Args:
+        data (bytes): packed data
+
+    Returns:
+        unpacked value
+    """
+    buffer = memoryview(data)
+    magic, version, skeleton_size = _BINARY_HEADER.unpack_from(buffer)
+    assert magic == BINARY_MAGIC, "Data is not in the binary format"
+    if version != BINARY_VERSION:
+        raise ValueError(f"Unsupported binary format version: {version}")
+
+    skeleton_start = _BINARY_HEADER.size
+    skeleton_end = skeleton_start + skeleton_size
+    unpickler = _BinaryUnpickler(
+        io.BytesIO(buffer[skeleton_start:skeleton_end]),
+        buffer=buffer,
+        offset=_align(skeleton_end)
+    )
+    return unpickler.load()
+
+
+def pack(data):
+    return binary_pack(data)
+
+
+def pack_if_needed(data):
+    if isinstance(data, np.ndarray):
+        data = pack(data)
+    return data
+
+
+def unpack(data):
+    if is_binary_packed(data):
+        return binary_unpack(data)
+    # legacy formats
+    if LZ4_ENABLED:
+        return decompress(data)
+    return deserialize(data)
+
+
+def unpack_if_needed(data):
+    if is_compressed(data):
+        data = unpack(data)
+    return data
@@ -1,16 +1,25 @@
 from typing import Dict, List, Union  # isort:skip
 from collections import OrderedDict
+from hashlib import sha256
 import json
 from logging import getLogger
+import os
 from pathlib import Path
 import re
 
 import yaml
 
+from catalyst.__version__ import __version__
+from .cache import get_cache_dir
+
 LOG = getLogger(__name__)
 
 
-class OrderedLoader(yaml.Loader):
+# libyaml-based loader is several times faster than the pure python one
+_YamlLoader = getattr(yaml, "CLoader", yaml.Loader)
+
+
+class OrderedLoader(_YamlLoader):
     pass
 
 
@@ -40,11 +49,52 @@ def _load_ordered_yaml(stream, ):
     return yaml.load(stream, OrderedLoader)
 
 
+def _load_yaml_cached(path: Path, loader, encoding: str, ordered: bool):
+    """
+    Loads YAML config with the host-wide cache of the parsed configs,
+    the key is the file content, so the subprocesses, like DDP workers
+    or samplers, load the same config from JSON instead of parsing YAML.
+    Configs, which do not survive the JSON round trip,
+    like ones with dates or non-string keys, are not cached.
+    """
+    object_pairs_hook = OrderedDict if ordered else None
+    content = path.read_bytes()
+    key = sha256(content)
+    # the parsing rules could change with the libraries versions
+    key.update(
+        f"{loader.__module__}.{loader.__name__}:{encoding}:"
+        f"{yaml.__version__}:{__version__}".encode()
+    )
+    cache_path = get_cache_dir() / "configs" / f"{key.hexdigest()}.json"
+
+    if cache_path.exists():
+        try:
+            with cache_path.open(encoding="utf-8") as fin:
+                return json.load(fin, object_pairs_hook=object_pairs_hook)
+        except ValueError:
+            # broken cache file, the config is parsed again
+            pass
+
+    config = yaml.load(content.decode(encoding), loader)
+    try:
+        dumped = json.dumps(config, ensure_ascii=False)
+        if json.loads(dumped, object_pairs_hook=object_pairs_hook) == config:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(dumped, encoding="utf-8")
+            os.replace(str(tmp_path), str(cache_path))
+    except (OSError, TypeError, ValueError):
+        # the cache is optional
+        pass
+    return config
+
+
 def load_config(
     path: Union[str, Path],
     ordered: bool = False,
     data_format: str = None,
-    encoding: str = "utf-8"
+    encoding: str = "utf-8",
+    use_cache: bool = True,
 ) -> Union[Dict, List]:
     """
     Loads config by giving path. Supports YAML and JSON files.
@@ -53,6 +103,8 @@ def load_config(
         ordered (bool): if true the config will be loaded as ``OrderedDict``
         data_format (str): ``yaml``, ``yml`` or ``json``.
         encoding (str): encoding to read the config
+        use_cache (bool): if true, parsed YAML configs are cached
+            in ``utils.get_cache_dir()`` by the file content
     Returns:
         (Union[Dict, List]): Config
     Raises:
@@ -77,16 +129,22 @@ def load_config(
         f"Unknown file format '{suffix}'"
 
     config = None
-    with path.open(encoding=encoding) as stream:
-        if suffix == ".json":
-            object_pairs_hook = OrderedDict if ordered else None
-            file = "\n".join(stream.readlines())
-            if file != "":
-                config = json.loads(file, object_pairs_hook=object_pairs_hook)
-
-        elif suffix in [".yml", ".yaml"]:
-            loader = OrderedLoader if ordered else yaml.Loader
-            config = yaml.load(stream, loader)
+    if suffix in [".yml", ".yaml"] and use_cache:
+        loader = OrderedLoader if ordered else _YamlLoader
+        config = _load_yaml_cached(path, loader, encoding, ordered)
+    else:
+        with path.open(encoding=encoding) as stream:
+            if suffix == ".json":
+                object_pairs_hook = OrderedDict if ordered else None
+                file = "\n".join(stream.readlines())
+                if file != "":
+                    config = json.loads(
+                        file, object_pairs_hook=object_pairs_hook
+                    )
+
+            elif suffix in [".yml", ".yaml"]:
+                loader = OrderedLoader if ordered else _YamlLoader
+                config = yaml.load(stream, loader)
 
     if config is None:
         return dict()
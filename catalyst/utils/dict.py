@@ -1,6 +1,6 @@
 from typing import Any, Callable, Dict, List, Optional, Union  # isort:skip
 
-import collections
+import collections.abc
 import copy
 
 import numpy as np
@@ -117,6 +117,22 @@ def get_dictkey_auto_fn(key: Optional[Union[str, List[str]]]) -> Callable:
         raise NotImplementedError()
 
 
+def _merge_dict_inplace(dict_: dict, merge_dict: dict, borrowed: set):
+    for k, v in merge_dict.items():
+        if (
+            k in dict_ and isinstance(dict_[k], dict)
+            and isinstance(v, collections.abc.Mapping)
+        ):
+            if id(dict_[k]) in borrowed:
+                # came from the previous dicts, should not be modified
+                dict_[k] = copy.deepcopy(dict_[k])
+            _merge_dict_inplace(dict_[k], v, borrowed)
+        else:
+            dict_[k] = v
+            if isinstance(v, dict):
+                borrowed.add(id(v))
+
+
 def merge_dicts(*dicts: dict) -> dict:
     """
     Recursive dict merge.
@@ -124,6 +140,10 @@ def merge_dicts(*dicts: dict) -> dict:
     ``merge_dicts`` recurses down into dicts nested
     to an arbitrary depth, updating keys.
 
+    The first dict is deep copied once,
+    and the next dicts are merged into the copy inplace,
+    none of the given dicts is modified.
+
     Args:
         *dicts: several dictionaries to merge
 
@@ -133,17 +153,11 @@ def merge_dicts(*dicts: dict) -> dict:
     assert len(dicts) > 1
 
     dict_ = copy.deepcopy(dicts[0])
+    # ids of the nested dicts taken from ``dicts[1:]`` as is
+    borrowed = set()
 
     for merge_dict in dicts[1:]:
-        merge_dict = merge_dict or {}
-        for k, v in merge_dict.items():
-            if (
-                k in dict_ and isinstance(dict_[k], dict)
-                and isinstance(merge_dict[k], collections.Mapping)
-            ):
-                dict_[k] = merge_dicts(dict_[k], merge_dict[k])
-            else:
-                dict_[k] = merge_dict[k]
+        _merge_dict_inplace(dict_, merge_dict or {}, borrowed)
 
     return dict_
 
@@ -176,7 +190,7 @@ def flatten_dict(
     items = []
     for key, value in dictionary.items():
         new_key = parent_key + separator + key if parent_key else key
-        if isinstance(value, collections.MutableMapping):
+        if isinstance(value, collections.abc.MutableMapping):
             items.extend(
                 flatten_dict(value, new_key, separator=separator).items()
             )
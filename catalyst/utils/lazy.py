@@ -0,0 +1,102 @@
+from typing import Dict, List  # isort:skip
+import importlib
+import importlib.util
+import sys
+import types
+
+LAZY_ATTRIBUTES_KEY = "_lazy_attributes"
+LAZY_EXTENDS_KEY = "_lazy_extends"
+
+
+def _import_submodule(module_name: str, name: str):
+    submodule_name = f"{module_name}.{name}"
+    try:
+        return importlib.import_module(submodule_name)
+    except ModuleNotFoundError as ex:
+        if ex.name != submodule_name:
+            raise ex
+        return None
+
+
+class _LazyModule(types.ModuleType):
+    """
+    Module, which imports its attributes and submodules on first access.
+    Submodules of the extended modules are available too,
+    as they were with ``from catalyst.utils import *``
+    """
+    def __getattr__(self, name):
+        attributes = self.__dict__.get(LAZY_ATTRIBUTES_KEY, {})
+        if name in attributes:
+            module = importlib.import_module(attributes[name])
+            value = getattr(module, name)
+        elif name.startswith("__"):
+            raise AttributeError(
+                f"module '{self.__name__}' has no attribute '{name}'"
+            )
+        else:
+            # own submodules take precedence over the extended ones
+            module_names = [self.__name__] \
+                + self.__dict__.get(LAZY_EXTENDS_KEY, [])
+            for module_name in module_names:
+                value = _import_submodule(module_name, name)
+                if value is not None:
+                    break
+            else:
+                raise AttributeError(
+                    f"module '{self.__name__}' has no attribute '{name}'"
+                )
+        # next accesses do not go through ``__getattr__``
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        attributes = self.__dict__.get(LAZY_ATTRIBUTES_KEY, {})
+        return sorted(set(self.__dict__.keys()) | set(attributes.keys()))
+
+
+def lazy_import(
+    module_name: str,
+    submodules: Dict[str, List[str]],
+    extends: List[str] = None,
+) -> None:
+    """
+    Makes the module ``module_name`` load its public names on first access,
+    like ``from submodule import name``, but deferred.
+    Should be called from the module ``__init__.py``
+    instead of the imports, the module keeps its attributes.
+
+    Examples:
+        >>> lazy_import(__name__, {".image": ["imread", "imwrite"]})
+
+    Args:
+        module_name (str): name of the module to make lazy, ``__name__``
+        submodules (Dict[str, List[str]]): mapping from the submodule name,
+            relative or absolute, to the names to take from it
+        extends (List[str]): names of the lazy modules,
+            which public names and submodules are re-exported too,
+            like ``from catalyst.utils import *``
+    """
+    module = sys.modules[module_name]
+    package = module_name if hasattr(module, "__path__") \
+        else module_name.rpartition(".")[0]
+
+    attributes = {}
+    extends_all = []
+    for parent_name in extends or []:
+        parent = importlib.import_module(parent_name)
+        attributes.update(getattr(parent, LAZY_ATTRIBUTES_KEY, {}))
+        extends_all += [parent_name] + getattr(parent, LAZY_EXTENDS_KEY, [])
+    for submodule_name, names in submodules.items():
+        submodule_name = importlib.util.resolve_name(submodule_name, package)
+        attributes.update({name: submodule_name for name in names})
+
+    setattr(module, LAZY_ATTRIBUTES_KEY, attributes)
+    setattr(module, LAZY_EXTENDS_KEY, extends_all)
+    module.__all__ = sorted(
+        set(getattr(module, "__all__", [])) | set(attributes.keys())
+    )
+    # module level ``__getattr__`` is available only since python 3.7
+    module.__class__ = _LazyModule
+
+
+__all__ = ["lazy_import"]
@@ -44,6 +44,71 @@ def geometric_cumsum(alpha, x):
     return lfilter([1], [1, -alpha], x[::-1, :], axis=0)[::-1, :]
 
 
+def geometric_cumsum_batch(alphas, x, lengths=None):
+    """
+    Vectorized version of :py:func:`geometric_cumsum`,
+    which computes future accumulated sums
+    for several exponential factors and for a batch
+    of variable-length sequences at once.
+
+    Sequences are filtered along the time axis
+    with one ``scipy.signal.lfilter`` call per unique factor,
+    so the cost does not depend on the number of sequences
+    and the output matches :py:func:`geometric_cumsum` exactly.
+
+    Example:
+        >>> geometric_cumsum_batch([0.1, 0.5], [[1, 2, 3, 4]])[0]
+        array([[1.234, 3.25 ], [2.34 , 4.5  ], [3.4  , 5.   ], [4.   , 4.   ]])
+
+    Args:
+        alphas (np.ndarray): exponential factors between zero and one,
+            should be broadcastable with ``x.shape[2:]``
+        x (np.ndarray): zero-padded input data, [batch_size; max_len; ...]
+        lengths (np.ndarray): actual length of each sequence, [batch_size],
+            if ``None``, all sequences are assumed to have ``max_len`` length
+
+    Returns:
+        out (np.ndarray): calculated data,
+            [batch_size; max_len; *broadcast(x.shape[2:], alphas.shape)],
+            positions after the end of the sequence are filled with zeros
+    """
+    alphas = np.asarray(alphas)
+    x = np.asarray(x)
+    assert x.ndim >= 2
+    batch_size, max_len = x.shape[:2]
+    features_shape = np.broadcast(np.empty(x.shape[2:]), alphas).shape
+    x = x.reshape(
+        x.shape[:2] + (1, ) * (len(features_shape) - x.ndim + 2) + x.shape[2:]
+    )
+    x = np.broadcast_to(x, (batch_size, max_len) + features_shape)
+    if x.size == 0:
+        # empty batch or zero-length sequences, nothing to accumulate
+        return np.zeros(x.shape, dtype=np.result_type(x, np.float64))
+
+    if lengths is not None:
+        mask = np.arange(max_len)[None, :] < np.asarray(lengths)[:, None]
+        x = x * mask.reshape(mask.shape + (1, ) * len(features_shape))
+
+    # batch_size x max_len x num_features, reversed in time
+    x = x.reshape(batch_size, max_len, -1)[:, ::-1, :]
+    alphas = np.broadcast_to(alphas, features_shape).reshape(-1)
+    unique_alphas, alpha_indices = np.unique(alphas, return_inverse=True)
+
+    out = None
+    for i, alpha in enumerate(unique_alphas):
+        columns = np.flatnonzero(alpha_indices == i)
+        out_columns = lfilter([1], [1, -alpha], x[:, :, columns], axis=1)
+        if out is None:
+            out = np.empty(x.shape, dtype=out_columns.dtype)
+        out[:, :, columns] = out_columns
+
+    if out is None:
+        out = np.zeros(x.shape, dtype=np.float64)
+    out = out[:, ::-1, :]
+
+    return out.reshape((batch_size, max_len) + features_shape)
+
+
 def structed2dict(array: np.ndarray):
     if isinstance(array, (np.ndarray, np.void)) \
             and array.dtype.fields is not None:
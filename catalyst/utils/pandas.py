@@ -1,5 +1,5 @@
 from typing import Dict, List, Optional, Tuple, Union  # isort:skip
-from collections import defaultdict
+import itertools
 
 import numpy as np
 import pandas as pd
@@ -21,7 +21,7 @@ def dataframe_to_list(dataframe: pd.DataFrame) -> List[dict]:
     Returns:
         (List[dict]): list of rows
     """
-    result = list(dataframe.to_dict(orient="index").values())
+    result = dataframe.to_dict(orient="records")
     return result
 
 
@@ -110,11 +110,10 @@ def split_dataframe_on_folds(
     """
     dataframe = shuffle(dataframe, random_state=random_state)
 
-    df_tmp = []
-    for i, df_el in enumerate(np.array_split(dataframe, n_folds)):
-        df_el["fold"] = i
-        df_tmp.append(df_el)
-    dataframe = pd.concat(df_tmp)
+    # same folds as ``np.array_split``, the first ones are larger by one
+    fold_sizes = np.full(n_folds, len(dataframe) // n_folds)
+    fold_sizes[:len(dataframe) % n_folds] += 1
+    dataframe["fold"] = np.repeat(np.arange(n_folds), fold_sizes)
     return dataframe
 
 
@@ -196,21 +195,22 @@ def map_dataframe(
         tag_column (str): column with tags
         class_column (str) output column with classes
         tag2class (Dict[str, int]): mapping from tags to class labels
-        verbose: flag if true, uses tqdm
+        verbose: not used, the mapping is vectorized,
+            kept for the backward compatibility
     Returns:
         pd.DataFrame: updated dataframe with ``class_column``
+    Raises:
+        KeyError: if some tag is not in ``tag2class``
     """
     dataframe: pd.DataFrame = dataframe.copy()
 
-    def map_label(x):
-        return tag2class[str(x)]
+    tags: pd.Series = dataframe[tag_column].astype(str)
+    series: pd.Series = tags.map(tag2class)
+    unknown_tags = tags[series.isna()]
+    if len(unknown_tags) > 0:
+        raise KeyError(unknown_tags.iloc[0])
 
-    if verbose:
-        series: pd.Series = dataframe[tag_column].progress_apply(map_label)
-    else:
-        series: pd.Series = dataframe[tag_column].apply(map_label)
-
-    dataframe.loc[series.index, class_column] = series
+    dataframe[class_column] = series
     return dataframe
 
 
@@ -228,11 +228,11 @@ def separate_tags(
     Returns:
         pd.DataFrame: new dataframe
     """
-    df_new = []
-    for _, row in dataframe.iterrows():
-        for class_name in row[tag_column].split(tag_delim):
-            df_new.append({**row, **{tag_column: class_name}})
-    df_new = pd.DataFrame(df_new)
+    tags = dataframe[tag_column].str.split(tag_delim)
+    # every row is repeated as many times as it has tags
+    indices = np.repeat(np.arange(len(dataframe)), tags.str.len().values)
+    df_new = dataframe.iloc[indices].reset_index(drop=True)
+    df_new[tag_column] = list(itertools.chain.from_iterable(tags.values))
     return df_new
 
 
@@ -343,13 +343,14 @@ def merge_multiple_fold_csv(
     Returns:
          pd.DataFrame: merged dataframes with column ``fold`` == ``fold_name``
     """
-    result = pd.DataFrame()
-    if paths is not None:
-        for csv_path in paths.split(","):
-            dataframe = pd.read_csv(csv_path)
-            dataframe["fold"] = fold_name
-            result = result.append(dataframe, ignore_index=True)
-
+    if paths is None:
+        return pd.DataFrame()
+
+    dataframes = [
+        pd.read_csv(csv_path) for csv_path in paths.split(",")
+    ]
+    result = pd.concat(dataframes, ignore_index=True)
+    result["fold"] = fold_name
     return result
 
 
@@ -377,7 +378,6 @@ def read_multiple_dataframes(
         [x is not None for x in (in_csv_train, in_csv_valid, in_csv_infer)]
     )
 
-    result_df = None
     fold_dfs = {}
     for fold_df, fold_name in zip(
         (in_csv_train, in_csv_valid, in_csv_infer),
@@ -393,9 +393,7 @@ def read_multiple_dataframes(
                 )
             fold_dfs[fold_name] = fold_df
 
-            result_df = fold_df \
-                if result_df is None \
-                else result_df.append(fold_df, ignore_index=True)
+    result_df = pd.concat(fold_dfs.values(), ignore_index=True)
 
     output = (
         result_df,
@@ -533,16 +531,15 @@ def balance_classes(
     Returns:
         pd.DataFrame: new dataframe with balanced ``class_column``
     """
-    cnt = defaultdict(lambda: 0.0)
-    for label in sorted(dataframe[class_column].unique()):
-        cnt[label] = len(dataframe[dataframe[class_column] == label])
+    # one pass over the dataframe instead of a mask per class
+    class_dfs = dict(list(dataframe.groupby(class_column, sort=True)))
+    cnt = {label: len(df_class) for label, df_class in class_dfs.items()}
 
     if isinstance(how, int) or how == "upsampling":
         samples_per_class = how if isinstance(how, int) else max(cnt.values())
 
         balanced_dfs = {}
-        for label in sorted(dataframe[class_column].unique()):
-            df_class_column = dataframe[dataframe[class_column] == label]
+        for label, df_class_column in class_dfs.items():
             if samples_per_class <= len(df_class_column):
                 balanced_dfs[label] = df_class_column.sample(
                     samples_per_class, replace=True, random_state=random_state
@@ -560,9 +557,9 @@ def balance_classes(
         samples_per_class = min(cnt.values())
 
         balanced_dfs = {}
-        for label in sorted(dataframe[class_column].unique()):
+        for label, df_class_column in class_dfs.items():
             balanced_dfs[label] = (
-                dataframe[dataframe[class_column] == label].sample(
+                df_class_column.sample(
                     samples_per_class,
                     replace=False,
                     random_state=random_state
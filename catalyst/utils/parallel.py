@@ -7,6 +7,7 @@
 
 from typing import List, TypeVar, Union  # isort:skip
 from multiprocessing.pool import Pool
+import threading
 
 from tqdm import tqdm
 
@@ -54,3 +55,23 @@ def tqdm_parallel_imap(
 def get_pool(workers: int) -> Union[Pool, DumbPool]:
     pool = Pool(workers) if workers > 0 and workers is not None else DumbPool()
     return pool
+
+
+def run_in_background(func, *args, **kwargs) -> threading.Thread:
+    """
+    Runs ``func(*args, **kwargs)`` in a background thread,
+    for example, to dump the experiment environment and code
+    while the experiment is running.
+    The thread is not a daemon, so the interpreter waits for it at exit.
+
+    Args:
+        func: function to run
+        *args: ``func`` args
+        **kwargs: ``func`` kwargs
+
+    Returns:
+        threading.Thread: started thread, to ``join`` it
+    """
+    thread = threading.Thread(target=func, args=args, kwargs=kwargs)
+    thread.start()
+    return thread
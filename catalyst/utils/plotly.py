@@ -5,13 +5,15 @@ from pathlib import Path
 import plotly.graph_objs as go
 from plotly.offline import init_notebook_mode, iplot
 
-from catalyst.utils.tools.tensorboard import SummaryItem, SummaryReader
+from catalyst.utils.tools.tensorboard import (
+    IndexedSummaryReader, SummaryItem
+)
 
 
 def _get_tensorboard_scalars(
     logdir: Union[str, Path], metrics: Optional[List[str]], step: str
 ) -> Dict[str, List]:
-    summary_reader = SummaryReader(logdir, types=["scalar"])
+    summary_reader = IndexedSummaryReader(logdir, types=["scalar"])
 
     items = defaultdict(list)
     for item in summary_reader:
@@ -4,8 +4,8 @@ import pathlib
 import shutil
 import sys
 
+from .cache import copy_tree_cached
 from .misc import get_utcnow_time
-from .notebook import save_notebook
 
 
 def import_module(expdir: pathlib.Path):
@@ -26,9 +26,8 @@ def import_module(expdir: pathlib.Path):
 
 
 def _tricky_dir_copy(dir_from, dir_to):
-    os.makedirs(dir_to, exist_ok=True)
-    shutil.rmtree(dir_to)
-    shutil.copytree(dir_from, dir_to)
+    # unchanged files are hardlinked from the host-wide cache
+    copy_tree_cached(dir_from, dir_to)
 
 
 def dump_code(expdir, logdir):
@@ -49,6 +48,9 @@ def dump_code(expdir, logdir):
 def dump_python_files(src, dst):
     py_files = list(src.glob("*.py"))
     ipynb_files = list(src.glob("*.ipynb"))
+    if len(ipynb_files) > 0:
+        # IPython is heavy and needed only for the notebooks
+        from .notebook import save_notebook
     for filepath in ipynb_files:
         save_notebook(filepath)
     py_files += ipynb_files
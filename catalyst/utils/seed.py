@@ -1,33 +1,97 @@
+from typing import Callable, List, Union  # isort:skip
+from hashlib import sha256
+import numbers
 import random
+import sys
 
 import numpy as np
-from packaging.version import parse, Version
+
+# seeding functions of the available backends, detected on the first call
+_SEED_FNS: List[Callable] = None
+_TENSORFLOW_SEED_FN: Callable = None
+
+
+def _get_seed_fns() -> List[Callable]:
+    global _SEED_FNS
+    if _SEED_FNS is None:
+        seed_fns = [random.seed, np.random.seed]
+        try:
+            import torch
+        except ImportError:
+            pass
+        else:
+            seed_fns += [torch.manual_seed, torch.cuda.manual_seed_all]
+        _SEED_FNS = seed_fns
+    return _SEED_FNS
+
+
+def _get_tensorflow_seed_fn() -> Callable:
+    global _TENSORFLOW_SEED_FN
+    if _TENSORFLOW_SEED_FN is None:
+        from packaging.version import parse, Version
+
+        tf = sys.modules["tensorflow"]
+        if parse(tf.__version__) >= Version("2.0.0"):
+            _TENSORFLOW_SEED_FN = tf.random.set_seed
+        elif parse(tf.__version__) <= Version("1.13.2"):
+            _TENSORFLOW_SEED_FN = tf.set_random_seed
+        else:
+            _TENSORFLOW_SEED_FN = tf.compat.v1.set_random_seed
+    return _TENSORFLOW_SEED_FN
 
 
 def set_global_seed(seed: int) -> None:
     """
     Sets random seed into PyTorch, TensorFlow, Numpy and Random.
 
+    The backends are detected once, so the call is cheap enough
+    to reseed on every epoch, loader or trajectory.
+    TensorFlow is seeded only if it is already imported,
+    it is not imported just to be seeded.
+
     Args:
         seed: random seed
     """
-    try:
-        import torch
-    except ImportError:
-        pass
-    else:
-        torch.manual_seed(seed)
-        torch.cuda.manual_seed_all(seed)
-    try:
-        import tensorflow as tf
-    except ImportError:
-        pass
-    else:
-        if parse(tf.__version__) >= Version("2.0.0"):
-            tf.random.set_seed(seed)
-        elif parse(tf.__version__) <= Version("1.13.2"):
-            tf.set_random_seed(seed)
-        else:
-            tf.compat.v1.set_random_seed(seed)
-    random.seed(seed)
-    np.random.seed(seed)
+    for seed_fn in _get_seed_fns():
+        seed_fn(seed)
+    if "tensorflow" in sys.modules:
+        _get_tensorflow_seed_fn()(seed)
+
+
+def _canonize_key(key: Union[int, float, str]) -> str:
+    # numpy scalars and python numbers give the same key,
+    # which does not depend on their ``repr``
+    if isinstance(key, str):
+        return f"s:{key}"
+    elif isinstance(key, numbers.Integral):
+        return f"i:{int(key)}"
+    elif isinstance(key, numbers.Real):
+        return f"f:{float(key).hex()}"
+    raise TypeError(
+        f"Keys should be integers, floats or strings, got {type(key)}"
+    )
+
+
+def derive_seed(seed: int, *keys: Union[int, float, str]) -> int:
+    """
+    Derives a seed for an independent random stream from the root ``seed``,
+    for example, for a loader, a dataloader worker or a trajectory.
+    The same ``seed`` and ``keys`` always give the same result.
+
+    Examples:
+        >>> set_global_seed(derive_seed(initial_seed, "train", worker_id))
+
+    Args:
+        seed (int): root random seed
+        *keys: stream identifiers, like names or indices,
+            numpy and python numbers of the same value give the same seed
+
+    Returns:
+        int: seed in ``[0, 2 ** 32)``, valid for all the backends
+    """
+    keys = [_canonize_key(key) for key in (seed, ) + keys]
+    digest = sha256("\0".join(keys).encode()).digest()
+    return int.from_bytes(digest[:4], "little")
+
+
+__all__ = ["set_global_seed", "derive_seed"]
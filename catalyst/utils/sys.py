@@ -49,34 +49,78 @@ def get_environment_vars() -> Dict[str, Any]:
 
     with open(os.devnull, "w") as devnull:
         try:
-            git_branch = subprocess.check_output(
-                "git rev-parse --abbrev-ref HEAD".split(),
-                shell=True,
+            git_local_commit, git_branch = subprocess.check_output(
+                "git rev-parse HEAD --abbrev-ref HEAD".split(),
                 stderr=devnull
-            ).strip().decode("UTF-8")
-            git_local_commit = subprocess.check_output(
-                "git rev-parse HEAD".split(), shell=True, stderr=devnull
-            )
-            git_origin_commit = subprocess.check_output(
-                f"git rev-parse origin/{git_branch}".split(),
-                shell=True,
-                stderr=devnull
-            )
-
-            git = dict(
-                branch=git_branch,
-                local_commit=git_local_commit,
-                origin_commit=git_origin_commit
-            )
+            ).decode("UTF-8").split()
+            git = dict(branch=git_branch, local_commit=git_local_commit)
+            try:
+                git["origin_commit"] = subprocess.check_output(
+                    f"git rev-parse origin/{git_branch}".split(),
+                    stderr=devnull
+                ).strip()
+            except subprocess.CalledProcessError:
+                pass
             result["git"] = _decode_dict(git)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
             pass
 
     result = _decode_dict(result)
     return result
 
 
-def list_pip_packages() -> str:
+def _get_packages_cache_path(name: str, paths: List[str]) -> Path:
+    """
+    Path to the cached package list,
+    which is valid until the packages directories are modified
+    """
+    key = [sys.executable]
+    for path in paths:
+        try:
+            key.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            pass
+    return utils.get_cache_dir() / "packages" \
+        / f"{name}-{utils.get_short_hash(key)}.txt"
+
+
+def _cached_packages_list(name: str, paths: List[str], list_fn) -> str:
+    cache_path = _get_packages_cache_path(name, paths)
+    if cache_path.exists():
+        return cache_path.read_text()
+
+    result = list_fn()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(result)
+        os.replace(str(tmp_path), str(cache_path))
+    except OSError:
+        # the cache is optional
+        pass
+    return result
+
+
+def list_pip_packages(use_cache: bool = True) -> str:
+    """
+    Lists the installed pip packages with ``pip freeze``
+
+    Args:
+        use_cache (bool): if True, the list is cached
+            until the site-packages directories are modified
+
+    Returns:
+        str: package list
+    """
+    paths = [
+        path for path in sys.path
+        if os.path.basename(path) in ["site-packages", "dist-packages"]
+    ]
+    if use_cache and len(paths) > 0:
+        return _cached_packages_list(
+            "pip", paths, lambda: list_pip_packages(use_cache=False)
+        )
+
     result = ""
     with open(os.devnull, "w") as devnull:
         try:
@@ -91,10 +135,26 @@ def list_pip_packages() -> str:
     return result
 
 
-def list_conda_packages() -> str:
+def list_conda_packages(use_cache: bool = True) -> str:
+    """
+    Lists the installed conda packages with ``conda list --export``
+    if running from conda env
+
+    Args:
+        use_cache (bool): if True, the list is cached
+            until the conda env is modified
+
+    Returns:
+        str: package list
+    """
     result = ""
     conda_meta_path = Path(sys.prefix) / "conda-meta"
-    if conda_meta_path.exists():
+    if conda_meta_path.exists() and use_cache:
+        result = _cached_packages_list(
+            "conda", [str(conda_meta_path)],
+            lambda: list_conda_packages(use_cache=False)
+        )
+    elif conda_meta_path.exists():
         # We are currently in conda virtual env
         with open(os.devnull, "w") as devnull:
             try:
@@ -137,11 +197,13 @@ def dump_environment(
     utils.save_config(experiment_config, config_dir / "_config.json")
     utils.save_config(environment, config_dir / "_environment.json")
 
+    # package lists are the same for most of the runs,
+    # so they are stored once in the cache and hardlinked
     pip_pkg = list_pip_packages()
-    (config_dir / "pip-packages.txt").write_text(pip_pkg)
+    utils.write_text_cached(pip_pkg, config_dir / "pip-packages.txt")
     conda_pkg = list_conda_packages()
     if conda_pkg:
-        (config_dir / "conda-packages.txt").write_text(conda_pkg)
+        utils.write_text_cached(conda_pkg, config_dir / "conda-packages.txt")
 
     for path in configs_path:
         name: str = path.name
@@ -0,0 +1,35 @@
+import os
+
+from catalyst import utils
+
+
+def test_copy_tree_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("CATALYST_CACHE_DIR", str(tmp_path / "cache"))
+    src = tmp_path / "src"
+    (src / "package" / "__pycache__").mkdir(parents=True)
+    (src / "main.py").write_text("print('main')")
+    (src / "package" / "__init__.py").write_text("")
+    (src / "package" / "__pycache__" / "main.cpython.pyc").write_text("")
+
+    utils.copy_tree_cached(src, tmp_path / "run1")
+    utils.copy_tree_cached(src, tmp_path / "run2")
+
+    assert (tmp_path / "run1" / "main.py").read_text() == "print('main')"
+    assert (tmp_path / "run1" / "package" / "__init__.py").exists()
+    assert not (tmp_path / "run1" / "package" / "__pycache__").exists()
+    # the content is stored once
+    assert os.path.samefile(
+        tmp_path / "run1" / "main.py", tmp_path / "run2" / "main.py"
+    )
+
+
+def test_write_text_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("CATALYST_CACHE_DIR", str(tmp_path / "cache"))
+
+    utils.write_text_cached("numpy==1.0", tmp_path / "run1.txt")
+    utils.write_text_cached("numpy==1.0", tmp_path / "run2.txt")
+    utils.write_text_cached("numpy==2.0", tmp_path / "run2.txt")
+
+    assert (tmp_path / "run1.txt").read_text() == "numpy==1.0"
+    assert (tmp_path / "run2.txt").read_text() == "numpy==2.0"
+    assert len(list((tmp_path / "cache").glob("objects/*/*"))) == 2
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from catalyst import utils
+from catalyst.utils import compression
+
+
+def _assert_equal(expected, actual):
+    if isinstance(expected, dict):
+        assert expected.keys() == actual.keys()
+        for key in expected:
+            _assert_equal(expected[key], actual[key])
+    elif isinstance(expected, (tuple, list)):
+        assert len(expected) == len(actual)
+        for expected_, actual_ in zip(expected, actual):
+            _assert_equal(expected_, actual_)
+    elif isinstance(expected, np.ndarray):
+        assert expected.dtype == actual.dtype
+        assert expected.shape == actual.shape
+        assert np.array_equal(expected, actual)
+    else:
+        assert expected == actual
+
+
+def _get_data():
+    observations = np.zeros((64, 16, 16, 3), dtype=np.uint8)
+    observations[:, :8] = np.random.randint(0, 255, (64, 8, 16, 3))
+    data = {
+        "trajectory": (
+            {
+                "image": observations
+            },
+            np.random.randn(64, 2).astype(np.float32),
+            np.random.randn(64),
+            np.zeros(64, dtype=np.bool_),
+        ),
+        "epoch": 7,
+        "scalar": np.zeros((), dtype=np.int64),
+        "empty": np.zeros((0, 3)),
+        "transposed": np.arange(12).reshape(3, 4).T,
+        "structed": np.zeros(
+            3, dtype=[("a", np.float32), ("b", np.int8, (2, ))]
+        ),
+        "name": "checkpoint",
+    }
+    return data
+
+
+@pytest.mark.parametrize("compression_flag", [True, False])
+def test_binary_pack(compression_flag):
+    data = _get_data()
+    packed = utils.binary_pack(data, compression=compression_flag)
+    assert isinstance(packed, bytes)
+    assert compression.is_binary_packed(packed)
+    _assert_equal(data, utils.binary_unpack(packed))
+    _assert_equal(data, utils.unpack(packed))
+
+
+def test_binary_unpack_no_copy():
+    data = {"weights": np.random.randn(32, 32).astype(np.float32)}
+    packed = utils.binary_pack(data, compression=False)
+    weights = utils.binary_unpack(packed)["weights"]
+    assert not weights.flags.owndata
+    assert not weights.flags.writeable
+    _assert_equal(data, {"weights": weights})
+
+
+def test_binary_unpack_version():
+    packed = bytearray(utils.binary_pack({"epoch": 1}))
+    packed[len(compression.BINARY_MAGIC)] = compression.BINARY_VERSION + 1
+    with pytest.raises(ValueError):
+        utils.binary_unpack(bytes(packed))
+
+
+@pytest.mark.skipif(
+    not compression.LZ4_ENABLED, reason="legacy format requires lz4"
+)
+def test_unpack_legacy():
+    data = _get_data()
+    packed = compression.compress(data)
+    _assert_equal(data, utils.unpack(packed))
+    # redis returns bytes instead of strings
+    _assert_equal(data, utils.unpack(packed.encode("ascii")))
+    assert len(utils.pack(data)) < len(packed)
@@ -71,3 +71,40 @@ def test_parse_numbers():
 
     for key, item in configuration.items():
         assert np.isclose(yaml_config[key], item)
+
+
+def test_load_config_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("CATALYST_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "config.yml"
+    path.write_text("stages:\n  b: 1e-3\n  a: {lr: 0.1}\n")
+
+    expected = utils.load_config(path, ordered=True, use_cache=False)
+    for _ in range(2):
+        loaded = utils.load_config(path, ordered=True)
+        assert loaded == expected
+        assert list(loaded["stages"]) == ["b", "a"]
+        assert loaded["stages"]["b"] == 1e-3
+    assert len(list((tmp_path / "cache" / "configs").iterdir())) == 1
+
+    path.write_text("stages:\n  b: 2\n")
+    assert utils.load_config(path)["stages"]["b"] == 2
+    assert len(list((tmp_path / "cache" / "configs").iterdir())) == 2
+
+    # non-string keys do not survive JSON, such configs are not cached
+    path.write_text("stages:\n  1: 2\n")
+    assert utils.load_config(path)["stages"] == {1: 2}
+    assert utils.load_config(path)["stages"] == {1: 2}
+    assert len(list((tmp_path / "cache" / "configs").iterdir())) == 2
+
+
+def test_merge_dicts():
+    first = {"a": {"b": 1, "c": 2}, "d": 3}
+    second = {"a": {"c": 4}, "e": {"f": 5}}
+    third = {"e": {"g": 6}}
+
+    merged = utils.merge_dicts(first, second, third)
+
+    assert merged == {"a": {"b": 1, "c": 4}, "d": 3, "e": {"f": 5, "g": 6}}
+    assert first == {"a": {"b": 1, "c": 2}, "d": 3}
+    assert second == {"a": {"c": 4}, "e": {"f": 5}}
+    assert third == {"e": {"g": 6}}
@@ -0,0 +1,80 @@
+import importlib
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = [
+    "cv2", "imageio", "pandas", "plotly", "sklearn", "skimage", "IPython"
+]
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+print(json.dumps({{
+    "time": time.perf_counter() - start,
+    "modules": sorted(sys.modules.keys()),
+}}))
+"""
+
+
+def _import_in_subprocess(module):
+    output = subprocess.check_output(
+        [sys.executable, "-c", _SCRIPT.format(module=module)],
+        stderr=subprocess.DEVNULL,
+    )
+    return json.loads(output.decode().splitlines()[-1])
+
+
+def test_utils_import():
+    result = _import_in_subprocess("catalyst.utils")
+    catalyst_modules = [
+        name for name in result["modules"] if name.startswith("catalyst")
+    ]
+    assert result["time"] < 1.0
+    assert len(catalyst_modules) < 10, catalyst_modules
+    assert "torch" not in result["modules"]
+    assert "numpy" not in result["modules"]
+
+
+@pytest.mark.parametrize("module", ["catalyst.dl", "catalyst.contrib"])
+def test_heavy_modules_are_not_imported(module):
+    result = _import_in_subprocess(module)
+    imported = [name for name in HEAVY_MODULES if name in result["modules"]]
+    assert imported == []
+
+
+def test_lazy_attributes():
+    from catalyst import utils
+    from catalyst.dl import utils as dl_utils
+
+    assert "imread" in dir(utils)
+    assert "imread" in utils.__all__
+    assert utils.get_one_hot is utils.numpy.get_one_hot
+    assert dl_utils.get_one_hot is utils.get_one_hot
+    assert dl_utils.trace.__name__ == "catalyst.dl.utils.trace"
+
+    with pytest.raises(AttributeError):
+        utils.unknown_attribute
+
+
+@pytest.mark.parametrize(
+    "module,name,submodule",
+    [
+        ("catalyst.utils", "meters", "catalyst.utils.meters"),
+        ("catalyst.dl.utils", "meters", "catalyst.utils.meters"),
+        ("catalyst.dl.utils", "tools", "catalyst.utils.tools"),
+        ("catalyst.dl.utils", "torch", "catalyst.dl.utils.torch"),
+        ("catalyst.rl.utils", "pandas", "catalyst.utils.pandas"),
+        ("catalyst.rl.utils", "visualization", "catalyst.utils.visualization"),
+    ]
+)
+def test_lazy_submodules(module, name, submodule):
+    """Submodules are available as with the star-imports before"""
+    module = importlib.import_module(module)
+    assert getattr(module, name).__name__ == submodule
+    # ``from module import name``
+    module = __import__(module.__name__, fromlist=[name])
+    assert getattr(module, name).__name__ == submodule
@@ -0,0 +1,38 @@
+import numpy as np
+
+from catalyst import utils
+
+
+def test_geometric_cumsum_batch():
+    x = np.random.randn(5, 300, 3, 2)
+    lengths = np.array([300, 1, 17, 64, 129])
+    alphas = np.array([0.0, 0.9, 0.99])
+
+    out = utils.geometric_cumsum_batch(alphas[:, None], x, lengths)
+    assert out.shape == x.shape
+
+    for i, length in enumerate(lengths):
+        for j, alpha in enumerate(alphas):
+            expected = utils.geometric_cumsum(alpha, x[i, :length, j])
+            assert np.allclose(out[i, :length, j], expected)
+        assert np.all(out[i, length:] == 0)
+
+
+def test_geometric_cumsum_batch_broadcast():
+    out = utils.geometric_cumsum_batch([0.1, 0.5], [[1, 2, 3, 4]])
+    expected = np.array(
+        [[[1.234, 3.25], [2.34, 4.5], [3.4, 5.0], [4.0, 4.0]]]
+    )
+    assert out.shape == (1, 4, 2)
+    assert np.allclose(out, expected)
+
+
+def test_geometric_cumsum_batch_empty():
+    out = utils.geometric_cumsum_batch([0.9, 0.99], np.zeros((3, 0, 1)))
+    assert out.shape == (3, 0, 2)
+
+    out = utils.geometric_cumsum_batch(
+        [0.9, 0.99], np.ones((2, 4, 1)), lengths=[0, 0]
+    )
+    assert out.shape == (2, 4, 2)
+    assert np.all(out == 0)
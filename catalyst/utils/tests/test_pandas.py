@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 from catalyst.utils import pandas
@@ -10,3 +11,51 @@ def test_folds_to_list():
 
     with pytest.raises(ValueError):
         pandas.folds_to_list([1, "True", 3.0, None, 2, 1])
+
+
+def test_separate_tags():
+    dataframe = pd.DataFrame(
+        {"path": ["a.jpg", "b.jpg", "c.jpg"], "tag": ["x,y", "y", "x,y,z"]}
+    )
+    result = pandas.separate_tags(dataframe, tag_column="tag", tag_delim=",")
+    assert result["path"].tolist() == ["a.jpg"] * 2 + ["b.jpg"] + ["c.jpg"] * 3
+    assert result["tag"].tolist() == ["x", "y", "y", "x", "y", "z"]
+    assert result.index.tolist() == list(range(6))
+
+
+def test_map_dataframe():
+    dataframe = pd.DataFrame({"tag": ["x", "y", "x"]})
+    result = pandas.map_dataframe(dataframe, "tag", "label", {"x": 0, "y": 1})
+    assert result["label"].tolist() == [0, 1, 0]
+    assert "label" not in dataframe.columns
+
+    with pytest.raises(KeyError):
+        pandas.map_dataframe(dataframe, "tag", "label", {"x": 0})
+
+
+def test_split_dataframe_on_folds():
+    dataframe = pd.DataFrame({"value": range(11)})
+    result = pandas.split_dataframe_on_folds(dataframe, n_folds=3)
+    assert result["fold"].tolist() == [0] * 4 + [1] * 4 + [2] * 3
+    assert sorted(result["value"].tolist()) == list(range(11))
+
+
+def test_read_multiple_csv(tmpdir):
+    paths = []
+    for name, size in [("first", 10), ("second", 3)]:
+        path = str(tmpdir.join(f"{name}.csv"))
+        pd.DataFrame({"value": range(size)}).to_csv(path, index=False)
+        paths.append(path)
+
+    result = pandas.merge_multiple_fold_csv(
+        fold_name="train", paths=",".join(paths)
+    )
+    assert result["value"].tolist() == list(range(10)) + list(range(3))
+    assert (result["fold"] == "train").all()
+
+    _, train, valid, infer = pandas.read_csv_data(
+        in_csv_train=paths[0], in_csv_valid=paths[1]
+    )
+    assert train == [{"value": x} for x in range(10)]
+    assert valid == [{"value": x} for x in range(3)]
+    assert infer is None
@@ -0,0 +1,38 @@
+import json
+
+from catalyst.utils.tools.profiler import Profiler
+
+
+def test_profiler(tmpdir):
+    profiler = Profiler(max_trace_events=3)
+    for _ in range(5):
+        start = profiler.start()
+        profiler.stop("on_batch_end/_timer", start, category="callback")
+    start = profiler.start()
+    profiler.stop("train/loader", start, category="loader")
+
+    summary = {item["name"]: item for item in profiler.get_summary()}
+    assert summary["on_batch_end/_timer"]["calls"] == 5
+    assert summary["on_batch_end/_timer"]["category"] == "callback"
+    assert summary["train/loader"]["calls"] == 1
+    assert "on_batch_end/_timer" in profiler.format_summary()
+
+    profiler.save(str(tmpdir), prefix="train")
+    with open(tmpdir.join("train.trace.json")) as fin:
+        trace = json.load(fin)
+    assert len(trace["traceEvents"]) == 3
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
+    assert tmpdir.join("train.txt").check()
+
+
+def test_profiler_sample_size():
+    profiler = Profiler(sample_size=10)
+    for _ in range(100):
+        start = profiler.start()
+        profiler.stop("batch", start)
+
+    item = profiler.get_summary()[0]
+    assert item["calls"] == 100
+    assert len(profiler._sections["batch"].wall_sample) == 10
+    assert item["wall_p50"] <= item["wall_max"]
+    assert abs(item["wall_mean"] * 100 - item["wall_total"]) < 1e-9
@@ -0,0 +1,51 @@
+import random
+import sys
+
+import numpy as np
+import pytest
+import torch
+
+from catalyst import utils
+
+
+def _sample():
+    return random.random(), np.random.rand(), torch.rand(1).item()
+
+
+def test_set_global_seed():
+    utils.set_global_seed(42)
+    first = _sample()
+    utils.set_global_seed(42)
+    second = _sample()
+    utils.set_global_seed(43)
+    third = _sample()
+
+    assert first == second
+    assert first != third
+
+
+def test_set_global_seed_does_not_import_tensorflow():
+    if "tensorflow" in sys.modules:
+        pytest.skip("tensorflow is already imported")
+    utils.set_global_seed(42)
+    assert "tensorflow" not in sys.modules
+
+
+def test_derive_seed():
+    seed = utils.derive_seed(42, "train", 0)
+
+    assert seed == utils.derive_seed(42, "train", 0)
+    assert seed != utils.derive_seed(42, "train", 1)
+    assert seed != utils.derive_seed(43, "train", 0)
+    assert 0 <= seed < 2 ** 32
+
+
+def test_derive_seed_canonical_keys():
+    seed = utils.derive_seed(42, "train", 0)
+
+    assert seed == utils.derive_seed(np.int64(42), "train", np.int64(0))
+    assert seed == utils.derive_seed(42, np.str_("train"), np.int32(0))
+    assert utils.derive_seed(42, 0.5) == utils.derive_seed(42, np.float32(0.5))
+    assert seed != utils.derive_seed(42, "train", "0")
+    with pytest.raises(TypeError):
+        utils.derive_seed(42, object())
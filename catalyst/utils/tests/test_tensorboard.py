@@ -7,9 +7,11 @@ from unittest.mock import patch
 import cv2
 import numpy as np
 import pytest
+import torch
 
 from catalyst.utils.tools.tensorboard import (
-    EventReadingException, EventsFileReader, SummaryReader
+    AsyncSummaryWriter, EventReadingException, EventsFileReader,
+    IndexedSummaryReader, SummaryReader, SummaryWriter
 )
 
 
@@ -204,3 +206,76 @@ def test_summary_reader_filter_scalars():
 def test_summary_reader_invalid_type():
     with pytest.raises(ValueError):
         SummaryReader(".", types=["unknown-type"])
+
+
+def test_async_summary_writer(tmpdir):
+    """Decimated scalars are averaged, the rest are written on close"""
+    writer = AsyncSummaryWriter(str(tmpdir), log_period=4)
+    for step in range(1, 11):
+        writer.add_scalar("x", float(step), step, decimate=True)
+    writer.add_scalar("y", -1.0, 1)
+    writer.close()
+
+    items = list(SummaryReader(str(tmpdir), types=["scalar"]))
+    x = [(item.step, item.value) for item in items if item.tag == "x"]
+    y = [(item.step, item.value) for item in items if item.tag == "y"]
+    assert x == [(4, 2.5), (8, 6.5), (10, 9.5)]
+    assert y == [(1, -1.0)]
+
+
+def test_async_summary_writer_copies_args(tmpdir):
+    """Arguments changed in-place after the call are written as they were"""
+    writer = AsyncSummaryWriter(str(tmpdir))
+    with patch.object(writer._queue, "put") as put:
+        values = torch.ones(4, requires_grad=True) * 1
+        weights = np.ones(4)
+        writer.add_histogram("x", values, 1)
+        writer.add_histogram("y", values=weights, global_step=1)
+    values.data.zero_()
+    weights[:] = 0
+    (_, args, _), (_, _, kwargs) = [call[0][0] for call in put.call_args_list]
+    assert not args[1].requires_grad
+    assert torch.equal(args[1], torch.ones(4))
+    assert np.array_equal(kwargs["values"], np.ones(4))
+    writer.close()
+
+
+def test_async_summary_writer_forwards_add_only(tmpdir):
+    writer = AsyncSummaryWriter(str(tmpdir))
+    assert callable(writer.add_text)
+    for name in ["get_logdir", "file_writer", "unknown"]:
+        with pytest.raises(AttributeError):
+            getattr(writer, name)
+    writer.close()
+
+
+def test_indexed_summary_reader(tmpdir):
+    """Indexed reader matches the plain one and reads appended records"""
+    writer = SummaryWriter(str(tmpdir))
+    for step in range(10):
+        writer.add_scalar("x", step / 2, step)
+        writer.add_scalar("y", -step, step)
+    writer.add_image("z", np.zeros((3, 2, 2)), 1)
+    writer.flush()
+
+    types = ["scalar", "image"]
+    expected = list(SummaryReader(str(tmpdir), types=types))
+    items = list(IndexedSummaryReader(str(tmpdir), types=types))
+    # the second reader uses the saved index
+    items_reopened = list(IndexedSummaryReader(str(tmpdir), types=types))
+    for items_ in [items, items_reopened]:
+        assert len(items_) == len(expected)
+        for item, item_expected in zip(items_, expected):
+            assert item.tag == item_expected.tag
+            assert item.step == item_expected.step
+            assert item.type == item_expected.type
+            assert np.all(item.value == item_expected.value)
+
+    reader = IndexedSummaryReader(
+        str(tmpdir), tag_filter=["x"], step_range=(2, 3)
+    )
+    assert [(item.step, item.value) for item in reader] == [(2, 1.), (3, 1.5)]
+    writer.add_scalar("x", 0., 3)
+    writer.close()
+    assert [(item.step, item.value) for item in reader] \
+        == [(2, 1.), (3, 1.5), (3, 0.)]
@@ -0,0 +1,103 @@
+import copy
+
+import torch
+from torch import nn
+
+from catalyst import utils
+from catalyst.contrib.nn.optimizers import Lookahead
+from catalyst.utils.tools.ema import ExponentialMovingAverage
+
+
+def _get_model():
+    return nn.Sequential(nn.Linear(4, 8), nn.BatchNorm1d(8), nn.Linear(8, 2))
+
+
+def test_soft_update():
+    target, source = _get_model(), _get_model()
+    expected = [
+        0.9 * target_param.data + 0.1 * source_param.data
+        for target_param, source_param in
+        zip(target.parameters(), source.parameters())
+    ]
+    utils.soft_update(target, source, 0.1)
+    for param, expected_param in zip(target.parameters(), expected):
+        assert torch.allclose(param, expected_param)
+
+    utils.soft_update(target, source, 1.0)
+    for target_param, source_param in \
+            zip(target.parameters(), source.parameters()):
+        assert torch.equal(target_param, source_param)
+
+
+def test_ema():
+    model = _get_model()
+    ema = ExponentialMovingAverage(model, decay=0.9)
+    initial = copy.deepcopy(model)
+
+    with torch.no_grad():
+        for param in model.parameters():
+            param.add_(1.0)
+    model(torch.randn(16, 4))  # updates BatchNorm statistics
+    ema.update(model)
+
+    for average, initial_param, param in zip(
+        ema.shadow_params, initial.parameters(), model.parameters()
+    ):
+        assert torch.allclose(average, 0.9 * initial_param + 0.1 * param)
+    for average, buffer in zip(ema.shadow_buffers, model.buffers()):
+        assert torch.equal(average, buffer)
+
+    current = copy.deepcopy(model)
+    with ema.average_parameters(model):
+        for average, param in zip(ema.shadow_params, model.parameters()):
+            assert torch.equal(average, param)
+    for param, current_param in zip(model.parameters(), current.parameters()):
+        assert torch.equal(param, current_param)
+
+    loaded = ExponentialMovingAverage(_get_model())
+    loaded.load_state_dict(ema.state_dict())
+    assert loaded.decay == 0.9
+    assert loaded.num_updates == 1
+    for loaded_param, param in zip(loaded.shadow_params, ema.shadow_params):
+        assert torch.equal(loaded_param, param)
+
+
+def test_lookahead_update():
+    model = nn.Linear(4, 2)
+    optimizer = Lookahead(
+        torch.optim.SGD(model.parameters(), lr=0.1), k=2, alpha=0.5
+    )
+    initial = [param.detach().clone() for param in model.parameters()]
+    optimizer.update_lookahead()
+
+    with torch.no_grad():
+        for param in model.parameters():
+            param.add_(1.0)
+    optimizer.update_lookahead()
+
+    for param, initial_param, state in zip(
+        model.parameters(), initial, optimizer.state.values()
+    ):
+        assert torch.allclose(param, initial_param + 0.5)
+        assert torch.equal(param, state["slow_param"])
+
+
+def test_zero_grad():
+    model = _get_model()
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+    model(torch.randn(16, 4)).sum().backward()
+
+    utils.zero_grad(optimizer)
+    for param in model.parameters():
+        assert torch.equal(param.grad, torch.zeros_like(param))
+
+    utils.zero_grad(optimizer, set_to_none=True)
+    for param in model.parameters():
+        assert param.grad is None
+
+
+def test_scale_tensors():
+    tensors = [torch.ones(3), torch.ones(2, 2)]
+    utils.scale_tensors_(tensors, 0.5)
+    for tensor in tensors:
+        assert torch.equal(tensor, torch.full_like(tensor, 0.5))
@@ -1,12 +1,14 @@
 # flake8: noqa
 from .dynamic_array import DynamicArray
+from .ema import ExponentialMovingAverage
 from .frozen_class import FrozenClass
 from .metric_manager import MetricManager
+from .profiler import Profiler
 from .registry import Registry, RegistryException
 from .seeder import Seeder
 from .tensorboard import (
-    EventReadingException, EventsFileReader, SummaryItem, SummaryReader,
-    SummaryWriter
+    AsyncSummaryWriter, EventReadingException, EventsFileReader,
+    IndexedSummaryReader, SummaryItem, SummaryReader, SummaryWriter
 )
 from .time_manager import TimeManager
 from .typing import Criterion, Dataset, Device, Model, Optimizer, Scheduler
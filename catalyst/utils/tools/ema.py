@@ -0,0 +1,124 @@
+from typing import Dict  # isort:skip
+from contextlib import contextmanager
+
+from catalyst import utils
+from catalyst.utils.tools.typing import Model
+
+
+class ExponentialMovingAverage:
+    """
+    Keeps the exponential moving average (Polyak averaging)
+    of the model parameters, usually to evaluate the averaged model.
+    All the parameters are updated with grouped multi-tensor ops.
+
+    Examples:
+        >>> ema = ExponentialMovingAverage(model, decay=0.999)
+        >>> for batch in loader:
+        >>>     ...
+        >>>     optimizer.step()
+        >>>     ema.update(model)
+        >>> with ema.average_parameters(model):
+        >>>     evaluate(model)
+    """
+    def __init__(
+        self, model: Model, decay: float = 0.999, use_buffers: bool = True
+    ):
+        """
+        Args:
+            model (Model): model to average
+            decay (float): decay of the average,
+                ``average = decay * average + (1 - decay) * parameter``
+            use_buffers (bool): if True, buffers, like BatchNorm statistics,
+                are copied from the model on every update
+        """
+        assert 0.0 <= decay <= 1.0
+        self.decay = decay
+        self.use_buffers = use_buffers
+        self.num_updates = 0
+
+        self.shadow_params = [
+            param.detach().clone() for param in model.parameters()
+        ]
+        self.shadow_buffers = [
+            buffer.detach().clone() for buffer in model.buffers()
+        ] if use_buffers else []
+        self._backup = None
+
+    def update(self, model: Model) -> None:
+        """Updates the averages with the current ``model`` parameters"""
+        self.num_updates += 1
+        utils.lerp_tensors_(
+            self.shadow_params,
+            [param.data for param in model.parameters()],
+            1.0 - self.decay,
+        )
+        if self.use_buffers:
+            utils.lerp_tensors_(
+                self.shadow_buffers,
+                [buffer.data for buffer in model.buffers()],
+                1.0,
+            )
+
+    def _get_model_tensors(self, model: Model):
+        tensors = [param.data for param in model.parameters()]
+        if self.use_buffers:
+            tensors += [buffer.data for buffer in model.buffers()]
+        return tensors
+
+    def copy_to(self, model: Model) -> None:
+        """Copies the averaged parameters to ``model``"""
+        utils.lerp_tensors_(
+            self._get_model_tensors(model),
+            self.shadow_params + self.shadow_buffers,
+            1.0,
+        )
+
+    def store(self, model: Model) -> None:
+        """Saves the current ``model`` parameters to restore them later"""
+        self._backup = [x.clone() for x in self._get_model_tensors(model)]
+
+    def restore(self, model: Model) -> None:
+        """Restores the ``model`` parameters saved with ``store``"""
+        assert self._backup is not None, "Nothing to restore"
+        utils.lerp_tensors_(self._get_model_tensors(model), self._backup, 1.0)
+        self._backup = None
+
+    @contextmanager
+    def average_parameters(self, model: Model):
+        """
+        Context manager to use the averaged parameters in ``model``,
+        the current ones are restored on exit
+        """
+        self.store(model)
+        self.copy_to(model)
+        try:
+            yield model
+        finally:
+            self.restore(model)
+
+    def to(self, device) -> "ExponentialMovingAverage":
+        """Moves the averages to ``device``"""
+        self.shadow_params = [x.to(device) for x in self.shadow_params]
+        self.shadow_buffers = [x.to(device) for x in self.shadow_buffers]
+        return self
+
+    def state_dict(self) -> Dict:
+        return {
+            "decay": self.decay,
+            "num_updates": self.num_updates,
+            "shadow_params": self.shadow_params,
+            "shadow_buffers": self.shadow_buffers,
+        }
+
+    def load_state_dict(self, state_dict: Dict) -> None:
+        self.decay = state_dict["decay"]
+        self.num_updates = state_dict["num_updates"]
+        utils.lerp_tensors_(
+            self.shadow_params, state_dict["shadow_params"], 1.0
+        )
+        utils.lerp_tensors_(
+            self.shadow_buffers, state_dict["shadow_buffers"], 1.0
+        )
+
+
+__all__ = ["ExponentialMovingAverage"]
@@ -0,0 +1,203 @@
+from typing import Dict, List, Tuple  # isort:skip
+import json
+import os
+import random
+from time import perf_counter, process_time
+
+import numpy as np
+
+
+class _SectionStats:
+    """
+    Running statistics of one section
+    with the fixed-size uniform sample of the wall times for percentiles
+    """
+    __slots__ = [
+        "category", "calls", "wall_total", "wall_max", "cpu_total",
+        "wall_sample"
+    ]
+
+    def __init__(self, category: str):
+        self.category = category
+        self.calls = 0
+        self.wall_total = 0.0
+        self.wall_max = 0.0
+        self.cpu_total = 0.0
+        self.wall_sample = []
+
+    def add(
+        self, wall_time: float, cpu_time: float, sample_size: int,
+        rng: random.Random
+    ) -> None:
+        self.calls += 1
+        self.wall_total += wall_time
+        self.wall_max = max(self.wall_max, wall_time)
+        self.cpu_total += cpu_time
+        # reservoir sampling, every call is kept with the same probability
+        if len(self.wall_sample) < sample_size:
+            self.wall_sample.append(wall_time)
+        else:
+            index = rng.randrange(self.calls)
+            if index < sample_size:
+                self.wall_sample[index] = wall_time
+
+
+class Profiler:
+    """
+    Collects wall and CPU time of the named code sections
+    and exports them as a summary table
+    and a timeline in the Chrome trace format
+    (``chrome://tracing`` or https://ui.perfetto.dev).
+
+    Examples:
+        >>> profiler = Profiler()
+        >>> start = profiler.start()
+        >>> ...
+        >>> profiler.stop("on_batch_end/_timer", start, category="callback")
+        >>> print(profiler.format_summary())
+    """
+    def __init__(
+        self, max_trace_events: int = int(1e6), sample_size: int = 4096
+    ):
+        """
+        Args:
+            max_trace_events (int): max number of events kept
+                for the timeline, the summary uses all of them
+            sample_size (int): max number of wall times kept per section
+                to estimate percentiles, the memory does not grow
+                with the number of calls
+        """
+        self.max_trace_events = max_trace_events
+        self.sample_size = sample_size
+        self._sections: Dict[str, _SectionStats] = {}
+        self._trace_events = []
+        self._origin = perf_counter()
+        # own generator, so profiling does not change the global random state
+        self._rng = random.Random(0)
+
+    @staticmethod
+    def start() -> Tuple[float, float]:
+        """
+        Returns:
+            Tuple[float, float]: current wall and CPU time,
+                to be passed to ``stop``
+        """
+        return perf_counter(), process_time()
+
+    def stop(
+        self, name: str, start: Tuple[float, float], category: str = ""
+    ) -> None:
+        """Records the section ``name``, started at ``start``
+        Args:
+            name (str): name of the section
+            start (Tuple[float, float]): result of ``start`` call
+            category (str): category of the section, like "callback"
+        """
+        wall_start, cpu_start = start
+        wall_time = perf_counter() - wall_start
+        cpu_time = process_time() - cpu_start
+
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _SectionStats(category)
+        section.add(wall_time, cpu_time, self.sample_size, self._rng)
+        if len(self._trace_events) < self.max_trace_events:
+            self._trace_events.append(
+                (name, category, wall_start - self._origin, wall_time)
+            )
+
+    def reset(self) -> None:
+        """Removes all the records"""
+        self._sections.clear()
+        self._trace_events = []
+        self._origin = perf_counter()
+
+    def get_summary(self) -> List[Dict]:
+        """
+        Returns:
+            List[Dict]: statistics of every section in seconds,
+                sorted by the total wall time,
+                percentiles are estimated on ``sample_size`` calls
+        """
+        summary = []
+        for name, section in self._sections.items():
+            p50, p90, p99 = np.percentile(section.wall_sample, [50, 90, 99])
+            summary.append(
+                {
+                    "name": name,
+                    "category": section.category,
+                    "calls": section.calls,
+                    "wall_total": section.wall_total,
+                    "wall_mean": section.wall_total / section.calls,
+                    "wall_p50": p50,
+                    "wall_p90": p90,
+                    "wall_p99": p99,
+                    "wall_max": section.wall_max,
+                    "cpu_total": section.cpu_total,
+                }
+            )
+        summary = sorted(summary, key=lambda x: -x["wall_total"])
+        return summary
+
+    def format_summary(self) -> str:
+        """
+        Returns:
+            str: summary table, times are in milliseconds
+        """
+        columns = [
+            "calls", "wall_total", "wall_mean", "wall_p50", "wall_p90",
+            "wall_p99", "wall_max", "cpu_total"
+        ]
+        summary = self.get_summary()
+        name_width = max([len(x["name"]) for x in summary] + [len("name")])
+
+        lines = [
+            " | ".join(
+                [f"{'name':<{name_width}}"]
+                + [f"{column:>10}" for column in columns]
+            )
+        ]
+        for item in summary:
+            values = [f"{item['calls']:>10d}"] + [
+                f"{item[column] * 1e3:>10.3f}" for column in columns[1:]
+            ]
+            name = f"{item['name']:<{name_width}}"
+            lines.append(" | ".join([name] + values))
+        return "\n".join(lines)
+
+    def get_trace(self) -> Dict:
+        """
+        Returns:
+            Dict: timeline in the Chrome trace format
+        """
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": duration * 1e6,
+                "pid": pid,
+                "tid": 0,
+            } for name, category, start, duration in self._trace_events
+        ]
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def save(self, logdir: str, prefix: str = "profile") -> None:
+        """
+        Saves ``{prefix}.txt`` summary table
+        and ``{prefix}.trace.json`` timeline to ``logdir``
+
+        Args:
+            logdir (str): directory to save to
+            prefix (str): files prefix
+        """
+        os.makedirs(logdir, exist_ok=True)
+        with open(os.path.join(logdir, f"{prefix}.txt"), "w") as fout:
+            fout.write(self.format_summary())
+        with open(os.path.join(logdir, f"{prefix}.trace.json"), "w") as fout:
+            json.dump(self.get_trace(), fout)
+
+
+__all__ = ["Profiler"]
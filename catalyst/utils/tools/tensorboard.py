@@ -1,17 +1,22 @@
 # isort:skip_file
 from typing import BinaryIO, Optional, Union  # isort:skip
+import atexit
 from collections import namedtuple
 from collections.abc import Iterable
 import os
 from pathlib import Path
+from queue import Queue
 import struct
+import threading
+import time
+import traceback
 
 if os.environ.get("CRC32C_SW_MODE", None) is None:
     os.environ["CRC32C_SW_MODE"] = "auto"
 from crc32c import crc32 as crc32c  # noqa: E402
 
-import cv2  # noqa: E402
 import numpy as np  # noqa: E402
+import torch  # noqa: E402
 
 # Native tensorboard support from 1.2.0 version of PyTorch
 from torch import __version__ as torch_version  # noqa: E402
@@ -156,6 +161,8 @@ def _get_image(value) -> Optional[np.ndarray]:
         Decoded image
     """
     if value.HasField("image"):
+        import cv2
+
         encoded_image = value.image.encoded_image_string
         buf = np.frombuffer(encoded_image, np.uint8)
         data = cv2.imdecode(buf, cv2.IMREAD_COLOR)
@@ -263,3 +270,438 @@ class SummaryReader(Iterable):
                     if item is not None and self._check_tag(item.tag)
                     and item.type in self._types
                 )
+
+
+_RECORD_HEADER = struct.Struct("<QI")
+_RECORD_CRC = struct.Struct("<I")
+_INDEX_VERSION = 1
+_INDEX_TYPES = ("scalar", "image")
+
+
+def _iterate_records(data: memoryview, check_crc: bool = True):
+    """
+    Iterates over complete records in a chunk of an events file.
+    An incomplete record at the end is left for the next read,
+    as the file could be still written.
+
+    Args:
+        data: A chunk of an events file, starting at a record
+        check_crc: If ``True``, verifies the records checksums
+
+    Returns:
+        A generator with ``(record offset, event data)`` tuples
+    """
+    offset = 0
+    while offset + _RECORD_HEADER.size <= len(data):
+        event_size, header_crc = _RECORD_HEADER.unpack_from(data, offset)
+        start = offset + _RECORD_HEADER.size
+        end = start + event_size
+        if end + _RECORD_CRC.size > len(data):
+            break
+        event_raw = data[start:end]
+        if check_crc:
+            event_crc = _RECORD_CRC.unpack_from(data, end)[0]
+            if header_crc != _masked_crc32c(data[offset:offset + 8]) \
+                    or event_crc != _masked_crc32c(event_raw):
+                raise EventReadingException(
+                    f"Invalid checksum of the record at {offset}"
+                )
+        yield offset, event_raw
+        offset = end + _RECORD_CRC.size
+
+
+class _EventsFileIndex:
+    """
+    Index of an events file: tag, step, wall time
+    and the record offset of every summary value.
+    Scalar values are kept in the index itself.
+    """
+    _COLUMNS = {
+        "tag_id": np.int32,
+        "type_id": np.int8,
+        "step": np.int64,
+        "wall_time": np.float64,
+        "value": np.float64,
+        "record_offset": np.int64,
+        "position": np.int32,
+    }
+
+    def __init__(self, path: Path, index_path: Optional[Path]):
+        self.path = path
+        self.index_path = index_path
+        self.reset()
+        self.load()
+
+    def reset(self):
+        self.offset = 0
+        self.tags = []
+        self._tag_ids = {}
+        self.columns = {
+            key: np.empty(0, dtype=dtype)
+            for key, dtype in self._COLUMNS.items()
+        }
+
+    def load(self):
+        if self.index_path is None or not self.index_path.is_file():
+            return
+        try:
+            with np.load(self.index_path, allow_pickle=False) as index:
+                if int(index["version"]) != _INDEX_VERSION:
+                    return
+                self.offset = int(index["offset"])
+                self.tags = index["tags"].tolist()
+                self.columns = {key: index[key] for key in self._COLUMNS}
+        except (OSError, ValueError, KeyError):
+            self.reset()
+        self._tag_ids = {tag: i for i, tag in enumerate(self.tags)}
+
+    def save(self):
+        if self.index_path is None:
+            return
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+        try:
+            self.index_path.parent.mkdir(exist_ok=True)
+            with open(tmp_path, "wb") as fout:
+                np.savez(
+                    fout,
+                    version=_INDEX_VERSION,
+                    offset=self.offset,
+                    tags=np.array(self.tags, dtype=np.str_),
+                    **self.columns
+                )
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # read-only logdir, the index is kept in the memory only
+            pass
+
+    def update(self, check_crc: bool = True) -> bool:
+        """
+        Indexes records appended since the last update
+
+        Returns:
+            bool: ``True`` if there were new records
+        """
+        size = self.path.stat().st_size
+        if size < self.offset:
+            # the file was rewritten
+            self.reset()
+        if size == self.offset:
+            return False
+
+        with open(self.path, "rb") as fin:
+            fin.seek(self.offset)
+            data = memoryview(fin.read())
+
+        rows = []
+        end = 0
+        for record_offset, event_raw in _iterate_records(data, check_crc):
+            end = record_offset + _RECORD_HEADER.size \
+                + len(event_raw) + _RECORD_CRC.size
+            event = Event()
+            event.ParseFromString(event_raw)
+            if not event.HasField("summary"):
+                continue
+            for position, value in enumerate(event.summary.value):
+                if value.HasField("simple_value"):
+                    type_id, data_ = 0, value.simple_value
+                elif value.HasField("image"):
+                    type_id, data_ = 1, np.nan
+                else:
+                    continue
+                tag_id = self._tag_ids.get(value.tag)
+                if tag_id is None:
+                    tag_id = self._tag_ids[value.tag] = len(self.tags)
+                    self.tags.append(value.tag)
+                rows.append(
+                    (
+                        tag_id, type_id, event.step, event.wall_time, data_,
+                        self.offset + record_offset, position
+                    )
+                )
+
+        self.offset += end
+        if len(rows) > 0:
+            for key, column in zip(self._COLUMNS, zip(*rows)):
+                column = np.array(column, dtype=self._COLUMNS[key])
+                self.columns[key] = np.concatenate(
+                    [self.columns[key], column]
+                )
+        return end > 0
+
+    def read_value(self, record_offset: int, position: int):
+        with open(self.path, "rb") as fin:
+            fin.seek(record_offset)
+            event_size, _ = _RECORD_HEADER.unpack(
+                fin.read(_RECORD_HEADER.size)
+            )
+            event = Event()
+            event.ParseFromString(fin.read(event_size))
+        return event.summary.value[position]
+
+
+class IndexedSummaryReader(SummaryReader):
+    """
+    Summary reader, which keeps an index of every events file
+    in the ``.index`` directory of the logdir.
+    On re-open and on every next iteration only the records
+    appended since the last read are parsed,
+    tag, type and step filtering is done with the index.
+    """
+    def __init__(
+        self,
+        logdir: Union[str, Path],
+        tag_filter: Optional[Iterable] = None,
+        types: Iterable = ("scalar", ),
+        step_range: Optional[tuple] = None,
+        check_crc: bool = True,
+        persist_index: bool = True,
+    ):
+        """
+        Args:
+            logdir: A directory with Tensorboard summary data
+            tag_filter: A list of tags to leave (`None` for all)
+            types: A list of types to get.
+            Only "scalar" and "image" types are allowed at the moment.
+            step_range: ``(min_step, max_step)`` inclusive range
+                of steps to get, `None` for all
+            check_crc: If ``True``, verifies the checksums of new records
+            persist_index: If ``True``, saves the index next to the logs,
+                so it is reused by other readers
+        """
+        super().__init__(logdir=logdir, tag_filter=tag_filter, types=types)
+        self._step_range = step_range
+        self._check_crc = check_crc
+        self._persist_index = persist_index
+        self._indices = {}
+
+    def _get_index_path(self, file_path: Path) -> Optional[Path]:
+        if not self._persist_index:
+            return None
+        # without "tfevents" in the name, so tensorboard skips it
+        name = file_path.name.replace("tfevents", "tfindex")
+        return file_path.parent / ".index" / f"{name}.npz"
+
+    def update(self):
+        """Indexes new records of all the events files in the logdir"""
+        log_files = sorted(f for f in self._logdir.glob("*") if f.is_file())
+        for file_path in log_files:
+            index = self._indices.get(file_path)
+            if index is None:
+                index = self._indices[file_path] = _EventsFileIndex(
+                    file_path, self._get_index_path(file_path)
+                )
+            if index.update(check_crc=self._check_crc):
+                index.save()
+
+    def _get_mask(self, index: _EventsFileIndex) -> np.ndarray:
+        columns = index.columns
+        type_ids = [_INDEX_TYPES.index(type_) for type_ in self._types]
+        mask = np.isin(columns["type_id"], type_ids)
+        if self._tag_filter is not None:
+            tag_ids = [
+                tag_id for tag_id, tag in enumerate(index.tags)
+                if tag in self._tag_filter
+            ]
+            mask &= np.isin(columns["tag_id"], tag_ids)
+        if self._step_range is not None:
+            min_step, max_step = self._step_range
+            if min_step is not None:
+                mask &= columns["step"] >= min_step
+            if max_step is not None:
+                mask &= columns["step"] <= max_step
+        return mask
+
+    def __iter__(self) -> SummaryItem:
+        """
+        Iterate over events in all the files in the current logdir
+
+        Returns:
+            A generator with `SummaryItem` objects
+        """
+        self.update()
+        for file_path in sorted(self._indices):
+            index = self._indices[file_path]
+            mask = self._get_mask(index)
+            columns = {
+                key: column[mask].tolist()
+                for key, column in index.columns.items()
+            }
+            for tag_id, type_id, step, wall_time, value, offset, position \
+                    in zip(*(columns[key] for key in index._COLUMNS)):
+                type_ = _INDEX_TYPES[type_id]
+                if type_ != "scalar":
+                    value = self._DECODERS[type_](
+                        index.read_value(offset, position)
+                    )
+                yield SummaryItem(
+                    tag=index.tags[tag_id],
+                    step=step,
+                    wall_time=wall_time,
+                    value=value,
+                    type=type_
+                )
+
+
+def _summary_writer_loop(writer: SummaryWriter, queue: Queue):
+    while True:
+        item = queue.get()
+        try:
+            if item is None:
+                writer.close()
+                break
+            name, args, kwargs = item
+            getattr(writer, name)(*args, **kwargs)
+        except Exception as ex:
+            print("=" * 80)
+            print(f"Exception: {ex}\nTrace: {traceback.format_exc()}")
+            print("=" * 80)
+        finally:
+            queue.task_done()
+
+
+def _copy_arg(value):
+    """
+    Copies tensors and arrays, so the caller could change them in-place
+    while the call is pending
+    """
+    if isinstance(value, torch.Tensor):
+        return value.detach().to("cpu", copy=True)
+    elif isinstance(value, np.ndarray):
+        return value.copy()
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_copy_arg(x) for x in value)
+    elif isinstance(value, dict):
+        return {key: _copy_arg(x) for key, x in value.items()}
+    return value
+
+
+class AsyncSummaryWriter:
+    """
+    Non-blocking wrapper over the ``SummaryWriter``.
+    All the calls are put into a bounded queue
+    and are executed by a background thread,
+    so the summaries are built and written out of the hot loop.
+    Only ``add_*`` methods of the ``SummaryWriter`` are available,
+    their tensor and array arguments are copied on the call.
+    Pending summaries are written on ``close``,
+    which is also called at the interpreter exit.
+
+    Scalars logged with ``decimate=True`` are aggregated in memory,
+    and only their mean is written every ``log_period`` steps
+    or every ``log_interval`` seconds, whatever comes first.
+    """
+    def __init__(
+        self,
+        log_dir: str = None,
+        log_period: int = 1,
+        log_interval: float = None,
+        max_queue_size: int = 1000,
+        **kwargs
+    ):
+        """
+        Args:
+            log_dir (str): directory for the events files
+            log_period (int): number of steps to aggregate
+                decimated scalars over
+            log_interval (float): max time in seconds
+                to aggregate decimated scalars over
+            max_queue_size (int): max number of pending calls,
+                the caller blocks if the writer lags behind
+            **kwargs: ``SummaryWriter`` params
+        """
+        self.log_period = log_period
+        self.log_interval = log_interval
+        # tag -> [sum, count, first update time, last step]
+        self._aggregates = {}
+
+        self._queue = Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(
+            target=_summary_writer_loop,
+            kwargs={
+                "writer": SummaryWriter(log_dir, **kwargs),
+                "queue": self._queue,
+            },
+            daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _put(self, name, *args, **kwargs):
+        if self._thread is None:
+            raise RuntimeError("The writer is already closed")
+        self._queue.put((name, _copy_arg(args), _copy_arg(kwargs)))
+
+    def __getattr__(self, name):
+        # the other methods return values or change the writer state,
+        # so they can not be called asynchronously
+        if not name.startswith("add_") or not hasattr(SummaryWriter, name):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        return lambda *args, **kwargs: self._put(name, *args, **kwargs)
+
+    def add_scalar(
+        self,
+        tag: str,
+        scalar_value,
+        global_step: int = None,
+        walltime: float = None,
+        decimate: bool = False
+    ):
+        """
+        Args:
+            tag (str): data identifier
+            scalar_value: value to save
+            global_step (int): global step value to record
+            walltime (float): event time, the call time by default
+            decimate (bool): if ``True``, the value is aggregated
+                with the next ones, see the class description
+        """
+        scalar_value = float(scalar_value)
+        walltime = walltime or time.time()
+        if not decimate:
+            self._put("add_scalar", tag, scalar_value, global_step, walltime)
+            return
+
+        aggregate = self._aggregates.get(tag)
+        if aggregate is None:
+            aggregate = self._aggregates[tag] = [0.0, 0, walltime, None]
+        aggregate[0] += scalar_value
+        aggregate[1] += 1
+        aggregate[3] = global_step
+        if aggregate[1] >= self.log_period \
+                or (self.log_interval is not None
+                    and walltime - aggregate[2] >= self.log_interval):
+            del self._aggregates[tag]
+            self._put(
+                "add_scalar",
+                tag, aggregate[0] / aggregate[1], global_step, walltime
+            )
+
+    def flush(self):
+        """
+        Schedules writing of the aggregated scalars
+        and flushing of the events file, does not block
+        """
+        # the rest of the aggregates are written as is,
+        # as they could be the last ones
+        for tag, (value, count, _, step) in self._aggregates.items():
+            self._put("add_scalar", tag, value / count, step)
+        self._aggregates = {}
+        self._put("flush")
+
+    def close(self):
+        """Writes all the pending calls and stops the background thread"""
+        if self._thread is None:
+            return
+        self.flush()
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
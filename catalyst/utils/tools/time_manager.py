@@ -1,7 +1,10 @@
-from time import time
+from time import perf_counter
 
 
 class TimeManager:
+    """
+    Measures the elapsed time with the monotonic high-resolution clock
+    """
     def __init__(self):
         self._starts = {}
         self.elapsed = {}
@@ -11,7 +14,7 @@ class TimeManager:
         Args:
             name (str): name of a timer
         """
-        self._starts[name] = time()
+        self._starts[name] = perf_counter()
 
     def stop(self, name: str) -> None:
         """Stops timer ``name``
@@ -20,7 +23,7 @@ class TimeManager:
         """
         assert name in self._starts, f"Timer '{name}' wasn't started"
 
-        self.elapsed[name] = time() - self._starts[name]
+        self.elapsed[name] = perf_counter() - self._starts[name]
         del self._starts[name]
 
     def reset(self) -> None:
@@ -47,12 +47,76 @@ def normal_logprob(mu, sigma, z):
     return logprob
 
 
-def soft_update(target, source, tau):
-    """Updates the target data with smoothing by ``tau``"""
-    for target_param, param in zip(target.parameters(), source.parameters()):
-        target_param.data.copy_(
-            target_param.data * (1.0 - tau) + param.data * tau
-        )
+@torch.no_grad()
+def lerp_tensors_(
+    targets: List[torch.Tensor], sources: List[torch.Tensor], weight: float
+) -> None:
+    """
+    Updates ``targets`` inplace with ``target + (source - target) * weight``.
+    Uses multi-tensor (``torch._foreach_*``) ops if they are available,
+    so all the tensors are updated in a few calls
+    instead of several ops per tensor.
+
+    Args:
+        targets (List[torch.Tensor]): tensors to update
+        sources (List[torch.Tensor]): tensors to move ``targets`` to
+        weight (float): interpolation weight,
+            ``1.0`` copies ``sources`` to ``targets``
+    """
+    targets, sources = list(targets), list(sources)
+    if len(targets) == 0:
+        return
+
+    if weight == 1.0:
+        if hasattr(torch, "_foreach_copy_"):
+            torch._foreach_copy_(targets, sources)
+        else:
+            for target, source in zip(targets, sources):
+                target.copy_(source)
+    elif hasattr(torch, "_foreach_lerp_"):
+        torch._foreach_lerp_(targets, sources, weight)
+    else:
+        for target, source in zip(targets, sources):
+            target.copy_(target * (1.0 - weight) + source * weight)
+
+
+@torch.no_grad()
+def scale_tensors_(tensors: List[torch.Tensor], value: float) -> None:
+    """
+    Multiplies ``tensors`` inplace by ``value``
+    with multi-tensor (``torch._foreach_*``) ops if they are available.
+
+    Args:
+        tensors (List[torch.Tensor]): tensors to update
+        value (float): multiplier
+    """
+    tensors = list(tensors)
+    if len(tensors) == 0:
+        return
+
+    if hasattr(torch, "_foreach_mul_"):
+        torch._foreach_mul_(tensors, value)
+    else:
+        for tensor in tensors:
+            tensor.mul_(value)
+
+
+def soft_update(target: Model, source: Model, tau: float) -> None:
+    """
+    Updates the target parameters with smoothing by ``tau``,
+    ``target = (1 - tau) * target + tau * source``.
+    All the parameters are updated with grouped multi-tensor ops.
+
+    Args:
+        target (Model): model to update, like a target network
+        source (Model): model to update with, like a trained network
+        tau (float): smoothing factor, ``1.0`` copies the parameters
+    """
+    lerp_tensors_(
+        [param.data for param in target.parameters()],
+        [param.data for param in source.parameters()],
+        tau,
+    )
 
 
 def get_optimizable_params(model_or_params):
@@ -101,6 +165,39 @@ def set_optimizer_momentum(optimizer: Optimizer, value: float, index: int = 0):
         optimizer.param_groups[index]["momentum"] = value
 
 
+def zero_grad(optimizer: Optimizer, set_to_none: bool = False) -> None:
+    """
+    Clears the gradients of all the ``optimizer`` parameters.
+
+    Args:
+        optimizer: PyTorch optimizer
+        set_to_none (bool): if True, sets the gradients to None
+            instead of filling them with zeros, so no memset is made
+            and the next backward pass allocates them again
+    """
+    grads = []
+    for group in optimizer.param_groups:
+        for param in group["params"]:
+            if param.grad is None:
+                continue
+            if set_to_none:
+                param.grad = None
+                continue
+            if param.grad.grad_fn is not None:
+                param.grad.detach_()
+            else:
+                param.grad.requires_grad_(False)
+            grads.append(param.grad)
+
+    if len(grads) == 0:
+        return
+    if hasattr(torch, "_foreach_zero_"):
+        torch._foreach_zero_(grads)
+    else:
+        for grad in grads:
+            grad.zero_()
+
+
 def get_device() -> torch.device:
     """
     Simple returning the best available device (GPU or CPU)
@@ -181,7 +278,9 @@ def any2device(value, device: Device):
             for k in value.dtype.fields.keys()
         )
     elif isinstance(value, np.ndarray):
-        return torch.Tensor(value).to(device)
+        # copies the data, so read-only arrays are supported as well
+        tensor = torch.tensor(value, dtype=torch.get_default_dtype())
+        return tensor.to(device)
     return value
 
 
@@ -313,8 +412,10 @@ def detach(tensor: torch.Tensor) -> np.ndarray:
 
 __all__ = [
     "ce_with_logits", "log1p_exp", "normal_sample", "normal_logprob",
-    "soft_update", "get_optimizable_params", "get_optimizer_momentum",
-    "set_optimizer_momentum", "get_device", "get_available_gpus",
-    "get_activation_fn", "any2device", "prepare_cudnn", "process_model_params",
-    "set_requires_grad", "get_network_output", "detach"
+    "lerp_tensors_", "scale_tensors_", "soft_update",
+    "get_optimizable_params", "get_optimizer_momentum",
+    "set_optimizer_momentum", "zero_grad", "get_device",
+    "get_available_gpus", "get_activation_fn", "any2device", "prepare_cudnn",
+    "process_model_params", "set_requires_grad", "get_network_output",
+    "detach"
 ]
@@ -0,0 +1,69 @@
+# flake8: noqa
+# Compares the legacy (serialize + lz4 + base64) wire format
+# with the binary one on a synthetic trajectory and checkpoint
+import time
+
+import numpy as np
+
+from catalyst.utils import compression
+
+
+def _benchmark(name, data, num_repeats=10):
+    legacy_packed = compression.compress(data)
+    packed = compression.pack(data)
+
+    results = {}
+    for fmt, pack_fn, unpack_fn, packed_ in (
+        ("legacy", compression.compress, compression.decompress,
+         legacy_packed),
+        ("binary", compression.pack, compression.unpack, packed),
+    ):
+        start_time = time.perf_counter()
+        for _ in range(num_repeats):
+            pack_fn(data)
+        pack_time = (time.perf_counter() - start_time) / num_repeats
+
+        start_time = time.perf_counter()
+        for _ in range(num_repeats):
+            unpack_fn(packed_)
+        unpack_time = (time.perf_counter() - start_time) / num_repeats
+
+        results[fmt] = (len(packed_), pack_time, unpack_time)
+        print(
+            f"{name:>12s} | {fmt:>6s} | "
+            f"size: {len(packed_) / 2**20:8.3f} MB | "
+            f"pack: {pack_time * 1e3:8.3f} ms | "
+            f"unpack: {unpack_time * 1e3:8.3f} ms"
+        )
+
+    return results
+
+
+trajectory_len = 1000
+observations = np.zeros((trajectory_len, 84, 84, 4), dtype=np.uint8)
+observations[:, 20:60] = np.random.randint(
+    0, 255, (trajectory_len, 40, 84, 4), dtype=np.uint8
+)
+trajectory = {
+    "trajectory": (
+        {"observation": observations},
+        {"action": np.random.randint(0, 6, trajectory_len)},
+        np.random.randn(trajectory_len).astype(np.float32),
+        np.zeros(trajectory_len, dtype=np.bool_),
+    ),
+    "epoch": 0,
+}
+checkpoint = {
+    "checkpoint": {
+        "actor_state_dict": {
+            f"layer_{i}.weight": np.random.randn(256, 256).astype(np.float32)
+            for i in range(16)
+        }
+    },
+    "epoch": 0,
+}
+
+for name, data in (("trajectory", trajectory), ("checkpoint", checkpoint)):
+    results = _benchmark(name, data)
+    if compression.LZ4_ENABLED:
+        assert results["binary"][0] < results["legacy"][0]